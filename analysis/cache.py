@@ -0,0 +1,78 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CurveCache:
+    """
+    Caché de curvas calculadas (diccionarios de arreglos de NumPy).
+
+    Las entradas se guardan en memoria con política LRU y, si se indica un
+    directorio, también en disco como archivos .npz para reutilizarlas entre
+    sesiones.
+    """
+
+    def __init__(self, max_entries: int = 1024, directory: str = None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries or (
+            self.directory is not None and os.path.exists(self.get_path(key))
+        )
+
+    def get_path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.npz")
+
+    def get(self, key):
+        """Devuelve la entrada guardada para 'key' o None si no existe."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if self.directory is not None and os.path.exists(self.get_path(key)):
+            with np.load(self.get_path(key)) as data:
+                arrays = {name: data[name] for name in data.files}
+            self.store(key, arrays)
+            self.hits += 1
+            return arrays
+
+        self.misses += 1
+        return None
+
+    def put(self, key, arrays: dict):
+        self.store(key, arrays)
+        if self.directory is not None:
+            np.savez(self.get_path(key), **arrays)
+
+    def store(self, key, arrays: dict):
+        self.entries[key] = arrays
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """Devuelve la entrada de 'key', calculándola con compute() si falta."""
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = compute()
+            self.put(key, arrays)
+        return arrays
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
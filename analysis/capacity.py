@@ -0,0 +1,79 @@
+import numpy as np
+
+from utils.units import get_unit_system
+
+
+def get_design_polygon(points, phi_pn_max):
+    """
+    Construye la curva de diseño cerrada (phi*Mn, phi*Pn con el límite
+    phi*Pn,max), incluyendo el lado simétrico de momento negativo.
+
+    Args:
+        points (array): Puntos (Mn, Pn, phi) con forma (..., n_puntos, 3),
+            ordenados como RectangularColumn.points
+        phi_pn_max (array): Límite phi*Pn,max con forma (...)
+
+    Returns:
+        array con forma (..., 2 * n_puntos, 2) con los vértices (M, P).
+    """
+    points = np.asarray(points, dtype=float)
+    phi_pn_max = np.asarray(phi_pn_max, dtype=float)
+
+    mu = points[..., 0] * points[..., 2]
+    pu = np.minimum(points[..., 1] * points[..., 2], phi_pn_max[..., None])
+
+    right = np.stack([mu, pu], axis=-1)
+    left = np.stack([-mu, pu], axis=-1)[..., ::-1, :]
+    return np.concatenate([right, left], axis=-2)
+
+
+def calculate_dcr(points, phi_pn_max, pu, mu):
+    """
+    Relación demanda/capacidad radial de cada carga: |(Mu, Pu)| dividido
+    entre la distancia del origen a la curva de diseño en la misma dirección.
+
+    Todos los valores deben estar en las mismas unidades que 'points'.
+
+    Args:
+        points (array): Puntos (Mn, Pn, phi) con forma (..., n_puntos, 3)
+        phi_pn_max (array): Límite phi*Pn,max con forma (...)
+        pu, mu (array): Cargas factorizadas con forma (..., n_cargas)
+
+    Returns:
+        array con forma (..., n_cargas). DCR <= 1.0 indica que la carga está
+        dentro de la curva de diseño.
+    """
+    polygon = get_design_polygon(points, phi_pn_max)
+    start = polygon[..., None, :, :]
+    edge = np.roll(polygon, -1, axis=-2)[..., None, :, :] - start
+
+    # Dirección de cada carga (..., n_cargas, 1, 2)
+    direction = np.stack(
+        [np.asarray(mu, dtype=float), np.asarray(pu, dtype=float)], axis=-1
+    )[..., None, :]
+
+    def cross(u, v):
+        return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+    # Intersección del rayo t*d con cada segmento start + s*edge
+    denom = cross(direction, edge)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = cross(start, edge) / denom
+        s = cross(start, direction) / denom
+    valid = (denom != 0) & (s >= 0) & (s <= 1) & (t > 0)
+
+    # Se toma la intersección más cercana (conservador si la curva no es convexa)
+    t = np.where(valid, t, np.inf).min(axis=-1)
+    loaded = np.any(direction[..., 0, :] != 0, axis=-1)
+    return np.where(loaded, 1.0 / t, 0.0)
+
+
+def calculate_load_points_dcr(points, phi_pn_max, load_points, units=None):
+    """
+    DCR de una lista de PuntoDeCarga (en el sistema de unidades 'units', por
+    defecto Ton y Ton-m) contra la curva de una sección (en kg y kg-cm).
+    """
+    units = get_unit_system(units)
+    pu = units.to_internal([point.Pu for point in load_points], "force")
+    mu = units.to_internal([point.Mu for point in load_points], "moment")
+    return calculate_dcr(points, phi_pn_max, pu, mu)
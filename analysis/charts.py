@@ -0,0 +1,190 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from .cache import CurveCache
+from .interaction import N_STEPS, SectionBatch, calculate_interaction
+
+# Cuantías por defecto de una familia de curvas (ACI 318-19, 10.6.1.1)
+DEFAULT_RHOS = (0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08)
+
+# Distribuciones de acero soportadas por los diagramas normalizados
+CHART_LAYOUTS = ("perimeter", "two-faces")
+
+# Caché compartida por todos los diagramas de la sesión
+CHART_CACHE = CurveCache()
+
+
+def get_chart_layers(gamma: float, layout: str = "perimeter", bars_per_face=5):
+    """
+    Posición de las capas (como fracción de h, desde la fibra inferior) y
+    fracción del área total de acero en cada capa.
+
+    Args:
+        gamma (float): Distancia entre las capas extremas dividida entre h
+        layout (str): "perimeter" (barras en las cuatro caras) o
+            "two-faces" (barras solo en las caras perpendiculares a la flexión)
+        bars_per_face (int): Barras por cara, incluidas las esquinas
+    """
+    if layout not in CHART_LAYOUTS:
+        raise ValueError(f"Distribución desconocida: {layout}")
+
+    if layout == "two-faces":
+        pos_y = np.array([(1 - gamma) / 2, (1 + gamma) / 2])
+        fraction = np.array([0.5, 0.5])
+        return pos_y, fraction
+
+    pos_y = np.linspace((1 - gamma) / 2, (1 + gamma) / 2, bars_per_face)
+    bars = np.full(bars_per_face, 2.0)
+    bars[0] = bars[-1] = bars_per_face
+    return pos_y, bars / bars.sum()
+
+
+def get_chart_key(gamma, fy, fc, layout, bars_per_face, rhos, n_steps):
+    return (
+        round(float(gamma), 6),
+        float(fy),
+        float(fc),
+        layout,
+        int(bars_per_face),
+        tuple(round(float(rho), 6) for rho in rhos),
+        int(n_steps),
+    )
+
+
+def calculate_chart_family(
+    gammas,
+    fys,
+    fc: float,
+    rhos=DEFAULT_RHOS,
+    layout: str = "perimeter",
+    bars_per_face=5,
+    n_steps=N_STEPS,
+    cache: CurveCache = CHART_CACHE,
+):
+    """
+    Calcula las curvas normalizadas Pn/(f'c·Ag) vs Mn/(f'c·Ag·h) para todas las
+    combinaciones de gamma y fy, con una curva por cuantía.
+
+    Todas las curvas que no están en la caché se calculan en un único lote
+    vectorizado y se guardan en la caché por (gamma, fy, f'c, distribución).
+
+    Returns:
+        dict {(gamma, fy): {"rho", "points", "phi_pn_max"}}, donde "points"
+        tiene forma (n_rho x n_puntos x 3) con (Mn normalizado, Pn normalizado,
+        phi) y "phi_pn_max" está normalizado igual que Pn.
+    """
+    rhos = np.asarray(rhos, dtype=float)
+    family = {}
+    missing = []
+    for gamma in np.atleast_1d(gammas):
+        for fy in np.atleast_1d(fys):
+            key = get_chart_key(gamma, fy, fc, layout, bars_per_face, rhos, n_steps)
+            arrays = cache.get(key)
+            if arrays is None:
+                missing.append((gamma, fy))
+            else:
+                family[(gamma, fy)] = arrays
+
+    if not missing:
+        return family
+
+    # Sección normalizada: b = h = 1, de modo que Ag = 1
+    layer_y = []
+    layer_area = []
+    section_fy = []
+    for gamma, fy in missing:
+        pos_y, fraction = get_chart_layers(gamma, layout, bars_per_face)
+        for rho in rhos:
+            layer_y.append(pos_y)
+            layer_area.append(rho * fraction)
+            section_fy.append(fy)
+
+    batch = SectionBatch(
+        b=1.0,
+        h=1.0,
+        fc=fc,
+        fy=section_fy,
+        layer_y=layer_y,
+        layer_area=layer_area,
+    )
+    result = calculate_interaction(batch, n_steps=n_steps)
+
+    points = result.get_points()
+    points[..., :2] /= fc
+    phi_pn_max = result.phi_pn_max / fc
+
+    n_rho = len(rhos)
+    for i, (gamma, fy) in enumerate(missing):
+        rows = slice(i * n_rho, (i + 1) * n_rho)
+        arrays = {
+            "rho": rhos,
+            "points": points[rows],
+            "phi_pn_max": phi_pn_max[rows],
+        }
+        key = get_chart_key(gamma, fy, fc, layout, bars_per_face, rhos, n_steps)
+        cache.put(key, arrays)
+        family[(gamma, fy)] = arrays
+
+    return family
+
+
+def plot_chart(
+    gamma: float,
+    fy: float,
+    fc: float,
+    rhos=DEFAULT_RHOS,
+    layout: str = "perimeter",
+    bars_per_face=5,
+    factored: bool = True,
+    ax=None,
+    file_name="design_chart.png",
+    cache: CurveCache = CHART_CACHE,
+):
+    """
+    Grafica un diagrama de interacción normalizado con una curva por cuantía.
+    Si 'ax' es None, crea una nueva figura y la guarda en 'file_name'.
+    """
+    family = calculate_chart_family(
+        gamma, fy, fc, rhos, layout, bars_per_face, cache=cache
+    )
+    arrays = family[(gamma, fy)]
+
+    if ax is None:
+        fig = plt.figure(figsize=(8, 8))
+        ax = fig.add_subplot(111)
+        save_and_close = True
+    else:
+        fig = ax.get_figure()
+        save_and_close = False
+
+    for rho, points, phi_pn_max in zip(
+        arrays["rho"], arrays["points"], arrays["phi_pn_max"]
+    ):
+        mn = points[:, 0]
+        pn = points[:, 1]
+        if factored:
+            mn = mn * points[:, 2]
+            pn = np.minimum(pn * points[:, 2], phi_pn_max)
+        ax.plot(mn, pn, linestyle="-", label=f"$\\rho$ = {rho:.2f}")
+
+    if factored:
+        ax.set_xlabel("$\\phi$Mn / (f'c·Ag·h)")
+        ax.set_ylabel("$\\phi$Pn / (f'c·Ag)")
+    else:
+        ax.set_xlabel("Mn / (f'c·Ag·h)")
+        ax.set_ylabel("Pn / (f'c·Ag)")
+    ax.set_title(
+        f"Diagrama Normalizado ($\\gamma$ = {gamma}, f'c = {fc}, fy = {fy}, {layout})"
+    )
+
+    ax.grid(True, linestyle="--", alpha=0.7)
+    ax.axhline(0, color="black", linewidth=0.5)
+    ax.axvline(0, color="black", linewidth=0.5)
+    ax.legend(loc="upper right", fontsize="x-small")
+
+    if save_and_close:
+        fig.savefig(file_name)
+        plt.close(fig)
+        return file_name
+    else:
+        return fig
@@ -0,0 +1,146 @@
+import numpy as np
+
+from elements.rebar import REBAR_INFO
+from elements.stirrup import REBAR_INFO as TIE_INFO
+
+# Límites de la cuantía de refuerzo longitudinal (ACI 318-19, 10.6.1.1)
+RHO_MIN = 0.01
+RHO_MAX = 0.08
+
+# Recubrimiento libre mínimo hasta el estribo, no expuesto (20.5.1.3.1), cm
+MIN_COVER = 3.8
+
+# Separación libre mínima entre barras longitudinales (25.2.3): el mayor de
+# 3.8 cm, 1.5 db y 4/3 del tamaño máximo del agregado
+MIN_CLEAR_SPACING = 3.8
+AGGREGATE_SIZE = 2.5
+
+# Dimensión mínima de la sección en pórticos especiales resistentes a
+# momento (18.7.2.1), cm; solo se verifica si se piden las reglas de SMF
+SMF_MIN_DIMENSION = 30.0
+
+# Estribos: #3 para barras hasta #10 y #4 para barras mayores (25.7.2.2)
+MAX_BAR_DIAMETER_FOR_3_TIE = 3.226
+MIN_TIE_DIAMETERS = (0.9525, 1.27)
+
+# Separación libre máxima entre una barra sin soporte lateral y una barra
+# apoyada en una esquina de estribo o grapa (25.7.2.3), cm
+MAX_UNSUPPORTED_CLEAR_DISTANCE = 15.0
+
+# Barras mínimas con estribos rectangulares (10.7.3.1)
+MIN_BARS = 4
+
+# Reglas evaluadas, en el orden en que se reportan
+DETAILING_RULES = (
+    "cover",
+    "min_bars",
+    "rho_min",
+    "rho_max",
+    "clear_spacing",
+    "tie_size",
+    "tie_support",
+)
+
+# Reglas adicionales de pórticos especiales (capítulo 18)
+SMF_RULES = ("smf_min_dimension",)
+
+
+def check_detailing(
+    b,
+    h,
+    cover,
+    rebar_number,
+    tie_rebar,
+    r2_bars,
+    r3_bars,
+    aggregate_size=AGGREGATE_SIZE,
+    special_moment_frame=False,
+    min_dimension=SMF_MIN_DIMENSION,
+):
+    """
+    Verifica los requisitos de detallado de ACI 318-19 para arreglos de
+    secciones con la distribución perimetral de RectangularColumn.generate_rebars,
+    sin construir las columnas ni calcular sus diagramas.
+
+    Para el soporte lateral se supone que se colocan grapas en barras alternas,
+    de modo que ninguna barra sin soporte queda a más de 15 cm libres de una
+    barra apoyada si la separación libre entre barras no excede ese valor.
+
+    Args:
+        b, h, cover, rebar_number, tie_rebar, r2_bars, r3_bars (array):
+            Mismos parámetros que SectionBatch.from_parameters
+        aggregate_size (float): Tamaño máximo del agregado (cm)
+        special_moment_frame (bool): Si es True, se verifican además las
+            reglas de SMF_RULES (columnas de pórticos especiales)
+        min_dimension (float): Dimensión mínima de la sección en pórticos
+            especiales (cm)
+
+    Returns:
+        Diccionario {regla: máscara} con una máscara booleana por regla de
+        DETAILING_RULES (y de SMF_RULES si se piden), True si la sección
+        cumple, y "all" con todas a la vez.
+    """
+    b, h, cover, rebar_number, tie_rebar, r2_bars, r3_bars = np.broadcast_arrays(
+        np.atleast_1d(b), h, cover, rebar_number, tie_rebar, r2_bars, r3_bars
+    )
+    b, h, cover = (np.asarray(x, dtype=float) for x in (b, h, cover))
+    r2_bars = np.asarray(r2_bars, dtype=int)
+    r3_bars = np.asarray(r3_bars, dtype=int)
+
+    diameters = {x["number"]: x["diameter"] for x in REBAR_INFO}
+    areas = {x["number"]: x["area"] for x in REBAR_INFO}
+    tie_diameters = {x["number"]: x["diameter"] for x in TIE_INFO}
+    db = np.array([diameters[x] for x in rebar_number.ravel()])
+    ab = np.array([areas[x] for x in rebar_number.ravel()])
+    dt = np.array([tie_diameters[x] for x in tie_rebar.ravel()])
+
+    # Separación libre entre barras en cada cara (igual que generate_rebars)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clear_x = (b - 2 * cover - 2 * dt - db) / (r2_bars - 1) - db
+        clear_y = (h - 2 * cover - 2 * dt - db) / (r3_bars - 1) - db
+    clear_min = np.minimum(clear_x, clear_y)
+
+    # Solo las caras con barras intermedias tienen barras sin soporte; las
+    # barras de esquina siempre quedan apoyadas en una esquina del estribo
+    clear_max = np.maximum(
+        np.where(r2_bars > 2, clear_x, 0.0), np.where(r3_bars > 2, clear_y, 0.0)
+    )
+
+    n_bars = 2 * r3_bars + 2 * (r2_bars - 2)
+    rho = n_bars * ab / (b * h)
+    min_clear = np.maximum(
+        np.maximum(MIN_CLEAR_SPACING, 1.5 * db), 4 / 3 * aggregate_size
+    )
+    min_tie = np.where(
+        db > MAX_BAR_DIAMETER_FOR_3_TIE, MIN_TIE_DIAMETERS[1], MIN_TIE_DIAMETERS[0]
+    )
+
+    checks = {
+        "cover": cover >= MIN_COVER,
+        "min_bars": (r2_bars >= 2) & (r3_bars >= 2) & (n_bars >= MIN_BARS),
+        "rho_min": rho >= RHO_MIN,
+        "rho_max": rho <= RHO_MAX,
+        "clear_spacing": clear_min >= min_clear,
+        "tie_size": dt >= min_tie,
+        "tie_support": clear_max <= MAX_UNSUPPORTED_CLEAR_DISTANCE,
+    }
+    if special_moment_frame:
+        checks["smf_min_dimension"] = np.minimum(b, h) >= min_dimension
+    checks["all"] = np.logical_and.reduce(list(checks.values()))
+    return checks
+
+
+def check_parameter_rows(rows, **kwargs):
+    """Verifica una lista de diccionarios con SECTION_PARAMETERS."""
+    names = ("b", "h", "cover", "rebar_number", "tie_rebar", "r2_bars", "r3_bars")
+    columns = {name: [row[name] for row in rows] for name in names}
+    return check_detailing(**columns, **kwargs)
+
+
+def get_failed_rules(checks, index: int):
+    """Reglas que no cumple la sección 'index' de un resultado de check_detailing."""
+    return [
+        rule
+        for rule in DETAILING_RULES + SMF_RULES
+        if rule in checks and not checks[rule][index]
+    ]
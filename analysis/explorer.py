@@ -0,0 +1,172 @@
+import numpy as np
+
+from elements.rebar import REBAR_INFO
+from utils.units import get_unit_system
+
+from .interaction import N_STEPS, SectionBatch, calculate_interaction
+
+# Malla de f'c alrededor de la sección actual (kg/cm²): FC_STEPS valores a
+# cada lado, separados FC_STEP, sin bajar de MIN_FC
+FC_STEP = 35.0
+FC_STEPS = 4
+MIN_FC = 175.0
+
+# Barras por cara paralela a h (r3_bars) alrededor de la sección actual
+R3_STEPS = 4
+MIN_R3_BARS = 2
+
+
+def get_family_axes(section: dict):
+    """
+    Valores de f'c, número de barra y barras por cara (r3_bars) de la familia
+    de curvas alrededor de 'section' (ver AppWindow.get_section_inputs).
+    """
+    fc = float(section["fc"])
+    fc_values = fc + FC_STEP * np.arange(-FC_STEPS, FC_STEPS + 1)
+    fc_values = fc_values[fc_values >= min(MIN_FC, fc)]
+
+    rebar_numbers = [x["number"] for x in REBAR_INFO]
+
+    r3 = int(section["r3_bars"])
+    r3_values = np.arange(max(MIN_R3_BARS, r3 - R3_STEPS), r3 + R3_STEPS + 1)
+    return fc_values, rebar_numbers, r3_values
+
+
+class CurveFamily:
+    def __init__(
+        self,
+        section: dict,
+        fc_values,
+        rebar_numbers,
+        r3_values,
+        points,
+        phi_pn_max,
+    ):
+        """
+        Curvas de interacción precalculadas de una malla de secciones que solo
+        difieren de 'section' en f'c, número de barra y r3_bars. Permite
+        recorrer la malla (p. ej. con controles deslizantes) sin recalcular.
+
+        Args:
+            section (dict): Sección base
+            fc_values (array): Valores de f'c, en orden creciente
+            rebar_numbers (list): Números de barra
+            r3_values (array): Valores de r3_bars
+            points (array): Curvas (n_fc x n_barras x n_r3 x n_puntos x 3),
+                en kg y kg-cm
+            phi_pn_max (array): phi*Pn,max (n_fc x n_barras x n_r3), en kg
+        """
+        self.section = dict(section)
+        self.fc_values = np.asarray(fc_values, dtype=float)
+        self.rebar_numbers = list(rebar_numbers)
+        self.r3_values = np.asarray(r3_values, dtype=int)
+        self.points = points
+        self.phi_pn_max = phi_pn_max
+
+    def __len__(self):
+        return self.phi_pn_max.size
+
+    def get_fc_range(self):
+        return self.fc_values[0], self.fc_values[-1]
+
+    def get_curve(self, fc: float, rebar_number: str, r3_bars: int):
+        """
+        Curva de la sección con f'c, barra y r3_bars dados. Barra y r3_bars
+        deben estar en la malla; f'c se interpola linealmente entre los dos
+        valores vecinos (los puntos de todas las curvas corresponden a las
+        mismas profundidades del eje neutro, así que se interpolan uno a uno).
+
+        Returns:
+            (points, phi_pn_max) con formas (n_puntos x 3) y escalar, en kg y kg-cm.
+        """
+        j = self.rebar_numbers.index(rebar_number)
+        k = int(np.searchsorted(self.r3_values, r3_bars))
+        if k == len(self.r3_values) or self.r3_values[k] != r3_bars:
+            raise ValueError(f"r3_bars = {r3_bars} no está en la familia de curvas")
+
+        fc = float(np.clip(fc, self.fc_values[0], self.fc_values[-1]))
+        i = int(np.searchsorted(self.fc_values, fc, side="right")) - 1
+        i = min(i, len(self.fc_values) - 2)
+        if i < 0:
+            # Un solo valor de f'c
+            return self.points[0, j, k], self.phi_pn_max[0, j, k]
+
+        t = (fc - self.fc_values[i]) / (self.fc_values[i + 1] - self.fc_values[i])
+        points = (1 - t) * self.points[i, j, k] + t * self.points[i + 1, j, k]
+        phi_pn_max = (1 - t) * self.phi_pn_max[i, j, k] + t * self.phi_pn_max[
+            i + 1, j, k
+        ]
+        return points, phi_pn_max
+
+    def get_section(self, fc: float, rebar_number: str, r3_bars: int):
+        """Sección base con los parámetros de la malla modificados."""
+        section = dict(self.section)
+        section.update(fc=float(fc), rebar_number=rebar_number, r3_bars=int(r3_bars))
+        return section
+
+
+def calculate_curve_family(
+    section: dict,
+    fc_values=None,
+    rebar_numbers=None,
+    r3_values=None,
+    n_steps=N_STEPS,
+    backend: str = None,
+):
+    """
+    Evalúa en un solo lote vectorizado la familia de curvas alrededor de
+    'section'. Los ejes que no se indiquen se toman de get_family_axes.
+    """
+    default_axes = get_family_axes(section)
+    fc_values = default_axes[0] if fc_values is None else np.asarray(fc_values)
+    rebar_numbers = default_axes[1] if rebar_numbers is None else list(rebar_numbers)
+    r3_values = default_axes[2] if r3_values is None else np.asarray(r3_values)
+
+    fc, bar, r3 = np.meshgrid(
+        fc_values, np.arange(len(rebar_numbers)), r3_values, indexing="ij"
+    )
+    batch = SectionBatch.from_parameters(
+        b=section["b"],
+        h=section["h"],
+        cover=section["cover"],
+        fc=fc.ravel().astype(float),
+        fy=section["fy"],
+        rebar_number=np.array(rebar_numbers)[bar.ravel()],
+        tie_rebar=section["tie_rebar"],
+        r2_bars=section["r2_bars"],
+        r3_bars=r3.ravel(),
+    )
+    result = calculate_interaction(batch, n_steps=n_steps, backend=backend)
+
+    shape = fc.shape
+    points = result.get_points().reshape(shape + (-1, 3))
+    phi_pn_max = result.phi_pn_max.reshape(shape)
+    return CurveFamily(section, fc_values, rebar_numbers, r3_values, points, phi_pn_max)
+
+
+def get_display_curves(points, phi_pn_max, units=None):
+    """
+    Curvas nominal y de diseño listas para graficar (con el lado simétrico),
+    igual que RectangularColumn.plot_diagram, en el sistema 'units'.
+
+    Returns:
+        ((mn, pn), (phi_mn, phi_pn)) como arreglos.
+    """
+    units = get_unit_system(units)
+    points = units.points_from_internal(points)
+    phi_pn_max = units.from_internal(phi_pn_max, "force")
+
+    mn, pn = points[:, 0], points[:, 1]
+    phi_mn = mn * points[:, 2]
+    phi_pn = np.minimum(pn * points[:, 2], phi_pn_max)
+
+    curves = []
+    for m, p in ((mn, pn), (phi_mn, phi_pn)):
+        nonzero = m != 0
+        curves.append(
+            (
+                np.concatenate([-m[nonzero][::-1], m]),
+                np.concatenate([p[nonzero][::-1], p]),
+            )
+        )
+    return tuple(curves)
@@ -0,0 +1,224 @@
+import numpy as np
+
+from elements.material import TABLE_POINTS, TabulatedLaw
+from .interaction import N_STEPS, InteractionResult, get_c_values, get_phi
+
+# Franjas de concreto por sección. Con el bloque de Whitney (ley escalonada)
+# el error de discretización respecto de la integración exacta es del orden
+# de 0.8 % en Pn y 1.8 % en Mn con 100 franjas y de 0.2 % y 0.4 % con 400; las
+# leyes continuas convergen más rápido.
+N_FIBERS = 100
+
+
+class FiberSectionBatch:
+    """
+    Lote de secciones rectangulares discretizadas en franjas de concreto y
+    capas de acero, con leyes esfuerzo-deformación tabuladas (una tabla por
+    sección). Convención: compresión positiva, curvatura positiva comprime la
+    fibra superior.
+    """
+
+    def __init__(
+        self,
+        b,
+        h,
+        layer_y,
+        layer_area,
+        concrete_law: TabulatedLaw,
+        steel_law: TabulatedLaw,
+        eps_cu,
+        fy,
+        Es,
+        n_fibers: int = N_FIBERS,
+        eps_su=None,
+        continuous: bool = True,
+    ):
+        """
+        Args:
+            b, h (array): Dimensiones de cada sección (cm)
+            layer_y, layer_area (array): Capas de acero (n_secciones x n_capas)
+            concrete_law, steel_law (TabulatedLaw): Una tabla por sección
+            eps_cu (array): Deformación última del concreto de cada sección
+            fy, Es (array): Fluencia y módulo del acero (para el factor phi)
+            n_fibers (int): Franjas de concreto por sección
+            eps_su (array): Deformación de rotura del acero de cada sección
+                (inf si no se limita); por defecto sin límite
+            continuous (bool): Si todas las leyes son continuas (ver
+                Material.continuous)
+        """
+        self.b = np.asarray(b, dtype=float)
+        self.h = np.asarray(h, dtype=float)
+        self.layer_y = np.atleast_2d(np.asarray(layer_y, dtype=float))
+        self.layer_area = np.atleast_2d(np.asarray(layer_area, dtype=float))
+        self.concrete_law = concrete_law
+        self.steel_law = steel_law
+        self.eps_cu = np.asarray(eps_cu, dtype=float)
+        self.fy = np.asarray(fy, dtype=float)
+        self.Es = np.asarray(Es, dtype=float)
+        self.eps_su = np.broadcast_to(
+            np.inf if eps_su is None else np.asarray(eps_su, dtype=float),
+            self.b.shape,
+        )
+        self.continuous = continuous
+
+        # Franjas horizontales de igual espesor
+        fraction = (np.arange(n_fibers) + 0.5) / n_fibers
+        self.fiber_y = self.h[:, None] * fraction
+        self.fiber_area = np.repeat((self.b * self.h / n_fibers)[:, None], n_fibers, 1)
+
+    def __len__(self):
+        return self.b.shape[0]
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns,
+        n_fibers=N_FIBERS,
+        n_table=TABLE_POINTS,
+        concrete_materials=None,
+    ):
+        """
+        Construye el lote con las capas y los materiales de cada
+        RectangularColumn (concrete_material y rebar_material). Con
+        'concrete_materials' se usa otro concreto por columna.
+        """
+        if concrete_materials is None:
+            concrete_materials = [column.concrete_material for column in columns]
+        steel_materials = [column.rebar_material for column in columns]
+
+        layers = [column.get_layer_arrays() for column in columns]
+        n_layers = max(len(pos_y) for pos_y, _ in layers)
+        layer_y = np.zeros((len(columns), n_layers))
+        layer_area = np.zeros((len(columns), n_layers))
+        for i, (pos_y, area) in enumerate(layers):
+            layer_y[i, : len(pos_y)] = pos_y
+            layer_area[i, : len(area)] = area
+
+        return cls(
+            b=[column.b for column in columns],
+            h=[column.h for column in columns],
+            layer_y=layer_y,
+            layer_area=layer_area,
+            concrete_law=TabulatedLaw.stack(
+                [material.tabulate(n_table) for material in concrete_materials]
+            ),
+            steel_law=TabulatedLaw.stack(
+                [material.tabulate(n_table) for material in steel_materials]
+            ),
+            eps_cu=[material.Eu for material in concrete_materials],
+            fy=[material.fy for material in steel_materials],
+            Es=[material.Es for material in steel_materials],
+            n_fibers=n_fibers,
+            eps_su=[
+                np.inf if material.eps_su is None else material.eps_su
+                for material in steel_materials
+            ],
+            continuous=all(
+                material.continuous for material in concrete_materials + steel_materials
+            ),
+        )
+
+    def get_d_t(self):
+        masked_y = np.where(self.layer_area > 0, self.layer_y, np.inf)
+        return self.h - masked_y.min(axis=1)
+
+    def integrate(self, eps_top, curvature, tangents=False):
+        """
+        Integra fuerzas y momentos (respecto de h/2) para perfiles lineales
+        de deformación eps(y) = eps_top - curvature * (h - y).
+
+        Args:
+            eps_top, curvature (array): Con forma (n_secciones x n_perfiles)
+            tangents (bool): Si es True, devuelve también la matriz tangente
+                [[dP/deps, dP/dcurv], [dM/deps, dM/dcurv]] de cada perfil
+
+        Returns:
+            (pn, mn) o (pn, mn, k) con k de forma (n_secciones x n_perfiles x 2 x 2)
+        """
+        eps_top = np.asarray(eps_top, dtype=float)[..., None]
+        curvature = np.asarray(curvature, dtype=float)[..., None]
+        half_h = self.h[:, None, None] / 2.0
+
+        # Las franjas de concreto usan el área bruta; en las capas de acero se
+        # descuenta el concreto desplazado por las barras (como el término
+        # 0.85 f'c (Ag - Ast) de la compresión pura de ACI 22.4.2.2)
+        forces = []
+        for pos_y, area, laws in (
+            (self.fiber_y, self.fiber_area, (self.concrete_law,)),
+            (self.layer_y, self.layer_area, (self.steel_law, self.concrete_law)),
+        ):
+            depth = self.h[:, None, None] - pos_y[:, None, :]
+            strain = eps_top - curvature * depth
+            stress = 0.0
+            tangent = 0.0 if tangents else None
+            for sign, law in zip((1.0, -1.0), laws):
+                if tangents:
+                    law_stress, law_tangent = law.stress_and_tangent(strain)
+                    tangent = tangent + sign * law_tangent
+                else:
+                    law_stress = law.stress(strain)
+                stress = stress + sign * law_stress
+            forces.append((stress * area[:, None, :], tangent, area, pos_y, depth))
+
+        pn = 0.0
+        mn = 0.0
+        k = 0.0
+        for force, tangent, area, pos_y, depth in forces:
+            arm = pos_y[:, None, :] - half_h
+            pn = pn + force.sum(axis=-1)
+            mn = mn + (force * arm).sum(axis=-1)
+            if tangents:
+                stiffness = tangent * area[:, None, :]
+                k = k + np.stack(
+                    [
+                        np.stack(
+                            [
+                                stiffness.sum(axis=-1),
+                                -(stiffness * depth).sum(axis=-1),
+                            ],
+                            axis=-1,
+                        ),
+                        np.stack(
+                            [
+                                (stiffness * arm).sum(axis=-1),
+                                -(stiffness * depth * arm).sum(axis=-1),
+                            ],
+                            axis=-1,
+                        ),
+                    ],
+                    axis=-2,
+                )
+
+        if tangents:
+            return pn, mn, k
+        return pn, mn
+
+
+def calculate_fiber_interaction(batch: FiberSectionBatch, n_steps=N_STEPS):
+    """
+    Diagrama de interacción no lineal por integración de fibras, con la
+    deformación última de cada concreto en la fibra superior y la misma malla
+    de 'c' que RectangularColumn. Con los materiales por defecto (bloque de
+    Whitney y acero elastoplástico) reproduce el diagrama de ACI; a diferencia
+    de RectangularColumn, el concreto desplazado por las barras se descuenta
+    en todos los puntos y no solo en la compresión pura.
+    """
+    c = get_c_values(batch.h, n_steps)
+    eps_cu = batch.eps_cu[:, None]
+    pn, mn = batch.integrate(np.broadcast_to(eps_cu, c.shape), eps_cu / c)
+
+    # Factor phi con la deformación real del acero extremo en tensión
+    d_t = batch.get_d_t()[:, None]
+    et = eps_cu * (d_t - c) / c
+    phi = get_phi(et, (batch.fy / batch.Es)[:, None])
+
+    # Compresión pura: máximo de la carga axial con deformación uniforme
+    uniform = eps_cu * np.linspace(0.0, 1.0, 51)[None, :]
+    pn_uniform, _ = batch.integrate(uniform, np.zeros_like(uniform))
+    pn_0 = pn_uniform.max(axis=1)
+
+    # Tensión pura: todo el acero en el extremo de su tabla
+    eps_t = batch.steel_law.start[:, None]
+    pn_t, _ = batch.integrate(eps_t, np.zeros_like(eps_t))
+
+    return InteractionResult(c, pn, mn, phi, pn_0, pn_t[:, 0])
@@ -0,0 +1,582 @@
+import numpy as np
+
+from elements.rebar import REBAR_INFO
+from elements.stirrup import REBAR_INFO as TIE_INFO
+from utils.utils import get_beta_array
+from .kernels import NUMBA_AVAILABLE, fused_points
+
+# Deformación máxima del concreto y del acero en tensión controlada
+EPS_CU = 0.003
+EPS_TENSION_CONTROLLED = 0.005
+
+# Mismo número de pasos de 'c' que RectangularColumn.calculate_variable_points
+N_STEPS = 100
+
+# Puntos característicos calculados en forma exacta (ver get_key_c_values)
+KEY_POINTS = ("decompression", "balanced", "tension_controlled")
+
+# Parámetros que definen una sección generada (mismos que RectangularColumn,
+# con los materiales reducidos a f'c y fy)
+SECTION_PARAMETERS = (
+    "b",
+    "h",
+    "cover",
+    "fc",
+    "fy",
+    "rebar_number",
+    "tie_rebar",
+    "r2_bars",
+    "r3_bars",
+)
+
+# Motores de integración de la sección (ver set_backend)
+BACKENDS = ("numpy", "numba")
+_backend = "numba" if NUMBA_AVAILABLE else "numpy"
+
+# Secciones por bloque en el respaldo de NumPy, para que los temporales
+# (bloque x n_c x n_capas) se mantengan pequeños
+NUMPY_CHUNK_SIZE = 256
+
+# Parámetros de sección respecto de los cuales se derivan Pn, Mn y phi
+SENSITIVITY_PARAMETERS = ("b", "h", "fc", "fy", "As", "c")
+
+
+class SectionBatch:
+    """
+    Conjunto de secciones rectangulares representadas como arreglos, para
+    evaluar muchas columnas en una sola pasada vectorizada.
+
+    Las capas de acero se guardan en arreglos (n_secciones x n_capas); las
+    secciones con menos capas se rellenan con capas de área cero.
+    """
+
+    def __init__(
+        self, b, h, fc, fy, layer_y, layer_area, Es=2100000.0, layer_dy_dh=None
+    ):
+        """
+        Args:
+            b, h (array): Dimensiones de la sección (cm)
+            fc, fy (array): Resistencia del concreto y fluencia del acero (kg/cm²)
+            layer_y (array): Posición y de cada capa desde la fibra inferior (cm)
+            layer_area (array): Área de acero de cada capa (cm²)
+            Es (array): Módulo de elasticidad del acero (kg/cm²)
+            layer_dy_dh (array): Variación de la posición de cada capa con h.
+                Por defecto las capas conservan su recubrimiento en ambas caras
+                y las intermedias se reparten proporcionalmente.
+        """
+        layer_y = np.atleast_2d(np.asarray(layer_y, dtype=float))
+        layer_area = np.atleast_2d(np.asarray(layer_area, dtype=float))
+        n = layer_y.shape[0]
+
+        self.b = np.broadcast_to(np.asarray(b, dtype=float), (n,)).copy()
+        self.h = np.broadcast_to(np.asarray(h, dtype=float), (n,)).copy()
+        self.fc = np.broadcast_to(np.asarray(fc, dtype=float), (n,)).copy()
+        self.fy = np.broadcast_to(np.asarray(fy, dtype=float), (n,)).copy()
+        self.Es = np.broadcast_to(np.asarray(Es, dtype=float), (n,)).copy()
+        self.layer_y = layer_y
+        self.layer_area = layer_area
+
+        # Capa extrema en tensión (menor y con acero)
+        masked_y = np.where(layer_area > 0, layer_y, np.inf)
+        self.tension_layer = np.argmin(masked_y, axis=1)
+
+        if layer_dy_dh is None:
+            y_max = np.where(layer_area > 0, layer_y, -np.inf).max(axis=1)
+            y_min = masked_y.min(axis=1)
+            span = np.where(y_max > y_min, y_max - y_min, 1.0)
+            layer_dy_dh = (layer_y - y_min[:, None]) / span[:, None]
+            layer_dy_dh = np.where(layer_area > 0, layer_dy_dh, 0.0)
+        self.layer_dy_dh = np.asarray(layer_dy_dh, dtype=float)
+
+    def __len__(self):
+        return self.b.shape[0]
+
+    def get_total_area(self):
+        return self.layer_area.sum(axis=1)
+
+    def get_d_t(self):
+        """Distancia de la fibra superior a la capa extrema en tensión."""
+        rows = np.arange(len(self))
+        return self.h - self.layer_y[rows, self.tension_layer]
+
+    def take(self, rows):
+        """Devuelve un nuevo lote con las secciones indicadas."""
+        return SectionBatch(
+            b=self.b[rows],
+            h=self.h[rows],
+            fc=self.fc[rows],
+            fy=self.fy[rows],
+            Es=self.Es[rows],
+            layer_y=self.layer_y[rows],
+            layer_area=self.layer_area[rows],
+            layer_dy_dh=self.layer_dy_dh[rows],
+        )
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Construye el lote a partir de objetos RectangularColumn."""
+        layers = [column.get_layer_arrays() for column in columns]
+        n_layers = max(len(pos_y) for pos_y, _ in layers)
+
+        layer_y = np.zeros((len(columns), n_layers))
+        layer_area = np.zeros((len(columns), n_layers))
+        for i, (pos_y, area) in enumerate(layers):
+            layer_y[i, : len(pos_y)] = pos_y
+            layer_area[i, : len(area)] = area
+
+        return cls(
+            b=[column.b for column in columns],
+            h=[column.h for column in columns],
+            fc=[column.concrete_material.fc for column in columns],
+            fy=[column.rebar_material.fy for column in columns],
+            Es=[column.rebar_material.Es for column in columns],
+            layer_y=layer_y,
+            layer_area=layer_area,
+        )
+
+    @classmethod
+    def from_parameter_rows(cls, rows):
+        """Construye el lote a partir de una lista de diccionarios de parámetros."""
+        columns = {name: [row[name] for row in rows] for name in SECTION_PARAMETERS}
+        return cls.from_parameters(**columns)
+
+    @classmethod
+    def from_parameters(
+        cls, b, h, cover, fc, fy, rebar_number, tie_rebar, r2_bars, r3_bars
+    ):
+        """
+        Construye el lote directamente a partir de arreglos de parámetros, con la
+        misma distribución perimetral de RectangularColumn.generate_rebars, sin
+        crear objetos Rebar.
+        """
+        b, h, cover, fc, fy, rebar_number, tie_rebar, r2_bars, r3_bars = (
+            np.broadcast_arrays(
+                np.atleast_1d(b),
+                h,
+                cover,
+                fc,
+                fy,
+                rebar_number,
+                tie_rebar,
+                r2_bars,
+                r3_bars,
+            )
+        )
+        b, h, cover = (np.asarray(x, dtype=float) for x in (b, h, cover))
+        r2_bars = np.asarray(r2_bars, dtype=int)
+        r3_bars = np.asarray(r3_bars, dtype=int)
+
+        diameters = {x["number"]: x["diameter"] for x in REBAR_INFO}
+        areas = {x["number"]: x["area"] for x in REBAR_INFO}
+        tie_diameters = {x["number"]: x["diameter"] for x in TIE_INFO}
+        db = np.array([diameters[x] for x in rebar_number.ravel()])
+        ab = np.array([areas[x] for x in rebar_number.ravel()])
+        dt = np.array([tie_diameters[x] for x in tie_rebar.ravel()])
+
+        # Primera capa y separación entre capas (igual que generate_rebars)
+        y_0 = cover + dt + db / 2
+        spacing = (h - 2 * y_0) / (r3_bars - 1)
+
+        j = np.arange(r3_bars.max())[None, :]
+        n_layers = r3_bars[:, None]
+        layer_y = np.where(j < n_layers, y_0[:, None] + j * spacing[:, None], 0.0)
+
+        # Capas extremas: 2 barras laterales + (r2 - 2) barras intermedias
+        bars = np.where((j == 0) | (j == n_layers - 1), r2_bars[:, None], 2)
+        bars = np.where(j < n_layers, bars, 0)
+        layer_area = bars * ab[:, None]
+        layer_dy_dh = np.where(j < n_layers, j / (n_layers - 1), 0.0)
+
+        return cls(
+            b=b,
+            h=h,
+            fc=fc,
+            fy=fy,
+            layer_y=layer_y,
+            layer_area=layer_area,
+            layer_dy_dh=layer_dy_dh,
+        )
+
+
+class InteractionResult:
+    """
+    Resultado de la evaluación vectorizada de un lote de secciones.
+
+    Los arreglos c, pn, mn y phi tienen forma (n_secciones x n_pasos).
+    Si se pidieron derivadas, dpn, dmn y dphi son diccionarios con una entrada
+    por parámetro de SENSITIVITY_PARAMETERS, con la misma forma.
+
+    Los puntos característicos se guardan en key_c, key_pn, key_mn y key_phi,
+    con forma (n_secciones x len(KEY_POINTS)).
+    """
+
+    def __init__(
+        self,
+        c,
+        pn,
+        mn,
+        phi,
+        pn_0,
+        pn_t,
+        dpn=None,
+        dmn=None,
+        dphi=None,
+        key_c=None,
+        key_pn=None,
+        key_mn=None,
+        key_phi=None,
+    ):
+        self.c = c
+        self.pn = pn
+        self.mn = mn
+        self.phi = phi
+        self.pn_0 = pn_0  # Compresión pura
+        self.pn_t = pn_t  # Tensión pura
+        self.dpn = dpn
+        self.dmn = dmn
+        self.dphi = dphi
+        self.key_c = key_c
+        self.key_pn = key_pn
+        self.key_mn = key_mn
+        self.key_phi = key_phi
+
+    @property
+    def phi_pn_max(self):
+        # ACI 318-19, 22.4.2.1
+        return 0.80 * (0.65 * self.pn_0)
+
+    def get_key_point(self, tag: str):
+        """Devuelve (Mn, Pn, phi) del punto característico 'tag' para cada sección."""
+        i = KEY_POINTS.index(tag)
+        return np.stack(
+            [self.key_mn[:, i], self.key_pn[:, i], self.key_phi[:, i]], axis=-1
+        )
+
+    def get_points(self):
+        """
+        Devuelve los puntos (Mn, Pn, phi) con forma (n_secciones x n_puntos x 3),
+        en el mismo orden que RectangularColumn.points.
+        """
+        n = self.pn.shape[0]
+        zeros = np.zeros((n, 1))
+        mn = [zeros, self.mn]
+        pn = [self.pn_0[:, None], self.pn]
+        phi = [np.full((n, 1), 0.65), self.phi]
+        if self.key_pn is not None:
+            mn.append(self.key_mn)
+            pn.append(self.key_pn)
+            phi.append(self.key_phi)
+        mn = np.hstack(mn + [zeros])
+        pn = np.hstack(pn + [self.pn_t[:, None]])
+        phi = np.hstack(phi + [np.full((n, 1), 0.90)])
+
+        order = np.argsort(-pn, axis=1, kind="stable")
+        points = np.stack([mn, pn, phi], axis=-1)
+        return np.take_along_axis(points, order[:, :, None], axis=1)
+
+
+def get_c_values(h, n_steps=N_STEPS):
+    """Profundidades del eje neutro, igual que calculate_variable_points."""
+    x = np.arange(n_steps)
+    return h[:, None] - (x / float(n_steps)) * h[:, None]
+
+
+def get_phi(et, ey):
+    """Factor phi según la deformación del acero extremo en tensión (ACI 21.2.2)."""
+    return np.where(
+        et > ey,
+        np.where(
+            et >= EPS_TENSION_CONTROLLED,
+            0.90,
+            0.65 + 0.25 * (et - ey) / (EPS_TENSION_CONTROLLED - ey),
+        ),
+        0.65,
+    )
+
+
+def get_key_c_values(batch: SectionBatch):
+    """
+    Profundidades exactas del eje neutro de los puntos característicos, en
+    forma cerrada a partir del perfil lineal de deformaciones:
+    c = 0.003 * d_t / (0.003 + et), con et = 0 (descompresión), et = ey
+    (balanceado) y et = 0.005 (tensión controlada).
+    """
+    d_t = batch.get_d_t()[:, None]
+    ey = batch.fy / batch.Es
+    et = np.stack(
+        [np.zeros_like(ey), ey, np.full_like(ey, EPS_TENSION_CONTROLLED)], axis=-1
+    )
+    return EPS_CU * d_t / (EPS_CU + et)
+
+
+def calculate_points_at_c(batch: SectionBatch, c, derivatives=False):
+    """
+    Calcula Pn, Mn y phi para cada sección y cada profundidad del eje neutro.
+
+    Args:
+        batch (SectionBatch): Secciones a evaluar
+        c (array): Profundidades del eje neutro (n_secciones x n_c), en cm
+        derivatives (bool): Si es True, calcula además las derivadas analíticas
+            de Pn, Mn y phi respecto de b, h, f'c, fy, el área total de acero
+            (As, manteniendo la proporción entre capas) y c. Las derivadas son
+            parciales a c constante; la derivada respecto de c permite pasar a
+            cualquier otra parametrización de la curva.
+
+    Returns:
+        (pn, mn, phi, dpn, dmn, dphi); las derivadas son None si no se piden.
+    """
+    c = np.asarray(c, dtype=float)
+    b = batch.b[:, None]
+    h = batch.h[:, None]
+    fc = batch.fc[:, None]
+    fy = batch.fy[:, None]
+    Es = batch.Es[:, None]
+
+    # --- Concreto (bloque de Whitney) ---
+    beta, dbeta = get_beta_array(batch.fc)
+    beta = beta[:, None]
+    dbeta = dbeta[:, None]
+    full = beta * c > h
+    a = np.where(full, h, beta * c)
+    cc = 0.85 * fc * b * a
+    arm_c = (h - a) / 2.0
+    mc = cc * arm_c
+
+    # --- Acero (n_secciones x n_c x n_capas) ---
+    area = batch.layer_area[:, None, :]
+    d_prime = h[..., None] - batch.layer_y[:, None, :]
+    c3 = c[..., None]
+    es = EPS_CU * (c3 - d_prime) / c3
+    fy3 = fy[..., None]
+    fs = np.clip(es * Es[..., None], -fy3, fy3)
+    ps = area * fs
+    arm_s = h[..., None] / 2.0 - d_prime
+
+    pn = cc + ps.sum(axis=-1)
+    mn = mc + (ps * arm_s).sum(axis=-1)
+
+    # --- Factor phi ---
+    d_t = batch.get_d_t()[:, None]
+    ey = fy / Es
+    et = EPS_CU * (d_t - c) / c
+    transition = (et > ey) & (et < EPS_TENSION_CONTROLLED)
+    phi = get_phi(et, ey)
+
+    if not derivatives:
+        return pn, mn, phi, None, None, None
+
+    elastic = np.abs(es * Es[..., None]) < fy3
+    dphi_det = np.where(transition, 0.25 / (EPS_TENSION_CONTROLLED - ey), 0.0)
+    zeros = np.zeros_like(pn)
+
+    def concrete(dcc, da, dh=0.0):
+        return dcc, dcc * arm_c + cc * (dh - da) / 2.0
+
+    def steel(dps, darm=0.0):
+        return dps.sum(axis=-1), (dps * arm_s + ps * darm).sum(axis=-1)
+
+    dpn, dmn, dphi = {}, {}, {}
+
+    def store(name, conc, stl, dphi_value):
+        dpn[name] = conc[0] + stl[0]
+        dmn[name] = conc[1] + stl[1]
+        dphi[name] = dphi_value
+
+    # b
+    store("b", concrete(0.85 * fc * a, 0.0), (zeros, zeros), zeros)
+
+    # h (las capas se desplazan según layer_dy_dh)
+    da = np.where(full, 1.0, 0.0)
+    dd_prime = 1.0 - batch.layer_dy_dh[:, None, :]
+    dfs = np.where(elastic, Es[..., None] * (-EPS_CU * dd_prime / c3), 0.0)
+    rows = np.arange(len(batch))
+    dd_t = (1.0 - batch.layer_dy_dh[rows, batch.tension_layer])[:, None]
+    store(
+        "h",
+        concrete(0.85 * fc * b * da, da, dh=1.0),
+        steel(area * dfs, darm=0.5 - dd_prime),
+        dphi_det * EPS_CU * dd_t / c,
+    )
+
+    # f'c
+    da = np.where(full, 0.0, c * dbeta)
+    store("fc", concrete(0.85 * (b * a + fc * b * da), da), (zeros, zeros), zeros)
+
+    # fy (solo las capas que fluyen y el límite de transición de phi)
+    dfs = np.where(elastic, 0.0, np.sign(fs))
+    dphi_dey = np.where(
+        transition,
+        0.25 * (et - EPS_TENSION_CONTROLLED) / (EPS_TENSION_CONTROLLED - ey) ** 2,
+        0.0,
+    )
+    store("fy", (zeros, zeros), steel(area * dfs), dphi_dey / Es)
+
+    # As (escala uniforme de todas las capas)
+    total_area = batch.get_total_area()[:, None, None]
+    dps = np.where(total_area > 0, area / total_area, 0.0) * fs
+    store("As", (zeros, zeros), steel(dps), zeros)
+
+    # c
+    da = np.where(full, 0.0, beta)
+    dfs = np.where(elastic, Es[..., None] * EPS_CU * d_prime / c3**2, 0.0)
+    store(
+        "c",
+        concrete(0.85 * fc * b * da, da),
+        steel(area * dfs),
+        dphi_det * (-EPS_CU * d_t / c**2),
+    )
+
+    return pn, mn, phi, dpn, dmn, dphi
+
+
+def set_backend(name: str):
+    """
+    Selecciona el motor de integración: "numpy" (vectorizado por bloques) o
+    "numba" (núcleo compilado fusionado, requiere Numba).
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Motor desconocido: {name}")
+    if name == "numba" and not NUMBA_AVAILABLE:
+        raise ImportError("El motor 'numba' requiere tener Numba instalado.")
+    _backend = name
+
+
+def get_backend():
+    return _backend
+
+
+def calculate_points(batch: SectionBatch, c, backend: str = None):
+    """
+    Calcula Pn, Mn y phi (sin derivadas) con el motor seleccionado.
+
+    Returns:
+        (pn, mn, phi), cada uno con forma (n_secciones x n_c).
+    """
+    backend = backend or _backend
+    c = np.asarray(c, dtype=float)
+
+    if backend == "numba":
+        if not NUMBA_AVAILABLE:
+            raise ImportError("El motor 'numba' requiere tener Numba instalado.")
+        return calculate_points_fused(batch, c, fused_points)
+
+    if backend != "numpy":
+        raise ValueError(f"Motor desconocido: {backend}")
+
+    if len(batch) <= NUMPY_CHUNK_SIZE:
+        return calculate_points_at_c(batch, c)[:3]
+
+    pn = np.empty(c.shape)
+    mn = np.empty(c.shape)
+    phi = np.empty(c.shape)
+    for start in range(0, len(batch), NUMPY_CHUNK_SIZE):
+        rows = slice(start, start + NUMPY_CHUNK_SIZE)
+        pn[rows], mn[rows], phi[rows], _, _, _ = calculate_points_at_c(
+            batch.take(rows), c[rows]
+        )
+    return pn, mn, phi
+
+
+def calculate_points_fused(batch: SectionBatch, c, kernel=fused_points):
+    """Evalúa el lote con un núcleo fusionado (ver kernels.py)."""
+    pn = np.empty(c.shape)
+    mn = np.empty(c.shape)
+    phi = np.empty(c.shape)
+    beta, _ = get_beta_array(batch.fc)
+    kernel(
+        batch.b,
+        batch.h,
+        batch.fc,
+        batch.fy,
+        batch.Es,
+        beta,
+        batch.get_d_t(),
+        np.ascontiguousarray(batch.layer_y),
+        np.ascontiguousarray(batch.layer_area),
+        np.ascontiguousarray(c),
+        pn,
+        mn,
+        phi,
+    )
+    return pn, mn, phi
+
+
+def check_backend_equivalence(batch: SectionBatch, backend: str, n_steps=N_STEPS):
+    """
+    Compara un motor con la implementación de referencia (NumPy sin bloques)
+    y devuelve el error relativo máximo de Pn, Mn y phi.
+    """
+    c = get_c_values(batch.h, n_steps)
+    reference = calculate_points_at_c(batch, c)[:3]
+    candidate = calculate_points(batch, c, backend)
+
+    errors = {}
+    for name, ref, value in zip(("pn", "mn", "phi"), reference, candidate):
+        scale = np.abs(ref).max(axis=1, keepdims=True)
+        scale = np.where(scale > 0, scale, 1.0)
+        errors[name] = float((np.abs(value - ref) / scale).max())
+    return errors
+
+
+def calculate_interaction(
+    batch: SectionBatch, n_steps=N_STEPS, derivatives=False, backend: str = None
+):
+    """
+    Calcula el diagrama de interacción completo de todas las secciones del lote
+    en una sola pasada vectorizada.
+
+    Equivale a construir un RectangularColumn por sección: compresión pura,
+    n_steps puntos con 'c' variable, los puntos característicos exactos y
+    tensión pura. Las derivadas siempre se calculan con NumPy; sin derivadas
+    se usa el motor seleccionado (ver set_backend).
+    """
+    c = get_c_values(batch.h, n_steps)
+    if derivatives:
+        pn, mn, phi, dpn, dmn, dphi = calculate_points_at_c(batch, c, True)
+    else:
+        pn, mn, phi = calculate_points(batch, c, backend)
+        dpn = dmn = dphi = None
+
+    # Puntos característicos (phi exacto en cada uno)
+    key_c = get_key_c_values(batch)
+    key_pn, key_mn, _, _, _, _ = calculate_points_at_c(batch, key_c)
+    key_phi = np.broadcast_to([0.65, 0.65, 0.90], key_c.shape)
+
+    # Compresión pura y tensión pura (ACI 318-19, 22.4.2.2)
+    ast = batch.get_total_area()
+    pn_0 = 0.85 * batch.fc * (batch.b * batch.h - ast) + ast * batch.fy
+    pn_t = -ast * batch.fy
+
+    return InteractionResult(
+        c, pn, mn, phi, pn_0, pn_t, dpn, dmn, dphi, key_c, key_pn, key_mn, key_phi
+    )
+
+
+def get_section_key(row: dict):
+    """Clave normalizada (hashable) de una sección, para cachés y proyectos."""
+    return (
+        float(row["b"]),
+        float(row["h"]),
+        float(row["cover"]),
+        float(row["fc"]),
+        float(row["fy"]),
+        str(row["rebar_number"]),
+        str(row["tie_rebar"]),
+        int(row["r2_bars"]),
+        int(row["r3_bars"]),
+    )
+
+
+def evaluate_parameter_rows(rows, n_steps=N_STEPS, backend: str = None):
+    """
+    Evalúa una lista de secciones (diccionarios con SECTION_PARAMETERS) en un
+    solo lote. Es una función de módulo para poder enviarla a procesos de
+    trabajo.
+
+    Returns:
+        (points, phi_pn_max) con formas (n x n_puntos x 3) y (n,), en kg y kg-cm.
+    """
+    batch = SectionBatch.from_parameter_rows(rows)
+    result = calculate_interaction(batch, n_steps=n_steps, backend=backend)
+    return result.get_points(), result.phi_pn_max
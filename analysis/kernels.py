@@ -0,0 +1,75 @@
+# Núcleo compilado de la integración de la sección: fusiona la cadena
+# deformación -> esfuerzo -> fuerza -> momento en un solo recorrido por
+# (secciones x c x capas), sin arreglos temporales. Se compila con Numba si está
+# instalado; si no, se usa el respaldo de NumPy de interaction.py.
+#
+# El núcleo se compila en serie: el paralelismo se obtiene a nivel de procesos
+# (ProcessPoolExecutor). Un núcleo paralelo deja hilos de Numba activos en el
+# proceso principal y, si este luego crea procesos con fork, el intérprete se
+# bloquea al salir.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def fused_points_python(
+    b, h, fc, fy, Es, beta, d_t, layer_y, layer_area, c, pn, mn, phi
+):
+    """
+    Escribe Pn, Mn y phi en los arreglos de salida (n_secciones x n_c).
+    Mismas ecuaciones que interaction.calculate_points_at_c.
+    """
+    n_sections, n_c = c.shape
+    n_layers = layer_y.shape[1]
+
+    for i in range(n_sections):
+        ey = fy[i] / Es[i]
+        half_h = h[i] / 2.0
+
+        for j in range(n_c):
+            cj = c[i, j]
+
+            # Concreto (bloque de Whitney)
+            a = beta[i] * cj
+            if a > h[i]:
+                a = h[i]
+            cc = 0.85 * fc[i] * b[i] * a
+            sum_p = cc
+            sum_m = cc * (h[i] - a) / 2.0
+
+            # Acero
+            for k in range(n_layers):
+                area = layer_area[i, k]
+                if area == 0.0:
+                    continue
+                d_prime = h[i] - layer_y[i, k]
+                fs = 0.003 * (cj - d_prime) / cj * Es[i]
+                if fs > fy[i]:
+                    fs = fy[i]
+                elif fs < -fy[i]:
+                    fs = -fy[i]
+                ps = area * fs
+                sum_p += ps
+                sum_m += ps * (half_h - d_prime)
+
+            # Factor phi
+            et = 0.003 * (d_t[i] - cj) / cj
+            phi_j = 0.65
+            if et > ey:
+                if et >= 0.005:
+                    phi_j = 0.90
+                else:
+                    phi_j = 0.65 + 0.25 * (et - ey) / (0.005 - ey)
+
+            pn[i, j] = sum_p
+            mn[i, j] = sum_m
+            phi[i, j] = phi_j
+
+
+if NUMBA_AVAILABLE:
+    fused_points = numba.njit(cache=True)(fused_points_python)
+else:
+    fused_points = fused_points_python
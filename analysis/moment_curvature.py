@@ -0,0 +1,177 @@
+import warnings
+
+import numpy as np
+
+from .fiber import FiberSectionBatch
+
+# Pasos de curvatura e iteraciones de Newton por paso
+N_CURVATURE_STEPS = 100
+MAX_ITERATIONS = 30
+
+# Tolerancia de equilibrio axial, relativa a la capacidad a compresión
+AXIAL_TOLERANCE = 1e-8
+
+# Motivo por el que termina cada curva (MomentCurvatureResult.termination)
+TERMINATIONS = ("complete", "crushing", "rupture", "not_converged")
+
+
+class MomentCurvatureResult:
+    """
+    Curvas momento-curvatura de un lote de secciones a varios niveles de carga
+    axial.
+
+    curvature tiene forma (n_secciones x n_pasos); moment y eps_top tienen
+    forma (n_secciones x n_cargas x n_pasos) y valen NaN después de la falla
+    (aplastamiento del concreto, rotura del acero o falta de convergencia).
+    termination (n_secciones x n_cargas) indica el motivo, uno de TERMINATIONS.
+    """
+
+    def __init__(
+        self, curvature, axial_loads, moment, eps_top, iterations, termination
+    ):
+        self.curvature = curvature
+        self.axial_loads = axial_loads
+        self.moment = moment
+        self.eps_top = eps_top
+        self.iterations = iterations
+        self.termination = termination
+
+    def get_unconverged(self):
+        """Máscara de las curvas truncadas por falta de convergencia."""
+        return self.termination == "not_converged"
+
+    def get_ultimate(self):
+        """
+        Último punto válido de cada curva.
+
+        Returns:
+            (curvatura_u, momento_u) con forma (n_secciones x n_cargas).
+        """
+        valid = ~np.isnan(self.moment)
+        last = valid.shape[-1] - 1 - np.argmax(valid[..., ::-1], axis=-1)
+        curvature = np.broadcast_to(self.curvature[:, None, :], self.moment.shape)
+        phi_u = np.take_along_axis(curvature, last[..., None], axis=-1)[..., 0]
+        m_u = np.take_along_axis(self.moment, last[..., None], axis=-1)[..., 0]
+        return phi_u, m_u
+
+    def get_peak_moment(self):
+        return np.nanmax(self.moment, axis=-1)
+
+
+def calculate_moment_curvature(
+    batch: FiberSectionBatch,
+    axial_loads,
+    curvatures=None,
+    n_steps=N_CURVATURE_STEPS,
+    tolerance=AXIAL_TOLERANCE,
+    max_iterations=MAX_ITERATIONS,
+):
+    """
+    Calcula las curvas M-phi de todas las secciones y todos los niveles de
+    carga axial a la vez.
+
+    En cada paso de curvatura se resuelve, con iteraciones de Newton sobre la
+    deformación de la fibra superior, la posición del eje neutro que equilibra
+    la carga axial. Cada paso parte de la solución del paso anterior
+    manteniendo la profundidad del eje neutro.
+
+    Args:
+        batch (FiberSectionBatch): Secciones (ver FiberSectionBatch.from_columns).
+            Las leyes deben ser continuas (p. ej. Hognestad o Mander; el bloque
+            de Whitney no sirve); si no, se lanza ValueError.
+        axial_loads (array): Cargas axiales (kg, compresión positiva), con forma
+            (n_cargas,) o (n_secciones x n_cargas)
+        curvatures (array): Curvaturas (1/cm) con forma (n_pasos,) o
+            (n_secciones x n_pasos). Por defecto, de 0 hasta la curvatura que
+            produce Eu con el eje neutro a 0.1 h.
+
+    Returns:
+        MomentCurvatureResult. Si alguna curva se trunca por falta de
+        convergencia se emite un RuntimeWarning (ver get_unconverged).
+    """
+    if not batch.continuous:
+        raise ValueError(
+            "El análisis momento-curvatura requiere leyes esfuerzo-deformación "
+            "continuas; el bloque de Whitney (ConcreteMaterial) no converge. "
+            "Use HognestadConcrete o ManderConcrete."
+        )
+
+    n = len(batch)
+    axial_loads = np.asarray(axial_loads, dtype=float)
+    if axial_loads.ndim == 1:
+        axial_loads = np.broadcast_to(axial_loads, (n, axial_loads.shape[0]))
+    n_loads = axial_loads.shape[1]
+
+    if curvatures is None:
+        curvature_max = batch.eps_cu / (0.1 * batch.h)
+        curvatures = curvature_max[:, None] * np.linspace(0.0, 1.0, n_steps)
+    curvatures = np.asarray(curvatures, dtype=float)
+    if curvatures.ndim == 1:
+        curvatures = np.broadcast_to(curvatures, (n, curvatures.shape[0]))
+    n_steps = curvatures.shape[1]
+
+    # Escala de fuerzas y rigidez axial mínima (para la tangente de Newton)
+    eps_cu = batch.eps_cu[:, None]
+    zeros = np.zeros((n, 1))
+    pn_ref, _ = batch.integrate(eps_cu, zeros)
+    _, _, k_0 = batch.integrate(zeros, zeros, tangents=True)
+    force_tolerance = tolerance * np.abs(pn_ref)
+    k_min = 0.05 * k_0[..., 0, 0]
+
+    # Límites de deformación: aplastamiento y rotura del acero
+    eps_steel_min = -batch.eps_su[:, None]
+    d_t = batch.get_d_t()[:, None]
+
+    moment = np.full((n, n_loads, n_steps), np.nan)
+    eps_top_out = np.full((n, n_loads, n_steps), np.nan)
+    iterations = np.zeros(n_steps, dtype=int)
+    termination = np.full((n, n_loads), TERMINATIONS[0], dtype=object)
+
+    eps_top = np.zeros((n, n_loads))
+    active = np.ones((n, n_loads), dtype=bool)
+    previous = np.zeros((n, n_loads))
+
+    for step in range(n_steps):
+        curvature = np.broadcast_to(curvatures[:, step : step + 1], (n, n_loads))
+
+        # Arranque en caliente: misma profundidad del eje neutro
+        with np.errstate(divide="ignore", invalid="ignore"):
+            depth = np.where(previous > 0, eps_top / previous, 0.0)
+        eps_top = eps_top + (curvature - previous) * depth
+        previous = curvature
+
+        for iteration in range(max_iterations + 1):
+            pn, mn, k = batch.integrate(eps_top, curvature, tangents=True)
+            residual = pn - axial_loads
+            converged = np.abs(residual) <= force_tolerance
+            if iteration == max_iterations or np.all(converged | ~active):
+                break
+            stiffness = np.maximum(k[..., 0, 0], k_min)
+            eps_top = np.where(converged, eps_top, eps_top - residual / stiffness)
+        iterations[step] = iteration
+
+        crushed = eps_top > eps_cu
+        ruptured = eps_top - curvature * d_t < eps_steel_min
+        for name, failed in zip(
+            TERMINATIONS[1:], (crushed & converged, ruptured & converged, ~converged)
+        ):
+            termination[active & failed] = name
+            active &= ~failed
+
+        moment[..., step] = np.where(active, mn, np.nan)
+        eps_top_out[..., step] = np.where(active, eps_top, np.nan)
+
+        if not active.any():
+            break
+
+    result = MomentCurvatureResult(
+        curvatures, axial_loads, moment, eps_top_out, iterations, termination
+    )
+    unconverged = result.get_unconverged()
+    if unconverged.any():
+        warnings.warn(
+            f"{int(unconverged.sum())} curvas momento-curvatura se truncaron "
+            f"por falta de convergencia en {max_iterations} iteraciones.",
+            RuntimeWarning,
+        )
+    return result
@@ -0,0 +1,158 @@
+import io
+import json
+import zipfile
+
+import numpy as np
+
+from elements.load import PuntoDeCarga
+from .interaction import get_section_key
+from .schedule import ColumnSchedule, ScheduleEntry
+
+# Identificación del formato de archivo de proyecto
+PROJECT_FORMAT = "diagrama-interaccion"
+PROJECT_VERSION = 1
+PROJECT_EXTENSION = ".dip"
+
+# Miembros del archivo zip
+MANIFEST_NAME = "manifest.json"
+ARRAYS_NAME = "arrays.npz"
+
+
+def loads_to_json(load_points):
+    return [
+        {"name": p.name, "Pu": p.Pu, "Mu": p.Mu, "station": p.station}
+        for p in load_points
+    ]
+
+
+def loads_from_json(data):
+    return [
+        PuntoDeCarga(
+            name=p["name"], Pu=p["Pu"], Mu=p["Mu"], station=p.get("station", "")
+        )
+        for p in data
+    ]
+
+
+def save_project(
+    file_path: str,
+    schedule: ColumnSchedule,
+    inputs: dict = None,
+    load_points: list[PuntoDeCarga] = None,
+):
+    """
+    Guarda el proyecto en un archivo zip con un manifiesto JSON (entradas,
+    cargas y cuadro de columnas) y un .npz sin comprimir con las curvas y los
+    DCR ya calculados, de modo que al abrirlo no se recalcula nada.
+
+    Cada marca guarda sus propias entradas; las curvas se guardan una sola
+    vez por sección de cálculo distinta (ver get_section_key), aunque las
+    marcas difieran en datos que no afectan la curva (p. ej. fy del estribo).
+    """
+    curve_index = {}
+    curve_entries = []
+    entries = []
+    dcr = []
+    dcr_offsets = [0]
+
+    for entry in schedule.entries:
+        curve = None
+        if entry.is_evaluated():
+            key = get_section_key(entry.section)
+            if key not in curve_index:
+                curve_index[key] = len(curve_entries)
+                curve_entries.append(entry)
+            curve = curve_index[key]
+            dcr.append(np.asarray(entry.dcr, dtype=float))
+            dcr_offsets.append(dcr_offsets[-1] + len(entry.dcr))
+
+        entries.append(
+            {
+                "mark": entry.mark,
+                "section": entry.section,
+                "loads": loads_to_json(entry.loads),
+                "curve": curve,
+            }
+        )
+
+    # Curvas de las secciones evaluadas (todas tienen el mismo número de puntos)
+    arrays = {
+        "dcr": np.concatenate(dcr) if dcr else np.zeros(0),
+        "dcr_offsets": np.array(dcr_offsets, dtype=int),
+    }
+    if curve_entries:
+        arrays["points"] = np.stack([entry.points for entry in curve_entries])
+        arrays["phi_pn_max"] = np.array([entry.phi_pn_max for entry in curve_entries])
+
+    manifest = {
+        "format": PROJECT_FORMAT,
+        "version": PROJECT_VERSION,
+        "inputs": inputs,
+        "loads": loads_to_json(load_points or []),
+        "schedule": entries,
+    }
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+
+    with zipfile.ZipFile(file_path, "w") as archive:
+        archive.writestr(
+            MANIFEST_NAME,
+            json.dumps(manifest, indent=1),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+        # Sin comprimir: se lee directamente al abrir
+        archive.writestr(
+            ARRAYS_NAME, buffer.getvalue(), compress_type=zipfile.ZIP_STORED
+        )
+
+    return file_path
+
+
+def load_project(file_path: str, schedule: ColumnSchedule = None):
+    """
+    Abre un proyecto guardado con save_project.
+
+    Returns:
+        (schedule, inputs, load_points). Las curvas guardadas se cargan en las
+        marcas y en la caché del cuadro, sin recalcular.
+    """
+    with zipfile.ZipFile(file_path, "r") as archive:
+        manifest = json.loads(archive.read(MANIFEST_NAME).decode("utf-8"))
+        if manifest.get("format") != PROJECT_FORMAT:
+            raise ValueError(
+                "El archivo no es un proyecto de diagramas de interacción."
+            )
+        if manifest.get("version") != PROJECT_VERSION:
+            raise ValueError(
+                f"Versión de proyecto no soportada: {manifest.get('version')}"
+            )
+
+        with archive.open(ARRAYS_NAME) as member:
+            with np.load(io.BytesIO(member.read())) as data:
+                arrays = {name: data[name] for name in data.files}
+
+    if schedule is None:
+        schedule = ColumnSchedule()
+    schedule.entries = []
+
+    offsets = arrays["dcr_offsets"]
+    evaluated = 0
+    for data in manifest["schedule"]:
+        entry = ScheduleEntry(
+            data["mark"], data["section"], loads_from_json(data["loads"])
+        )
+        schedule.add_entry(entry)
+
+        k = data["curve"]
+        if k is not None:
+            points, phi_pn_max = arrays["points"][k], arrays["phi_pn_max"][k]
+            schedule.cache.put(
+                get_section_key(entry.section),
+                {"points": points, "phi_pn_max": phi_pn_max},
+            )
+            dcr = arrays["dcr"][offsets[evaluated] : offsets[evaluated + 1]]
+            schedule.set_results(len(schedule) - 1, points, phi_pn_max, dcr)
+            evaluated += 1
+
+    return schedule, manifest["inputs"], loads_from_json(manifest["loads"])
@@ -0,0 +1,419 @@
+import csv
+import glob
+import os
+import uuid
+
+import numpy as np
+
+from .capacity import calculate_load_points_dcr
+from .interaction import evaluate_parameter_rows
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+PARQUET_AVAILABLE = pyarrow is not None
+
+# Formatos de salida y extensión de sus archivos parciales
+RESULT_FORMATS = {"parquet": ".parquet", "npz": ".npz", "csv": ".csv"}
+
+# Filas por bloque escrito a disco
+RESULTS_BLOCK_SIZE = 1024
+
+# Marcas por tarea enviada a los procesos de trabajo. Cada tarea abre su
+# propio escritor, así que debe ser un múltiplo del tamaño de bloque para que
+# los bloques se llenen (write_schedule_results lo redondea)
+RESULTS_CHUNK_SIZE = 2 * RESULTS_BLOCK_SIZE
+
+# Columnas de cada fila de resultados
+RESULT_COLUMNS = (
+    "index",
+    "mark",
+    "station",
+    "phi_pn_max",
+    "max_dcr",
+    "governing",
+    "points",
+    "dcr",
+)
+
+
+def get_default_format():
+    return "parquet" if PARQUET_AVAILABLE else "npz"
+
+
+class ResultsWriter:
+    """
+    Escritor por bloques de resultados (curva, phi*Pn,max, DCR y carga
+    crítica por marca y estación). Las filas se acumulan en un búfer de tamaño
+    fijo y se escriben a disco cada block_size filas, de modo que la memoria no
+    crece con el número de columnas.
+
+    Cada escritor crea sus propios archivos parciales
+    (part-<primer índice>-<id>-...), por lo que varios procesos pueden escribir
+    en el mismo directorio sin coordinarse. Para leerlos ver iter_result_blocks.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        block_size: int = RESULTS_BLOCK_SIZE,
+        file_format: str = None,
+    ):
+        """
+        Args:
+            directory (str): Carpeta de salida (se crea si no existe)
+            block_size (int): Filas por bloque
+            file_format (str): "parquet", "npz" o "csv"; por defecto Parquet si
+                pyarrow está instalado y si no npz
+        """
+        file_format = file_format or get_default_format()
+        if file_format not in RESULT_FORMATS:
+            raise ValueError(f"Formato de resultados desconocido: {file_format}")
+        if file_format == "parquet" and not PARQUET_AVAILABLE:
+            raise ValueError("El formato Parquet requiere pyarrow.")
+
+        self.directory = directory
+        self.block_size = block_size
+        self.file_format = file_format
+        self.writer_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.blocks = 0
+        self.rows = 0
+        self.parquet_writer = None
+        self.points = None
+        self.clear_buffer()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def clear_buffer(self):
+        self.buffer = {name: [] for name in RESULT_COLUMNS if name != "points"}
+        self.count = 0
+
+    def write(
+        self,
+        index: int,
+        mark: str,
+        points,
+        phi_pn_max: float,
+        dcr=None,
+        governing: str = "",
+        station: str = "",
+    ):
+        """
+        Agrega una fila. Las curvas se copian en un arreglo preasignado del
+        tamaño del bloque.
+
+        Args:
+            index (int): Posición de la marca en el cuadro (para ordenar)
+            points (array): Curva (n_puntos x 3) en kg y kg-cm
+            dcr (array): DCR de cada carga de la marca
+        """
+        points = np.asarray(points, dtype=float)
+        if self.points is None:
+            self.points = np.empty((self.block_size,) + points.shape)
+        self.points[self.count] = points
+
+        dcr = np.zeros(0) if dcr is None else np.asarray(dcr, dtype=float)
+        self.buffer["index"].append(int(index))
+        self.buffer["mark"].append(str(mark))
+        self.buffer["station"].append(str(station))
+        self.buffer["phi_pn_max"].append(float(phi_pn_max))
+        self.buffer["max_dcr"].append(float(dcr.max()) if len(dcr) else np.nan)
+        self.buffer["governing"].append(str(governing or ""))
+        self.buffer["dcr"].append(dcr)
+        self.count += 1
+
+        if self.count == self.block_size:
+            self.flush()
+
+    def flush(self):
+        """Escribe las filas del búfer como un bloque."""
+        if self.count == 0:
+            return
+
+        block = {
+            "index": np.array(self.buffer["index"], dtype=np.int64),
+            "mark": np.array(self.buffer["mark"], dtype=str),
+            "station": np.array(self.buffer["station"], dtype=str),
+            "phi_pn_max": np.array(self.buffer["phi_pn_max"]),
+            "max_dcr": np.array(self.buffer["max_dcr"]),
+            "governing": np.array(self.buffer["governing"], dtype=str),
+            "points": self.points[: self.count],
+            "dcr": self.buffer["dcr"],
+        }
+        if self.file_format == "parquet":
+            self.write_parquet(block)
+        elif self.file_format == "npz":
+            self.write_npz(block)
+        else:
+            self.write_csv(block)
+
+        self.blocks += 1
+        self.rows += self.count
+        self.clear_buffer()
+
+    def get_block_path(self, first_index: int):
+        """
+        Nombre del archivo de un bloque. Empieza por el primer índice del
+        bloque (con ceros a la izquierda) para que el orden de los nombres siga
+        el orden de las filas.
+        """
+        extension = RESULT_FORMATS[self.file_format]
+        return os.path.join(
+            self.directory,
+            f"part-{first_index:012d}-{self.writer_id}-{self.blocks:05d}{extension}",
+        )
+
+    def write_npz(self, block):
+        # DCR de longitud variable: valores concatenados y desplazamientos
+        dcr = block.pop("dcr")
+        offsets = np.cumsum([0] + [len(x) for x in dcr])
+        np.savez(
+            self.get_block_path(block["index"][0]),
+            dcr=np.concatenate(dcr) if dcr else np.zeros(0),
+            dcr_offsets=offsets,
+            **block,
+        )
+
+    def write_csv(self, block):
+        n_points = block["points"].shape[1]
+        with open(self.get_block_path(block["index"][0]), "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(RESULT_COLUMNS + (f"n_points={n_points}",))
+            for i in range(len(block["index"])):
+                writer.writerow(
+                    [
+                        block["index"][i],
+                        block["mark"][i],
+                        block["station"][i],
+                        repr(float(block["phi_pn_max"][i])),
+                        repr(float(block["max_dcr"][i])),
+                        block["governing"][i],
+                        " ".join(map(repr, block["points"][i].ravel().tolist())),
+                        " ".join(map(repr, block["dcr"][i].tolist())),
+                    ]
+                )
+
+    def write_parquet(self, block):
+        n_values = block["points"][0].size
+        table = pyarrow.table(
+            {
+                "index": block["index"],
+                "mark": block["mark"].tolist(),
+                "station": block["station"].tolist(),
+                "phi_pn_max": block["phi_pn_max"],
+                "max_dcr": block["max_dcr"],
+                "governing": block["governing"].tolist(),
+                "points": pyarrow.FixedSizeListArray.from_arrays(
+                    block["points"].ravel(), n_values
+                ),
+                "dcr": pyarrow.array(
+                    [x.tolist() for x in block["dcr"]], pyarrow.list_(pyarrow.float64())
+                ),
+            }
+        )
+        # Un archivo por escritor, un grupo de filas por bloque
+        if self.parquet_writer is None:
+            path = self.get_block_path(block["index"][0])
+            self.parquet_writer = pyarrow.parquet.ParquetWriter(path, table.schema)
+        self.parquet_writer.write_table(table)
+
+    def close(self):
+        self.flush()
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+            self.parquet_writer = None
+
+
+def read_npz_block(file_path):
+    with np.load(file_path) as data:
+        block = {name: data[name] for name in data.files}
+    offsets = block.pop("dcr_offsets")
+    block["dcr"] = np.split(block["dcr"], offsets[1:-1])
+    return block
+
+
+def read_csv_blocks(file_path):
+    with open(file_path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        n_points = int(header[-1].split("=")[1])
+        rows = list(reader)
+
+    def floats(text):
+        return np.array([float(x) for x in text.split()])
+
+    yield {
+        "index": np.array([int(row[0]) for row in rows], dtype=np.int64),
+        "mark": np.array([row[1] for row in rows], dtype=str),
+        "station": np.array([row[2] for row in rows], dtype=str),
+        "phi_pn_max": np.array([float(row[3]) for row in rows]),
+        "max_dcr": np.array([float(row[4]) for row in rows]),
+        "governing": np.array([row[5] for row in rows], dtype=str),
+        "points": np.array([floats(row[6]) for row in rows]).reshape(
+            len(rows), n_points, 3
+        ),
+        "dcr": [floats(row[7]) for row in rows],
+    }
+
+
+def read_parquet_blocks(file_path):
+    parquet_file = pyarrow.parquet.ParquetFile(file_path)
+    for group in range(parquet_file.num_row_groups):
+        table = parquet_file.read_row_group(group)
+        points = table.column("points").combine_chunks()
+        n = table.num_rows
+        yield {
+            "index": table.column("index").to_numpy(),
+            "mark": np.array(table.column("mark").to_pylist(), dtype=str),
+            "station": np.array(table.column("station").to_pylist(), dtype=str),
+            "phi_pn_max": table.column("phi_pn_max").to_numpy(),
+            "max_dcr": table.column("max_dcr").to_numpy(),
+            "governing": np.array(table.column("governing").to_pylist(), dtype=str),
+            "points": points.flatten().to_numpy().reshape(n, -1, 3),
+            "dcr": [np.array(x) for x in table.column("dcr").to_pylist()],
+        }
+
+
+def iter_result_blocks(directory: str):
+    """
+    Recorre los bloques escritos en 'directory' (de cualquier formato), uno
+    por vez, sin cargar todo el resultado en memoria. Cada bloque es un
+    diccionario con RESULT_COLUMNS; "dcr" es una lista de arreglos.
+
+    Los archivos se recorren en el orden del primer índice de cada uno; con
+    write_schedule_results (rangos de índices disjuntos y crecientes por
+    escritor) los bloques salen en orden de 'index'.
+    """
+    for file_path in sorted(glob.glob(os.path.join(directory, "part-*"))):
+        if file_path.endswith(".npz"):
+            yield read_npz_block(file_path)
+        elif file_path.endswith(".csv"):
+            yield from read_csv_blocks(file_path)
+        elif file_path.endswith(".parquet"):
+            if not PARQUET_AVAILABLE:
+                raise ValueError(f"Leer {file_path} requiere pyarrow.")
+            yield from read_parquet_blocks(file_path)
+
+
+def read_results(directory: str):
+    """
+    Lee todos los bloques y los concatena ordenados por 'index'. Solo para
+    resultados que caben en memoria; en otro caso usar iter_result_blocks.
+    """
+    blocks = list(iter_result_blocks(directory))
+    if not blocks:
+        return {name: [] for name in RESULT_COLUMNS}
+
+    results = {}
+    for name in RESULT_COLUMNS:
+        if name == "dcr":
+            results[name] = [x for block in blocks for x in block[name]]
+        else:
+            results[name] = np.concatenate([block[name] for block in blocks])
+
+    order = np.argsort(results["index"], kind="stable")
+    for name in RESULT_COLUMNS:
+        if name == "dcr":
+            results[name] = [results[name][i] for i in order]
+        else:
+            results[name] = results[name][order]
+    return results
+
+
+def get_station_groups(loads):
+    """
+    Agrupa las cargas de una marca por estación (PuntoDeCarga.station), en el
+    orden en que aparecen. Devuelve una lista de (estación, índices); una marca
+    sin cargas produce un solo grupo vacío.
+    """
+    groups = {}
+    for i, load in enumerate(loads):
+        groups.setdefault(getattr(load, "station", ""), []).append(i)
+    return list(groups.items()) or [("", [])]
+
+
+def write_results_chunk(
+    directory: str,
+    start: int,
+    marks,
+    sections,
+    loads,
+    block_size: int = RESULTS_BLOCK_SIZE,
+    file_format: str = None,
+):
+    """
+    Evalúa un grupo de marcas y escribe una fila por marca y estación desde el
+    propio proceso de trabajo; solo devuelve el número de filas escritas. Es
+    una función de módulo para poder enviarla a procesos de trabajo.
+    """
+    points, phi_pn_max = evaluate_parameter_rows(sections)
+
+    with ResultsWriter(directory, block_size, file_format) as writer:
+        for i, mark in enumerate(marks):
+            dcr = calculate_load_points_dcr(points[i], phi_pn_max[i], loads[i])
+            for station, rows in get_station_groups(loads[i]):
+                station_dcr = dcr[rows]
+                governing = ""
+                if len(station_dcr):
+                    governing = loads[i][rows[int(np.argmax(station_dcr))]].name
+                writer.write(
+                    start + i,
+                    mark,
+                    points[i],
+                    phi_pn_max[i],
+                    station_dcr,
+                    governing,
+                    station,
+                )
+    return writer.rows
+
+
+def write_schedule_results(
+    schedule,
+    directory: str,
+    pool=None,
+    chunk_size: int = RESULTS_CHUNK_SIZE,
+    block_size: int = RESULTS_BLOCK_SIZE,
+    file_format: str = None,
+):
+    """
+    Evalúa todas las marcas de un ColumnSchedule y escribe los resultados en
+    'directory' (una fila por marca y estación de sus cargas) sin guardarlos en
+    las marcas, de modo que la memoria del proceso principal no depende del
+    tamaño del cuadro.
+
+    Returns:
+        Número de filas escritas.
+    """
+    file_format = file_format or get_default_format()
+    # Tareas de bloques completos
+    chunk_size = -(-chunk_size // block_size) * block_size
+    jobs = []
+    for start in range(0, len(schedule.entries), chunk_size):
+        entries = schedule.entries[start : start + chunk_size]
+        jobs.append(
+            (
+                directory,
+                start,
+                [entry.mark for entry in entries],
+                [entry.section for entry in entries],
+                [entry.loads for entry in entries],
+                block_size,
+                file_format,
+            )
+        )
+
+    if pool is None:
+        return sum(write_results_chunk(*job) for job in jobs)
+
+    futures = [pool.submit(write_results_chunk, *job) for job in jobs]
+    return sum(future.result() for future in futures)
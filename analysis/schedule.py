@@ -0,0 +1,175 @@
+import numpy as np
+
+from elements.column import RectangularColumn
+from elements.load import PuntoDeCarga
+from elements.material import ConcreteMaterial, SteelMaterial
+from .cache import CurveCache
+from .capacity import calculate_load_points_dcr
+from .interaction import evaluate_parameter_rows, get_section_key
+from .shared_curves import create_shared_jobs, evaluate_into_shared
+
+# Secciones por tarea enviada a los procesos de trabajo
+SCHEDULE_CHUNK_SIZE = 64
+
+# fy del estribo si la sección no lo indica (kg/cm²)
+DEFAULT_FY_TIE = 2100.0
+
+
+def build_column(section: dict, curve=None):
+    """
+    Construye un RectangularColumn a partir de un diccionario de parámetros
+    (SECTION_PARAMETERS y, opcionalmente, "fy_tie"). Si se indica 'curve'
+    ((points, phi_pn_max), p. ej. de ScheduleEntry), el diagrama no se recalcula.
+    """
+    fc = section["fc"]
+    fy = section["fy"]
+    fy_tie = section.get("fy_tie", DEFAULT_FY_TIE)
+    return RectangularColumn(
+        b=section["b"],
+        h=section["h"],
+        cover=section["cover"],
+        concrete_material=ConcreteMaterial(f"Concreto f'c={fc}", fc),
+        rebar_number=section["rebar_number"],
+        r2_bars=section["r2_bars"],
+        r3_bars=section["r3_bars"],
+        rebar_material=SteelMaterial(f"Acero fy={fy}", fy),
+        tie_rebar=section["tie_rebar"],
+        tie_material=SteelMaterial(f"Acero fy={fy_tie}", fy_tie),
+        curve=curve,
+    )
+
+
+class ScheduleEntry:
+    """Una marca del cuadro de columnas: sección, cargas y resultados."""
+
+    def __init__(self, mark: str, section: dict, loads: list[PuntoDeCarga]):
+        self.mark = mark
+        self.section = dict(section)
+        self.loads = list(loads)
+        self.clear_results()
+
+    def clear_results(self):
+        self.points = None
+        self.phi_pn_max = None
+        self.dcr = None
+
+    def is_evaluated(self):
+        return self.dcr is not None
+
+    def get_max_dcr(self):
+        if self.dcr is None or len(self.dcr) == 0:
+            return None
+        return float(np.max(self.dcr))
+
+    def get_governing_load(self):
+        if self.dcr is None or len(self.dcr) == 0:
+            return None
+        return self.loads[int(np.argmax(self.dcr))].name
+
+    def get_status(self):
+        if self.dcr is None:
+            return "Pendiente"
+        if len(self.dcr) == 0:
+            return "Sin cargas"
+        return "Cumple" if self.get_max_dcr() <= 1.0 else "No cumple"
+
+
+class ColumnSchedule:
+    """
+    Cuadro de columnas: muchas marcas, cada una con su sección y sus cargas.
+    Las curvas se guardan en caché por sección, de modo que las marcas con la
+    misma sección se calculan una sola vez.
+    """
+
+    def __init__(self, cache: CurveCache = None):
+        self.entries = []
+        self.cache = cache if cache is not None else CurveCache(max_entries=10000)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add_entry(self, entry: ScheduleEntry):
+        self.entries.append(entry)
+
+    def remove_entry(self, index: int):
+        self.entries.pop(index)
+
+    def get_jobs(self, chunk_size=SCHEDULE_CHUNK_SIZE):
+        """
+        Resuelve desde la caché las marcas cuya sección ya fue calculada y
+        devuelve las secciones pendientes (sin repetir) como tareas
+        (claves, secciones) para evaluate_parameter_rows.
+        """
+        pending = {}
+        for i, entry in enumerate(self.entries):
+            if entry.is_evaluated():
+                continue
+            key = get_section_key(entry.section)
+            cached = self.cache.get(key)
+            if cached is None:
+                pending.setdefault(key, entry.section)
+            else:
+                self.set_results(i, cached["points"], cached["phi_pn_max"])
+
+        keys = list(pending)
+        jobs = []
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start : start + chunk_size]
+            jobs.append((chunk, [pending[key] for key in chunk]))
+        return jobs
+
+    def set_results(self, index, points, phi_pn_max, dcr=None):
+        entry = self.entries[index]
+        entry.points = points
+        entry.phi_pn_max = float(phi_pn_max)
+        if dcr is None:
+            dcr = calculate_load_points_dcr(points, phi_pn_max, entry.loads)
+        entry.dcr = dcr
+
+    def apply_results(self, keys, results):
+        """
+        Guarda el resultado de evaluate_parameter_rows en la caché y en todas
+        las marcas con esas secciones. Devuelve los índices actualizados.
+        """
+        points, phi_pn_max = results
+        arrays = {}
+        for k, key in enumerate(keys):
+            arrays[key] = {"points": points[k], "phi_pn_max": np.asarray(phi_pn_max[k])}
+            self.cache.put(key, arrays[key])
+
+        updated = []
+        for i, entry in enumerate(self.entries):
+            key = get_section_key(entry.section)
+            if key in arrays and not entry.is_evaluated():
+                self.set_results(i, arrays[key]["points"], arrays[key]["phi_pn_max"])
+                updated.append(i)
+        return updated
+
+    def evaluate(self, pool=None, chunk_size=SCHEDULE_CHUNK_SIZE):
+        """
+        Evalúa todas las marcas pendientes, en un grupo de procesos si se indica.
+        Con procesos, las curvas se escriben en un bloque de memoria compartida
+        y las marcas guardan vistas de ese bloque (sin copiar ni serializar).
+        """
+        jobs = self.get_jobs(chunk_size)
+        if pool is None:
+            for keys, rows in jobs:
+                self.apply_results(keys, evaluate_parameter_rows(rows))
+            return
+        if not jobs:
+            return
+
+        block, tasks = create_shared_jobs(jobs)
+        descriptor = block.get_descriptor()
+        try:
+            futures = [
+                (keys, pool.submit(evaluate_into_shared, descriptor, start, rows))
+                for keys, start, rows in tasks
+            ]
+            for keys, future in futures:
+                start, stop = future.result()
+                self.apply_results(
+                    keys, (block.points[start:stop], block.phi_pn_max[start:stop])
+                )
+        finally:
+            block.unlink()
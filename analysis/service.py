@@ -0,0 +1,367 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+
+from elements.rebar import REBAR_INFO
+from elements.stirrup import REBAR_INFO as TIE_INFO
+from utils.units import get_unit_system
+from .cache import CurveCache
+from .capacity import calculate_dcr
+from .interaction import SECTION_PARAMETERS, evaluate_parameter_rows, get_section_key
+
+# Sección usada para calentar los procesos (importaciones y compilación)
+WARMUP_SECTION = {
+    "b": 30.0,
+    "h": 60.0,
+    "cover": 4.0,
+    "fc": 280.0,
+    "fy": 4200.0,
+    "rebar_number": "#5",
+    "tie_rebar": "#3",
+    "r2_bars": 3,
+    "r3_bars": 5,
+}
+
+# Magnitud de los parámetros numéricos de una sección (para convertir unidades)
+SECTION_QUANTITIES = {
+    "b": "length",
+    "h": "length",
+    "cover": "length",
+    "fc": "stress",
+    "fy": "stress",
+}
+
+# Barras mínimas por cara (ver RectangularColumn.generate_rebars)
+MIN_BARS_PER_FACE = 2
+
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Error"}
+
+
+def warm_worker():
+    evaluate_parameter_rows([WARMUP_SECTION])
+
+
+def get_finite(value, name: str):
+    """Convierte 'value' a float y rechaza NaN e infinitos."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{name}' debe ser un número: {value!r}")
+    if not math.isfinite(value):
+        raise ValueError(f"'{name}' debe ser un número finito: {value}")
+    return value
+
+
+def validate_section(section: dict):
+    """
+    Verifica los valores de una sección (en cm y kg/cm²) antes de incluirla
+    en un lote, para que una sección inválida no haga fallar a las demás.
+    Lanza ValueError con el primer problema encontrado.
+    """
+    missing = [name for name in SECTION_PARAMETERS if name not in section]
+    if missing:
+        raise ValueError(f"Faltan parámetros de sección: {missing}")
+
+    values = {
+        name: get_finite(section[name], name)
+        for name in ("b", "h", "cover", "fc", "fy")
+    }
+    for name in ("b", "h", "fc", "fy"):
+        if values[name] <= 0:
+            raise ValueError(f"'{name}' debe ser positivo: {values[name]}")
+    if values["cover"] < 0:
+        raise ValueError(f"'cover' no puede ser negativo: {values['cover']}")
+    if 2 * values["cover"] >= min(values["b"], values["h"]):
+        raise ValueError("El recubrimiento no deja espacio para el refuerzo.")
+
+    rebar_numbers = [x["number"] for x in REBAR_INFO]
+    if section["rebar_number"] not in rebar_numbers:
+        raise ValueError(
+            f"Barra desconocida: {section['rebar_number']}. "
+            f"Opciones: {', '.join(rebar_numbers)}"
+        )
+    tie_numbers = [x["number"] for x in TIE_INFO]
+    if section["tie_rebar"] not in tie_numbers:
+        raise ValueError(
+            f"Estribo desconocido: {section['tie_rebar']}. "
+            f"Opciones: {', '.join(tie_numbers)}"
+        )
+
+    for name in ("r2_bars", "r3_bars"):
+        bars = get_finite(section[name], name)
+        if bars != int(bars) or bars < MIN_BARS_PER_FACE:
+            raise ValueError(
+                f"'{name}' debe ser un entero mayor o igual a {MIN_BARS_PER_FACE}: "
+                f"{section[name]}"
+            )
+
+
+class SectionEvaluator:
+    """
+    Agrupa las secciones de solicitudes concurrentes en un solo lote
+    vectorizado. Las secciones ya calculadas se sirven desde la caché y las que
+    están en curso no se vuelven a calcular.
+    """
+
+    def __init__(
+        self,
+        pool: ProcessPoolExecutor = None,
+        cache: CurveCache = None,
+        batch_window: float = 0.005,
+        max_batch: int = 512,
+    ):
+        """
+        Args:
+            pool (ProcessPoolExecutor): Procesos de trabajo; si es None, los
+                lotes se evalúan en el proceso del servicio
+            cache (CurveCache): Caché de curvas residente
+            batch_window (float): Tiempo (s) que se espera para juntar solicitudes
+            max_batch (int): Secciones que disparan la evaluación inmediata
+        """
+        self.pool = pool
+        self.cache = cache if cache is not None else CurveCache(max_entries=100000)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.pending = []
+        self.in_flight = {}
+        self.flush_handle = None
+        self.batches = 0
+
+    async def evaluate(self, rows):
+        """Devuelve un diccionario {"points", "phi_pn_max"} por sección."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for row in rows:
+            key = get_section_key(row)
+            future = self.in_flight.get(key)
+            if future is None:
+                future = loop.create_future()
+                arrays = self.cache.get(key)
+                if arrays is not None:
+                    future.set_result(arrays)
+                else:
+                    self.in_flight[key] = future
+                    self.pending.append((key, row, future))
+            futures.append(future)
+
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.pending and self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.batch_window, self.flush)
+
+        return await asyncio.gather(*futures)
+
+    def flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.pending:
+            return
+
+        batch, self.pending = self.pending, []
+        asyncio.ensure_future(self.run_batch(batch))
+
+    async def evaluate_rows(self, rows):
+        if self.pool is None:
+            return evaluate_parameter_rows(rows)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, evaluate_parameter_rows, rows)
+
+    async def run_batch(self, batch):
+        rows = [row for _, row, _ in batch]
+        self.batches += 1
+        try:
+            points, phi_pn_max = await self.evaluate_rows(rows)
+            results = [
+                {"points": points[i], "phi_pn_max": np.asarray(phi_pn_max[i])}
+                for i in range(len(rows))
+            ]
+        except Exception:
+            # Se evalúa cada sección por separado para que solo fallen las
+            # solicitudes de las secciones con error
+            results = await asyncio.gather(
+                *(self.evaluate_single(row) for row in rows), return_exceptions=True
+            )
+
+        for (key, _, future), arrays in zip(batch, results):
+            self.in_flight.pop(key, None)
+            if not isinstance(arrays, Exception) and not (
+                np.isfinite(arrays["points"]).all()
+                and np.isfinite(arrays["phi_pn_max"])
+            ):
+                arrays = ValueError("La sección produjo resultados no finitos.")
+
+            if isinstance(arrays, Exception):
+                future.set_exception(arrays)
+            else:
+                self.cache.put(key, arrays)
+                future.set_result(arrays)
+
+    async def evaluate_single(self, row):
+        points, phi_pn_max = await self.evaluate_rows([row])
+        return {"points": points[0], "phi_pn_max": np.asarray(phi_pn_max[0])}
+
+
+class EvaluationService:
+    """
+    Servicio HTTP/JSON local para evaluar secciones y verificar cargas.
+
+    Rutas:
+        GET  /health    Estado del servicio y de la caché
+        POST /evaluate  {"sections": [{...}]} -> curvas
+        POST /check     {"sections": [{..., "loads": [{"name", "Pu", "Mu"}]}]}
+                        -> DCR por carga
+
+    Cada sección se describe con las claves de SECTION_PARAMETERS. El cuerpo
+    puede indicar "units" (ver utils.units.UNIT_SYSTEMS); por defecto las
+    secciones van en cm y kg/cm² y las cargas y curvas en Ton y Ton-m.
+    """
+
+    def __init__(self, evaluator: SectionEvaluator):
+        self.evaluator = evaluator
+
+    async def handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, value = line.decode("latin-1").split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length", 0))
+            body = await reader.readexactly(length) if length else b""
+            status, payload = await self.route(method, path, body)
+        except (ValueError, KeyError, TypeError) as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+
+        # JSON estricto: NaN e infinitos no son válidos en la respuesta
+        try:
+            data = json.dumps(payload, allow_nan=False).encode("utf-8")
+        except ValueError:
+            status = 500
+            data = json.dumps({"error": "Resultado no finito"}).encode("utf-8")
+        header = (
+            f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(header.encode("latin-1") + data)
+        await writer.drain()
+        writer.close()
+
+    async def route(self, method, path, body):
+        if method == "GET" and path == "/health":
+            cache = self.evaluator.cache
+            return 200, {
+                "status": "ok",
+                "cache_entries": len(cache),
+                "cache_hits": cache.hits,
+                "cache_misses": cache.misses,
+                "batches": self.evaluator.batches,
+            }
+
+        if method == "POST" and path == "/evaluate":
+            sections, units = self.get_sections(body)
+            results = await self.evaluator.evaluate(sections)
+            return 200, {
+                "units": units.name,
+                "results": [self.format_curve(r, units) for r in results],
+            }
+
+        if method == "POST" and path == "/check":
+            sections, units = self.get_sections(body)
+            results = await self.evaluator.evaluate(sections)
+            return 200, {
+                "units": units.name,
+                "results": [
+                    self.check_loads(section.get("loads", []), arrays, units)
+                    for section, arrays in zip(sections, results)
+                ],
+            }
+
+        return 404, {"error": f"Ruta desconocida: {method} {path}"}
+
+    def get_sections(self, body):
+        """Devuelve las secciones (convertidas a cm y kg/cm²) y el UnitSystem."""
+        data = json.loads(body or b"{}")
+        units = get_unit_system(data.get("units"))
+        sections = data.get("sections")
+        if not isinstance(sections, list):
+            raise ValueError("Se esperaba una lista 'sections'.")
+        converted = []
+        for i, section in enumerate(sections):
+            if not isinstance(section, dict):
+                raise ValueError(f"Sección {i}: se esperaba un objeto.")
+            try:
+                validate_section(section)
+            except ValueError as e:
+                raise ValueError(f"Sección {i}: {e}")
+            converted.append(units.values_to_internal(section, SECTION_QUANTITIES))
+        return converted, units
+
+    def format_curve(self, arrays, units):
+        return {
+            "points": units.points_from_internal(arrays["points"]).tolist(),
+            "phi_pn_max": float(units.from_internal(arrays["phi_pn_max"], "force")),
+        }
+
+    def check_loads(self, loads, arrays, units):
+        if not loads:
+            return {"dcr": [], "max_dcr": 0.0, "governing": None, "ok": True}
+
+        pu = units.to_internal(
+            [get_finite(load["Pu"], "Pu") for load in loads], "force"
+        )
+        mu = units.to_internal(
+            [get_finite(load["Mu"], "Mu") for load in loads], "moment"
+        )
+        dcr = calculate_dcr(arrays["points"], arrays["phi_pn_max"], pu, mu)
+        governing = int(np.argmax(dcr))
+        return {
+            "dcr": dcr.tolist(),
+            "max_dcr": float(dcr[governing]),
+            "governing": loads[governing].get("name", governing),
+            "ok": bool(dcr[governing] <= 1.0),
+        }
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Servicio de evaluación en http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def run(host="127.0.0.1", port=8765, workers=None):
+    """Inicia el servicio con un grupo de procesos ya calentado."""
+    workers = workers or os.cpu_count()
+    pool = ProcessPoolExecutor(max_workers=workers)
+    wait([pool.submit(warm_worker) for _ in range(workers)])
+    try:
+        service = EvaluationService(SectionEvaluator(pool))
+        asyncio.run(service.serve(host, port))
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Servicio local HTTP/JSON de diagramas de interacción"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    run(args.host, args.port, args.workers)
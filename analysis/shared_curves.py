@@ -0,0 +1,140 @@
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from .interaction import KEY_POINTS, N_STEPS, evaluate_parameter_rows
+
+
+def get_curve_size(n_steps=N_STEPS):
+    """Puntos por curva: compresión pura, n_steps, puntos característicos y tensión."""
+    return n_steps + len(KEY_POINTS) + 2
+
+
+def attach_shared_memory(name: str):
+    """
+    Abre un bloque de memoria compartida creado por otro proceso sin
+    registrarlo en el resource_tracker, de modo que solo el proceso que lo
+    creó lo elimina (si no, el rastreador del proceso de trabajo lo borraría
+    al terminar).
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+
+    # Python < 3.13: se omite el registro mientras se abre el bloque
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedArrayView:
+    """
+    Expone una región del bloque compartido como arreglo de NumPy. Los
+    arreglos guardan una referencia a este objeto (y por lo tanto al bloque),
+    de modo que la memoria no se libera mientras exista alguna vista.
+    """
+
+    def __init__(self, block, shape, offset: int = 0):
+        self.block = block
+        address = np.frombuffer(block.shm.buf, dtype=np.uint8).ctypes.data
+        self.__array_interface__ = {
+            "shape": shape,
+            "typestr": "<f8",
+            "data": (address + offset, False),
+            "version": 3,
+        }
+
+
+class SharedCurveBlock:
+    """
+    Curvas de muchas secciones en un bloque de memoria compartida:
+    points (n_secciones x n_puntos x 3) y phi_pn_max (n_secciones,), en kg y
+    kg-cm. Los procesos de trabajo escriben sus filas directamente y solo se
+    intercambian índices; el proceso principal lee los arreglos sin copiarlos.
+
+    El proceso que crea el bloque debe llamar a unlink() cuando ningún proceso
+    vaya a abrirlo de nuevo; los arreglos (y cualquier vista de ellos) siguen
+    siendo válidos mientras existan.
+    """
+
+    def __init__(self, shm, n_sections: int, n_points: int, owner: bool):
+        self.shm = shm
+        self.n_sections = n_sections
+        self.n_points = n_points
+        self.owner = owner
+
+        size = n_sections * n_points * 3
+        self.points = np.asarray(SharedArrayView(self, (n_sections, n_points, 3)))
+        self.phi_pn_max = np.asarray(
+            SharedArrayView(self, (n_sections,), offset=size * 8)
+        )
+
+    @classmethod
+    def create(cls, n_sections: int, n_points: int = None):
+        n_points = n_points or get_curve_size()
+        nbytes = max(n_sections * (n_points * 3 + 1) * 8, 1)
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        return cls(shm, n_sections, n_points, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor):
+        """Abre el bloque a partir de get_descriptor() (en otro proceso)."""
+        name, n_sections, n_points = descriptor
+        return cls(attach_shared_memory(name), n_sections, n_points, owner=False)
+
+    def get_descriptor(self):
+        """Datos mínimos (nombre y forma) para abrir el bloque en otro proceso."""
+        return (self.shm.name, self.n_sections, self.n_points)
+
+    def close(self):
+        """
+        Cierra el bloque en este proceso. Solo debe usarse cuando no quedan
+        vistas de los arreglos (p. ej. en los procesos de trabajo); si no, el
+        bloque se cierra solo al liberarse la última vista.
+        """
+        self.points = None
+        self.phi_pn_max = None
+        self.shm.close()
+
+    def unlink(self):
+        if self.owner:
+            self.shm.unlink()
+            self.owner = False
+
+
+def evaluate_into_shared(descriptor, start: int, rows, n_steps=N_STEPS):
+    """
+    Evalúa las secciones y escribe sus curvas en las filas start,
+    start + 1, ... del bloque compartido. Es una función de módulo para poder
+    enviarla a procesos de trabajo; solo devuelve el rango de filas escrito.
+    """
+    points, phi_pn_max = evaluate_parameter_rows(rows, n_steps=n_steps)
+    block = SharedCurveBlock.attach(descriptor)
+    try:
+        block.points[start : start + len(rows)] = points
+        block.phi_pn_max[start : start + len(rows)] = phi_pn_max
+    finally:
+        block.close()
+    return start, start + len(rows)
+
+
+def create_shared_jobs(jobs, n_steps=N_STEPS):
+    """
+    Reserva un bloque para todas las secciones de 'jobs' (ver
+    ColumnSchedule.get_jobs) y asigna a cada tarea su fila inicial.
+
+    Returns:
+        (block, tasks) con tasks como lista de (claves, fila inicial, secciones).
+    """
+    n_sections = sum(len(keys) for keys, _ in jobs)
+    block = SharedCurveBlock.create(n_sections, get_curve_size(n_steps))
+    tasks = []
+    start = 0
+    for keys, rows in jobs:
+        tasks.append((keys, start, rows))
+        start += len(keys)
+    return block, tasks
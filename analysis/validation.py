@@ -0,0 +1,249 @@
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from elements.rebar import REBAR_INFO
+from .cache import CurveCache
+from .interaction import (
+    NUMBA_AVAILABLE,
+    SECTION_PARAMETERS,
+    evaluate_parameter_rows,
+    get_section_key,
+)
+from .schedule import build_column
+
+# Rangos del muestreo aleatorio de secciones
+DIMENSIONS = np.arange(25.0, 105.0, 5.0)
+COVERS = (3.0, 4.0, 5.0, 6.0)
+CONCRETE_STRENGTHS = (210.0, 280.0, 350.0, 420.0, 490.0, 560.0)
+STEEL_STRENGTHS = (2800.0, 4200.0, 5200.0)
+REBAR_NUMBERS = tuple(x["number"] for x in REBAR_INFO if x["number"] != "#3")
+TIE_NUMBERS = ("#3", "#4")
+
+# Tolerancia relativa por defecto respecto de la curva de referencia
+TOLERANCE = 1e-9
+
+# Secciones con las que se calienta cada motor antes de medirlo
+WARMUP_SECTIONS = 8
+
+
+def generate_parameter_rows(n: int, seed: int = 0):
+    """
+    Genera n secciones aleatorias (diccionarios con SECTION_PARAMETERS)
+    reproducibles a partir de la semilla.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for _ in range(n):
+        rows.append(
+            {
+                "b": float(rng.choice(DIMENSIONS)),
+                "h": float(rng.choice(DIMENSIONS)),
+                "cover": float(rng.choice(COVERS)),
+                "fc": float(rng.choice(CONCRETE_STRENGTHS)),
+                "fy": float(rng.choice(STEEL_STRENGTHS)),
+                "rebar_number": str(rng.choice(REBAR_NUMBERS)),
+                "tie_rebar": str(rng.choice(TIE_NUMBERS)),
+                "r2_bars": int(rng.integers(2, 7)),
+                "r3_bars": int(rng.integers(2, 9)),
+            }
+        )
+    return rows
+
+
+def evaluate_reference(rows):
+    """Motor de referencia: un RectangularColumn por sección."""
+    points = []
+    phi_pn_max = []
+    for row in rows:
+        column = build_column(row)
+        points.append(np.array(column.points, dtype=float))
+        phi_pn_max.append(column.phi_pn_max)
+    return np.stack(points), np.array(phi_pn_max)
+
+
+def get_backend_engine(backend: str):
+    def evaluate(rows):
+        return evaluate_parameter_rows(rows, backend=backend)
+
+    return evaluate
+
+
+class CachedEngine:
+    """
+    Motor con caché: prepare() llena la caché con una primera pasada y cada
+    llamada lee todas las secciones desde la caché.
+    """
+
+    def __init__(self, backend: str = None, max_entries: int = 1000000):
+        self.backend = backend
+        self.cache = CurveCache(max_entries=max_entries)
+
+    def prepare(self, rows):
+        missing = [row for row in rows if get_section_key(row) not in self.cache]
+        if not missing:
+            return
+        points, phi_pn_max = evaluate_parameter_rows(missing, backend=self.backend)
+        for i, row in enumerate(missing):
+            self.cache.put(
+                get_section_key(row), {"points": points[i], "phi_pn_max": phi_pn_max[i]}
+            )
+
+    def __call__(self, rows):
+        self.prepare(rows)
+        arrays = [self.cache.get(get_section_key(row)) for row in rows]
+        return (
+            np.stack([a["points"] for a in arrays]),
+            np.array([a["phi_pn_max"] for a in arrays]),
+        )
+
+
+def get_engines():
+    """Motores disponibles en este entorno, en orden de comparación."""
+    engines = {
+        "reference": evaluate_reference,
+        "numpy": get_backend_engine("numpy"),
+    }
+    if NUMBA_AVAILABLE:
+        engines["numba"] = get_backend_engine("numba")
+    engines["cached"] = CachedEngine()
+    return engines
+
+
+def compare_results(reference, candidate):
+    """
+    Error relativo máximo de Mn, Pn, phi y phi*Pn,max. Cada curva se escala
+    con su valor absoluto máximo, como en check_backend_equivalence.
+    """
+    ref_points, ref_max = reference
+    points, phi_pn_max = candidate
+    if points.shape != ref_points.shape:
+        raise ValueError(
+            f"Forma de resultados distinta: {points.shape} != {ref_points.shape}"
+        )
+
+    errors = {}
+    for i, name in enumerate(("mn", "pn", "phi")):
+        ref = ref_points[..., i]
+        scale = np.abs(ref).max(axis=1, keepdims=True)
+        scale = np.where(scale > 0, scale, 1.0)
+        errors[name] = float((np.abs(points[..., i] - ref) / scale).max())
+    scale = np.where(np.abs(ref_max) > 0, np.abs(ref_max), 1.0)
+    errors["phi_pn_max"] = float((np.abs(phi_pn_max - ref_max) / scale).max())
+    return errors
+
+
+def save_golden(file_path: str, rows, points, phi_pn_max):
+    """Guarda las secciones y sus curvas de referencia en un .npz."""
+    np.savez_compressed(
+        file_path,
+        rows=np.array(json.dumps(rows)),
+        points=points,
+        phi_pn_max=phi_pn_max,
+    )
+
+
+def load_golden(file_path: str):
+    """Devuelve (rows, points, phi_pn_max) de un archivo de referencia."""
+    with np.load(file_path) as data:
+        rows = json.loads(str(data["rows"]))
+        return rows, data["points"], data["phi_pn_max"]
+
+
+def run_validation(rows, golden=None, engines=None, tolerance=TOLERANCE):
+    """
+    Evalúa las secciones con cada motor, mide el rendimiento y compara contra
+    las curvas de referencia (golden) o, si no se dan, contra el primer motor.
+
+    Returns:
+        Lista de diccionarios con engine, seconds, sections_per_second,
+        speedup (respecto del primer motor), errors y passed.
+    """
+    engines = engines if engines is not None else get_engines()
+    warmup = rows[:WARMUP_SECTIONS]
+    reports = []
+    baseline = None
+
+    for name, engine in engines.items():
+        if isinstance(engine, CachedEngine):
+            engine.prepare(rows)
+        else:
+            engine(warmup)
+
+        start = time.perf_counter()
+        result = engine(rows)
+        seconds = time.perf_counter() - start
+
+        if golden is None:
+            golden = result
+        if baseline is None:
+            baseline = seconds
+
+        errors = compare_results(golden, result)
+        reports.append(
+            {
+                "engine": name,
+                "seconds": seconds,
+                "sections_per_second": len(rows) / seconds,
+                "speedup": baseline / seconds,
+                "errors": errors,
+                "passed": max(errors.values()) <= tolerance,
+            }
+        )
+    return reports
+
+
+def format_report(reports, tolerance=TOLERANCE):
+    lines = [
+        f"{'Motor':<10} {'Tiempo (s)':>11} {'Secc./s':>10} {'Veces':>8} "
+        f"{'Error máx.':>11}  Resultado"
+    ]
+    for report in reports:
+        error = max(report["errors"].values())
+        status = "OK" if report["passed"] else f"FALLA (> {tolerance:.0e})"
+        lines.append(
+            f"{report['engine']:<10} {report['seconds']:>11.4f} "
+            f"{report['sections_per_second']:>10.0f} {report['speedup']:>7.1f}x "
+            f"{error:>11.1e}  {status}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compara los motores de cálculo contra curvas de referencia"
+    )
+    parser.add_argument("--sections", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--golden", help="Archivo .npz con las curvas de referencia")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Recalcula el archivo de referencia con el motor de referencia",
+    )
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    golden = None
+    if args.golden and not args.update:
+        rows, points, phi_pn_max = load_golden(args.golden)
+        golden = (points, phi_pn_max)
+    else:
+        rows = generate_parameter_rows(args.sections, args.seed)
+        if args.golden:
+            golden = evaluate_reference(rows)
+            save_golden(args.golden, rows, *golden)
+            print(f"Referencia guardada en {args.golden}")
+
+    reports = run_validation(rows, golden, tolerance=args.tolerance)
+    print(f"{len(rows)} secciones ({', '.join(SECTION_PARAMETERS)})")
+    print(format_report(reports, args.tolerance))
+
+    return 0 if all(report["passed"] for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,12 @@
-from .rebar import Rebar
-from .material import ConcreteMaterial, SteelMaterial
+from .rebar import REBAR_INFO, Rebar, aggregate_layers
+from .material import ConcreteMaterial, HognestadConcrete, SteelMaterial
 from .stirrup import Stirrup
 from utils.utils import get_beta
+from utils.units import get_unit_system
 from .load import PuntoDeCarga
+from analysis.interaction import SectionBatch, calculate_interaction
+from analysis.fiber import FiberSectionBatch
+from analysis.moment_curvature import calculate_moment_curvature
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
@@ -22,7 +26,21 @@ class RectangularColumn:
         rebar_material: SteelMaterial,
         tie_rebar: str,
         tie_material: SteelMaterial,
+        bar_layout=None,
+        curve=None,
     ):
+        """
+        Args:
+            bar_layout (list): Disposición explícita de barras como lista (o
+                arreglo) de (x, y, número), en cm desde la esquina inferior
+                izquierda. Permite diámetros mezclados, barras en paquete
+                (varias barras en la misma posición) y esquinas reforzadas.
+                Si se indica, reemplaza a rebar_number, r2_bars y r3_bars.
+            curve (tuple): (points, phi_pn_max) ya calculados para esta sección
+                (p. ej. de la caché de un cuadro o de un proyecto). Si se
+                indica, el diagrama no se recalcula; solo se resuelven los
+                tres puntos característicos.
+        """
         self.b = b
         self.h = h
         self.cover = cover
@@ -34,6 +52,7 @@ class RectangularColumn:
         self.rebar_material = rebar_material
         self.tie_rebar = tie_rebar
         self.stirrrup_material = tie_material
+        self.bar_layout = bar_layout
         self.points = []
 
         # Stirrup Rebar
@@ -41,13 +60,21 @@ class RectangularColumn:
 
         # Rebars
         self.rebars = []
-        self.generate_rebars()
+        if self.bar_layout is None:
+            self.generate_rebars()
+        else:
+            self.generate_layout_rebars(self.bar_layout)
+        self.assign_layers()
 
         # Calculate effective depth
         self.d = self.calculate_effective_depth()
 
         self.phi_pn_max = 0.0  # Inicializar (en kg)
 
+        if curve is not None:
+            self.set_curve(*curve)
+            return
+
         # Diagram Points
         # Punto 1: Compresión Pura
         self.calculate_point_1()
@@ -60,6 +87,10 @@ class RectangularColumn:
         # Puntos Intermedios (c variando)
         self.calculate_variable_points()
 
+        # Puntos característicos exactos (descompresión, balanceado, phi)
+        self.calculate_key_points()
+        self.points.extend(self.key_points.values())
+
         # Punto Final: Tensión Pura
         self.calculate_point_tension()
         self.points.append((self.mn_tension, self.pn_tension, 0.90))
@@ -121,18 +152,80 @@ class RectangularColumn:
             self.rebars.append(
                 Rebar(self.rebar_number, coor_x, bottom_pos_y, 1, self.rebar_material)
             )
+            coor_x += spacing_x
+
+    def generate_layout_rebars(self, bar_layout):
+        rebar_numbers = [x["number"] for x in REBAR_INFO]
+        for pos_x, pos_y, number in bar_layout:
+            number = str(number)
+            if number not in rebar_numbers:
+                raise ValueError(f"Número de barra desconocido: {number}")
+
+            rebar = Rebar(number, float(pos_x), float(pos_y), 0, self.rebar_material)
+            radius = rebar.diameter / 2
+            if not (
+                radius <= rebar.pos_x <= self.b - radius
+                and radius <= rebar.pos_y <= self.h - radius
+            ):
+                raise ValueError(
+                    f"La barra {number} en ({pos_x}, {pos_y}) queda fuera de la sección."
+                )
+            self.rebars.append(rebar)
+
+        if not self.rebars:
+            raise ValueError("La disposición de barras está vacía.")
+
+    def assign_layers(self):
+        """
+        Agrupa las barras en capas (niveles y distintos, de abajo hacia arriba)
+        y guarda la posición y el área de cada capa. La capa 1 es la inferior
+        (acero extremo en tensión).
+        """
+        pos_y = [rebar.pos_y for rebar in self.rebars]
+        area = [rebar.area for rebar in self.rebars]
+        self.layer_y, self.layer_area, self.layer_index = aggregate_layers(pos_y, area)
+        self.n_layers = len(self.layer_y)
+        for rebar, index in zip(self.rebars, self.layer_index):
+            rebar.layer = int(index) + 1
 
     def get_layer_rebars(self, layer):
         return [x for x in self.rebars if x.layer == layer]
 
     def get_layer_area(self, layer):
-        total_area = 0
-        for rebar in [x for x in self.rebars if x.layer == layer]:
-            total_area += rebar.area
-        return total_area
+        return self.layer_area[layer - 1]
 
     def get_layer_pos_y(self, layer_number):
-        return [x.pos_y for x in self.rebars if layer_number == x.layer][0]
+        return self.layer_y[layer_number - 1]
+
+    def get_layer_arrays(self):
+        """
+        Devuelve (pos_y, area) de cada capa como arreglos de NumPy,
+        ordenados por número de capa.
+        """
+        return self.layer_y.copy(), self.layer_area.copy()
+
+    def get_projected_layers(self, angle: float):
+        """
+        Capas para flexión biaxial: proyecta cada barra sobre la dirección
+        perpendicular a un eje neutro girado 'angle' radianes (0 equivale a las
+        capas en y) y agrupa las proyecciones iguales.
+
+        Returns:
+            (pos, area, index) con pos medida desde el centro de la sección.
+        """
+        pos_x = np.array([rebar.pos_x for rebar in self.rebars]) - self.b / 2
+        pos_y = np.array([rebar.pos_y for rebar in self.rebars]) - self.h / 2
+        area = [rebar.area for rebar in self.rebars]
+        return aggregate_layers(pos_x * np.sin(angle) + pos_y * np.cos(angle), area)
+
+    def get_rebar_description(self):
+        """Resumen del refuerzo, p. ej. "12#6" o "4#8+8#6"."""
+        counts = {}
+        for rebar in self.rebars:
+            counts[rebar.number] = counts.get(rebar.number, 0) + 1
+        # De mayor a menor diámetro
+        numbers = [x["number"] for x in REBAR_INFO[::-1] if x["number"] in counts]
+        return "+".join(f"{counts[number]}{number}" for number in numbers)
 
     def get_layer_position(self, c: float, layer_pos_y: float):
         if c > layer_pos_y:
@@ -163,13 +256,8 @@ class RectangularColumn:
         return es
 
     def calculate_effective_depth(self):
-        # Generic_rebar
-        generic_rebar = Rebar(self.rebar_number, 0, 0, 0, self.rebar_material)
-        # Get rebar most bottom position
-        bottom_pos_y = (
-            self.h - self.cover - self.stirrup.diameter - generic_rebar.diameter / 2
-        )
-        return bottom_pos_y
+        # Distancia de la fibra superior a la capa inferior
+        return self.h - self.get_layer_pos_y(1)
 
     def get_total_rebar_area(self):
         total_area = 0
@@ -198,67 +286,134 @@ class RectangularColumn:
         self.mn_1 = 0.0
 
     def calculate_variable_points(self):
+        # Iterar la posición del eje neutro 'c'
+        for x in range(101):
+            c = self.h - (x / 100.0) * self.h
+
+            if c < 1e-5:
+                continue
+
+            self.points.append(self.calculate_point_at_c(c))
+
+    def calculate_point_at_c(self, c: float):
+        """
+        Calcula (Mn, Pn, phi) para una profundidad del eje neutro 'c'
+        (medida desde la fibra superior).
+        """
         # Deformación unitaria de fluencia del acero
         ey = self.rebar_material.fy / self.rebar_material.Es
 
         # Dist. al acero extremo en tensión (desde fibra superior)
         d_t = self.h - self.get_layer_pos_y(1)
 
-        # Iterar la posición del eje neutro 'c'
-        for x in range(101):
-            c = self.h - (x / 100.0) * self.h
+        # --- CÁLCULO DE PHI ---
+        et = 0.003 * (d_t - c) / c
 
-            if c < 1e-5:
-                continue
+        phi = 0.65  # Default para Compresión
+
+        if et > ey:
+            if et >= 0.005:  # Tensión
+                phi = 0.90
+            else:  # Transición
+                phi = 0.65 + 0.25 * (et - ey) / (0.005 - ey)
+
+        beta = get_beta(self.concrete_material.fc)
+        a = c * beta
+
+        if a > self.h:
+            a = self.h
+
+        Ccomp = 0.85 * self.concrete_material.fc * self.b * a
+        arm_c = (self.h / 2.0) - (a / 2.0)
+        Mn_c = Ccomp * arm_c
 
-            # --- CÁLCULO DE PHI ---
-            et = 0.003 * (d_t - c) / c
+        sum_ps = 0.0
+        sum_mn_s = 0.0
 
-            phi = 0.65  # Default para Compresión
+        for i in range(1, self.n_layers + 1):
+            layer_pos_y = self.get_layer_pos_y(i)
+            area = self.get_layer_area(i)
+            d_prime = self.h - layer_pos_y
 
-            if et > ey:
-                if et >= 0.005:  # Tensión
-                    phi = 0.90
-                else:  # Transición
-                    phi = 0.65 + 0.25 * (et - ey) / (0.005 - ey)
+            es = 0.003 * (c - d_prime) / c
 
-            beta = get_beta(self.concrete_material.fc)
-            a = c * beta
+            fs = es * self.rebar_material.Es
+            if fs > self.rebar_material.fy:
+                fs = self.rebar_material.fy
+            elif fs < -self.rebar_material.fy:
+                fs = -self.rebar_material.fy
 
-            if a > self.h:
-                a = self.h
+            ps = area * fs
+            arm_s = (self.h / 2.0) - d_prime
+            Mn_s = ps * arm_s
 
-            Ccomp = 0.85 * self.concrete_material.fc * self.b * a
-            arm_c = (self.h / 2.0) - (a / 2.0)
-            Mn_c = Ccomp * arm_c
+            sum_ps += ps
+            sum_mn_s += Mn_s
 
-            sum_ps = 0.0
-            sum_mn_s = 0.0
+        pn = Ccomp + sum_ps
+        mn = Mn_c + sum_mn_s
 
-            for i in range(1, self.r3_bars + 1):
-                layer_pos_y = self.get_layer_pos_y(i)
-                area = self.get_layer_area(i)
-                d_prime = self.h - layer_pos_y
+        return (mn, pn, phi)
 
-                es = 0.003 * (c - d_prime) / c
+    def calculate_key_points(self):
+        """
+        Calcula en forma exacta los puntos característicos del diagrama,
+        resolviendo 'c' en forma cerrada a partir del perfil lineal de
+        deformaciones: c = 0.003 * d_t / (0.003 + et).
 
-                fs = es * self.rebar_material.Es
-                if fs > self.rebar_material.fy:
-                    fs = self.rebar_material.fy
-                elif fs < -self.rebar_material.fy:
-                    fs = -self.rebar_material.fy
+        - "decompression": et = 0 (c = d_t)
+        - "balanced": et = ey (inicio de la transición de phi)
+        - "tension_controlled": et = 0.005 (phi = 0.90)
+        """
+        ey = self.rebar_material.fy / self.rebar_material.Es
+        d_t = self.h - self.get_layer_pos_y(1)
 
-                ps = area * fs
-                arm_s = (self.h / 2.0) - d_prime
-                Mn_s = ps * arm_s
+        self.key_points = {}
+        for tag, et, phi in (
+            ("decompression", 0.0, 0.65),
+            ("balanced", ey, 0.65),
+            ("tension_controlled", 0.005, 0.90),
+        ):
+            c = 0.003 * d_t / (0.003 + et)
+            mn, pn, _ = self.calculate_point_at_c(c)
+            self.key_points[tag] = (mn, pn, phi)
+
+    def set_curve(self, points, phi_pn_max: float):
+        """
+        Usa un diagrama ya calculado (puntos (Mn, Pn, phi) ordenados por Pn de
+        mayor a menor, en kg y kg-cm) en lugar de recalcularlo.
+        """
+        self.points = [tuple(point) for point in np.asarray(points).tolist()]
+        self.phi_pn_max = float(phi_pn_max)
+        self.mn_1, self.pn_1, _ = self.points[0]
+        self.mn_tension, self.pn_tension, _ = self.points[-1]
+        self.calculate_key_points()
 
-                sum_ps += ps
-                sum_mn_s += Mn_s
+    def get_sensitivities(self, n_steps=100):
+        """
+        Devuelve un InteractionResult con Pn, Mn y phi en cada profundidad del
+        eje neutro y sus derivadas analíticas (dpn, dmn, dphi) respecto de
+        b, h, f'c, fy, As y c, calculadas en la misma pasada vectorizada.
+        """
+        batch = SectionBatch.from_columns([self])
+        return calculate_interaction(batch, n_steps=n_steps, derivatives=True)
 
-            pn = Ccomp + sum_ps
-            mn = Mn_c + sum_mn_s
+    def get_moment_curvature(self, axial_loads, curvatures=None, n_steps=100):
+        """
+        Curvas momento-curvatura de la columna para varias cargas axiales (kg),
+        con las mismas capas de acero y los mismos materiales de la sección.
+        Devuelve un MomentCurvatureResult de una sola sección.
 
-            self.points.append((mn, pn, phi))
+        El bloque de Whitney no es una ley continua; si el concreto es un
+        ConcreteMaterial sin ley propia se usa HognestadConcrete con el mismo f'c.
+        """
+        concrete = self.concrete_material
+        if not concrete.continuous:
+            concrete = HognestadConcrete(concrete.name, concrete.fc)
+        batch = FiberSectionBatch.from_columns([self], concrete_materials=[concrete])
+        return calculate_moment_curvature(
+            batch, axial_loads, curvatures=curvatures, n_steps=n_steps
+        )
 
     def calculate_point_tension(self):
         pn = -self.get_total_rebar_area() * self.rebar_material.fy
@@ -328,11 +483,14 @@ class RectangularColumn:
         ax=None,
         file_name="interaction_diagram.png",
         load_points: list[PuntoDeCarga] = None,
+        units=None,
     ):
         """
         Grafica el diagrama de interacción Pn-Mn (Nominal) y phi*Pn-phi*Mn (Diseño).
         Si se proporciona 'ax' (un Axes de Matplotlib), dibuja sobre él.
         Si 'ax' es None, crea una nueva figura y la guarda en 'file_name'.
+        Los ejes y los puntos de carga usan el sistema de unidades 'units'
+        (nombre o UnitSystem; por defecto Ton y Ton-m).
         """
 
         # Determina si se está creando un nuevo gráfico o dibujando en uno existente
@@ -345,40 +503,32 @@ class RectangularColumn:
             fig = ax.get_figure()
             save_and_close = False
 
-        # ... (Factores de conversión y CÁLCULOS de mn_full_nominal, pn_full_nominal, etc.
-        #      Tu código existente va aquí) ...
+        # Conversión de unidades (una sola vez, sobre el arreglo completo)
+        units = get_unit_system(units)
+        force_label = units.get_label("force")
+        moment_label = units.get_label("moment")
+        points = units.points_from_internal(self.points)
 
-        # --- (Tu código de cálculo de Pn, Mn, phi, etc. va aquí) ---
-        # Factores de conversión
-        p_factor = 1000.0  # kg a Ton
-        m_factor = 100000.0  # kg-cm a Ton-m
-
-        # 1. Separar y CONVERTIR los datos
-        mn_nominal = [p[0] / m_factor for p in self.points]
-        pn_nominal = [p[1] / p_factor for p in self.points]
-        mn_factored = [(p[0] * p[2]) / m_factor for p in self.points]  # phi * Mn
-        pn_factored = [(p[1] * p[2]) / p_factor for p in self.points]  # phi * Pn
-        phis = [p[2] for p in self.points]
+        # 1. Separar los datos
+        mn_nominal = points[:, 0]
+        pn_nominal = points[:, 1]
+        mn_factored = points[:, 0] * points[:, 2]  # phi * Mn
+        pn_factored = points[:, 1] * points[:, 2]  # phi * Pn
 
         # Aplicar el límite phi*Pn,max
-        phi_pn_max_ton = self.phi_pn_max / p_factor
-        pn_factored_capped = []
-        for pn_val in pn_factored:
-            pn_factored_capped.append(min(pn_val, phi_pn_max_ton))
-        pn_factored = pn_factored_capped
+        phi_pn_max = units.from_internal(self.phi_pn_max, "force")
+        pn_factored = np.minimum(pn_factored, phi_pn_max)
 
         # 2. Añadir el lado simétrico
         # Nominal
-        mn_sym_nominal = [-x for x in mn_nominal if x != 0]
-        pn_sym_nominal = [y for x, y in zip(mn_nominal, pn_nominal) if x != 0]
-        mn_full_nominal = mn_sym_nominal[::-1] + mn_nominal
-        pn_full_nominal = pn_sym_nominal[::-1] + pn_nominal
+        nonzero = mn_nominal != 0
+        mn_full_nominal = np.concatenate([-mn_nominal[nonzero][::-1], mn_nominal])
+        pn_full_nominal = np.concatenate([pn_nominal[nonzero][::-1], pn_nominal])
 
         # Diseño (Factored)
-        mn_sym_factored = [-x for x in mn_factored if x != 0]
-        pn_sym_factored = [y for x, y in zip(mn_factored, pn_factored) if x != 0]
-        mn_full_factored = mn_sym_factored[::-1] + mn_factored
-        pn_full_factored = pn_sym_factored[::-1] + pn_factored
+        nonzero = mn_factored != 0
+        mn_full_factored = np.concatenate([-mn_factored[nonzero][::-1], mn_factored])
+        pn_full_factored = np.concatenate([pn_factored[nonzero][::-1], pn_factored])
         # --- (Fin del código de cálculo) ---
 
         # 3. Crear el gráfico (usando 'ax')
@@ -397,26 +547,45 @@ class RectangularColumn:
         )
 
         # 4. Títulos y etiquetas
-        cant_rebar = 2 * self.r3_bars + 2 * (self.r2_bars - 2)
         ax.set_title(
-            f"Diagrama de Interacción (Columna {self.b} x {self.h} cm - {cant_rebar}{self.rebar_number})"
+            f"Diagrama de Interacción (Columna {self.b} x {self.h} cm - {self.get_rebar_description()})"
         )
-        ax.set_xlabel("Momento, M (Ton-m)")
-        ax.set_ylabel("Carga Axial, P (Ton)")
+        ax.set_xlabel(f"Momento, M ({moment_label})")
+        ax.set_ylabel(f"Carga Axial, P ({force_label})")
 
         # 5. Visualización
         ax.grid(True, linestyle="--", alpha=0.7)
         ax.axhline(0, color="black", linewidth=0.5)
         ax.axvline(0, color="black", linewidth=0.5)
 
-        # ... (Tu código de anotaciones de PHI va aquí) ...
+        # Puntos característicos exactos (sobre la curva de diseño)
+        key_labels = {
+            "decompression": "Descompresión",
+            "balanced": "Balanceado",
+            "tension_controlled": "Tensión controlada",
+        }
+        for tag, (mn, pn, phi) in self.key_points.items():
+            mu_key = units.from_internal(mn * phi, "moment")
+            pu_key = min(units.from_internal(pn * phi, "force"), phi_pn_max)
+            ax.plot(mu_key, pu_key, "o", color="red", markersize=5)
+            ax.annotate(
+                key_labels[tag],
+                (mu_key, pu_key),
+                textcoords="offset points",
+                xytext=(6, 0),
+                fontsize=8,
+                color="red",
+            )
 
         # --- INICIO: SECCIÓN CRÍTICA PARA GRAFICAR CARGAS ---
         # Esto asegura que los puntos de carga se dibujen.
         if load_points:
             for point in load_points:
                 # La etiqueta completa se usará en la leyenda
-                label = f"Carga: {point.name} (Pu={point.Pu} T, Mu={point.Mu} T-m)"
+                label = (
+                    f"Carga: {point.name} "
+                    f"(Pu={point.Pu} {force_label}, Mu={point.Mu} {moment_label})"
+                )
 
                 # Grafica el punto
                 ax.plot(
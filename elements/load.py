@@ -1,26 +1,210 @@
+import numpy as np
+
+# Tipos de carga de servicio reconocidos (ASCE 7 / ACI 318)
+LOAD_TYPES = ("D", "L", "Lr", "S", "W", "E")
+
+# Tipos de carga cuya dirección puede invertirse (se combinan con ambos signos)
+REVERSIBLE_LOAD_TYPES = ("W", "E")
+
+# Combinaciones de resistencia (ACI 318-19, Tabla 5.3.1 / ASCE 7-16, 2.3.1)
+ACI_318_COMBINATIONS = [
+    {"D": 1.4},
+    {"D": 1.2, "L": 1.6, "Lr": 0.5},
+    {"D": 1.2, "L": 1.6, "S": 0.5},
+    {"D": 1.2, "Lr": 1.6, "L": 1.0},
+    {"D": 1.2, "Lr": 1.6, "W": 0.5},
+    {"D": 1.2, "S": 1.6, "L": 1.0},
+    {"D": 1.2, "S": 1.6, "W": 0.5},
+    {"D": 1.2, "W": 1.0, "L": 1.0, "Lr": 0.5},
+    {"D": 1.2, "W": 1.0, "L": 1.0, "S": 0.5},
+    {"D": 1.2, "E": 1.0, "L": 1.0, "S": 0.2},
+    {"D": 0.9, "W": 1.0},
+    {"D": 0.9, "E": 1.0},
+]
+
+
 class Load:
-    def __init__(self, name: str, type: str, magnitude: float, sign: str):
+    def __init__(
+        self, name: str, type: str, magnitude: float, sign: str, moment: float = 0.0
+    ):
+        """
+        Caso de carga de servicio (sin factorizar).
+
+        Args:
+            name (str): Nombre del caso (ej. "Muerta")
+            type (str): Tipo de carga, uno de LOAD_TYPES (ej. "D")
+            magnitude (float): Carga axial de servicio (en **Toneladas**)
+            sign (str): "+" o "-"; se aplica a la carga axial y al momento
+            moment (float): Momento de servicio (en **Ton-m**)
+        """
+        if type not in LOAD_TYPES:
+            raise ValueError(f"Tipo de carga desconocido: {type}")
+        if sign not in ("+", "-"):
+            raise ValueError(f"Signo de carga inválido: {sign}")
+
         self.name = name
         self.type = type
         self.magnitude = magnitude
         self.sign = sign
+        self.moment = moment
+
+    def get_effects(self):
+        """Devuelve (P, M) con el signo aplicado."""
+        factor = 1.0 if self.sign == "+" else -1.0
+        return factor * self.magnitude, factor * self.moment
 
 
 class LoadCombination:
-    def __init__(self, name: str):
-        self.name
+    def __init__(self, name: str, factors: dict = None):
+        """
+        Combinación de carga: un factor por tipo de carga.
+
+        Args:
+            name (str): Nombre de la combinación (ej. "1.2D+1.6L")
+            factors (dict): Factores por tipo de carga (ej. {"D": 1.2, "L": 1.6})
+        """
+        self.name = name
+        self.factors = dict(factors or {})
+
+        for load_type in self.factors:
+            if load_type not in LOAD_TYPES:
+                raise ValueError(f"Tipo de carga desconocido: {load_type}")
+
+    def get_factor(self, load_type: str):
+        return self.factors.get(load_type, 0.0)
+
+    def get_factor_vector(self, case_types):
+        """Factores de la combinación alineados con la lista de tipos de caso."""
+        return np.array([self.get_factor(t) for t in case_types], dtype=float)
+
+
+def get_combination_name(factors: dict):
+    """Nombre legible de una combinación, ej. {"D": 1.2, "E": -1.0} -> "1.2D-1.0E"."""
+    name = ""
+    for load_type, factor in factors.items():
+        sign = "-" if factor < 0 else "+"
+        name += f"{sign}{abs(factor):.1f}{load_type}"
+    return name.lstrip("+")
+
+
+def get_aci_combinations(reversible=REVERSIBLE_LOAD_TYPES, load_types=None):
+    """
+    Devuelve las combinaciones de ACI 318-19 como objetos LoadCombination.
+
+    Las combinaciones con cargas reversibles (viento, sismo) se generan con
+    ambos signos, p. ej. "1.2D+1.0E+1.0L+0.2S" y "1.2D-1.0E+1.0L+0.2S".
+
+    Si se indican los tipos de carga presentes ('load_types'), cada
+    combinación se reduce a esos tipos y se omiten las que solo aportan
+    cargas ausentes (p. ej. "0.9D+1.0W" sin viento) y las repetidas.
+    """
+    combinations = []
+    seen = set()
+    for factors in ACI_318_COMBINATIONS:
+        if load_types is not None:
+            variable = [t for t in factors if t != "D"]
+            if variable and not any(t in load_types for t in variable):
+                continue
+            factors = {t: f for t, f in factors.items() if t in load_types}
+            if not factors:
+                continue
+
+        variants = [factors]
+        for load_type in reversible:
+            if load_type in factors:
+                flipped = dict(factors)
+                flipped[load_type] = -factors[load_type]
+                variants.append(flipped)
+
+        for variant in variants:
+            key = tuple(sorted(variant.items()))
+            if key in seen:
+                continue
+            seen.add(key)
+            combinations.append(LoadCombination(get_combination_name(variant), variant))
+    return combinations
+
+
+def get_combination_matrix(combinations: list[LoadCombination], case_types):
+    """
+    Matriz de factores (n_combos x n_casos).
+
+    Args:
+        combinations (list[LoadCombination]): Combinaciones a evaluar
+        case_types (list[str]): Tipo de carga de cada caso de servicio
+    """
+    return np.array([c.get_factor_vector(case_types) for c in combinations])
+
+
+def combine_loads(effects, case_types, combinations: list[LoadCombination] = None):
+    """
+    Calcula todas las cargas factorizadas como un producto matricial
+    casos x combinaciones.
+
+    Args:
+        effects (array): Efectos de servicio con forma (..., n_casos, 2), donde
+            la última dimensión es (P, M). Las dimensiones iniciales permiten
+            procesar los resultados de todo un edificio a la vez
+            (ej. (n_columnas, n_estaciones, n_casos, 2)).
+        case_types (list[str]): Tipo de carga de cada caso (ej. ["D", "L", "E"])
+        combinations (list[LoadCombination]): Por defecto, las de ACI 318-19
+
+    Returns:
+        array con forma (..., n_combos, 2) con (Pu, Mu) por combinación.
+    """
+    if combinations is None:
+        combinations = get_aci_combinations()
+
+    effects = np.asarray(effects, dtype=float)
+    if effects.shape[-2] != len(case_types):
+        raise ValueError(
+            f"Se esperaban {len(case_types)} casos, se recibieron {effects.shape[-2]}"
+        )
+
+    factors = get_combination_matrix(combinations, case_types)
+    # (combo, caso) x (..., caso, efecto) -> (..., combo, efecto)
+    return np.einsum("kc,...ce->...ke", factors, effects)
+
+
+def combine_service_loads(
+    loads: list[Load], combinations: list[LoadCombination] = None
+):
+    """
+    Genera los puntos de carga factorizados (PuntoDeCarga) para un conjunto de
+    casos de servicio. Varios casos del mismo tipo se suman. Por defecto se
+    usan las combinaciones de ACI 318-19 con los tipos de carga presentes.
+    """
+    if not loads:
+        raise ValueError("Se requiere al menos un caso de carga de servicio")
+
+    if combinations is None:
+        combinations = get_aci_combinations(load_types={load.type for load in loads})
+
+    case_types = [load.type for load in loads]
+    effects = np.array([load.get_effects() for load in loads], dtype=float)
+    factored = combine_loads(effects, case_types, combinations)
+
+    return [
+        PuntoDeCarga(name=combo.name, Pu=float(pu), Mu=float(mu))
+        for combo, (pu, mu) in zip(combinations, factored)
+    ]
 
 
 class PuntoDeCarga:
-    def __init__(self, name: str, Pu: float, Mu: float):
+    def __init__(self, name: str, Pu: float, Mu: float, station: str = ""):
         """
         Representa un punto de carga factorizada (Pu, Mu) para graficar.
 
         Args:
             name (str): Nombre del punto (ej. "Combo 1.2D+1.6L")
-            Pu (float): Carga axial factorizada (en **Toneladas**)
-            Mu (float): Momento flector factorizado (en **Ton-m**)
+            Pu (float): Carga axial factorizada (en **Toneladas**, o en la
+                unidad de fuerza del sistema de unidades en uso)
+            Mu (float): Momento flector factorizado (en **Ton-m**, o en la
+                unidad de momento del sistema de unidades en uso)
+            station (str): Estación de la columna a la que pertenece la carga
+                (ej. "base" o "tope"); vacía si no se distingue
         """
         self.name = name
         self.Pu = Pu
         self.Mu = Mu
+        self.station = station
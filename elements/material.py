@@ -1,9 +1,117 @@
-class Material:
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from utils.utils import get_beta
+
+# Puntos por defecto de las tablas esfuerzo-deformación
+TABLE_POINTS = 2001
+
+# Deformación máxima (en valor absoluto) de las tablas del acero; es solo el
+# rango tabulado, no una deformación de rotura (ver SteelMaterial.eps_su)
+STEEL_TABLE_STRAIN = 0.05
+
+
+class TabulatedLaw:
+    """
+    Ley esfuerzo-deformación precalculada en una malla uniforme de
+    deformaciones, evaluada por interpolación lineal con aritmética de índices
+    (sin búsqueda), para integrar fibras en forma vectorizada.
+
+    Puede contener una sola tabla (values con forma (n_malla,)) o una tabla por
+    sección (values con forma (n_secciones, n_malla)); en ese caso las
+    deformaciones deben tener forma (n_secciones, ...).
+    """
+
+    def __init__(self, start, step, values):
+        self.start = np.asarray(start, dtype=float)
+        self.step = np.asarray(step, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+
+    @classmethod
+    def stack(cls, laws):
+        """Combina varias tablas del mismo tamaño en una tabla por sección."""
+        return cls(
+            [law.start for law in laws],
+            [law.step for law in laws],
+            np.stack([law.values for law in laws]),
+        )
+
+    def get_position(self, strain):
+        """Posición (fraccionaria, sin recortar) de cada deformación en la malla."""
+        strain = np.asarray(strain, dtype=float)
+        if self.values.ndim == 1:
+            return (strain - self.start) / self.step
+        extra = (1,) * (strain.ndim - 1)
+        start = self.start.reshape(self.start.shape + extra)
+        step = self.step.reshape(self.step.shape + extra)
+        return (strain - start) / step
+
+    def locate(self, strain, pos=None):
+        n = self.values.shape[-1]
+        if pos is None:
+            pos = self.get_position(strain)
+        pos = np.clip(pos, 0.0, n - 1)
+        i = np.minimum(pos.astype(int), n - 2)
+        return i, pos - i
+
+    def lookup(self, i):
+        if self.values.ndim == 1:
+            return self.values[i], self.values[i + 1]
+        flat = i.reshape(i.shape[0], -1)
+        lo = np.take_along_axis(self.values, flat, axis=-1).reshape(i.shape)
+        hi = np.take_along_axis(self.values, flat + 1, axis=-1).reshape(i.shape)
+        return lo, hi
+
+    def stress(self, strain):
+        i, frac = self.locate(strain)
+        lo, hi = self.lookup(i)
+        return lo + frac * (hi - lo)
+
+    def stress_and_tangent(self, strain):
+        """
+        Devuelve el esfuerzo y la pendiente de la tabla en cada deformación.
+        Fuera del rango de la tabla el esfuerzo es constante y la pendiente es
+        cero.
+        """
+        pos = self.get_position(strain)
+        i, frac = self.locate(strain, pos)
+        lo, hi = self.lookup(i)
+        step = self.step
+        if self.values.ndim > 1:
+            step = step.reshape(step.shape + (1,) * (i.ndim - 1))
+        inside = (pos >= 0) & (pos <= self.values.shape[-1] - 1)
+        return lo + frac * (hi - lo), np.where(inside, (hi - lo) / step, 0.0)
+
+
+class Material(ABC):
+    # Ley continua (sin saltos de esfuerzo); las iteraciones de Newton de
+    # moment_curvature lo requieren
+    continuous = True
+
     def __init__(self, name: str):
         self.name = name
 
+    @abstractmethod
+    def stress(self, strain):
+        """Esfuerzo para un arreglo de deformaciones (compresión positiva)."""
+
+    @abstractmethod
+    def get_strain_range(self):
+        """Rango de deformaciones (mínima, máxima) que cubre la tabla."""
+
+    def tabulate(self, n_points: int = TABLE_POINTS):
+        """Precalcula la ley esfuerzo-deformación como TabulatedLaw."""
+        eps_min, eps_max = self.get_strain_range()
+        strains = np.linspace(eps_min, eps_max, n_points)
+        step = (eps_max - eps_min) / (n_points - 1)
+        return TabulatedLaw(eps_min, step, self.stress(strains))
+
 
 class ConcreteMaterial(Material):
+    # El bloque de Whitney es una ley escalonada
+    continuous = False
+
     def __init__(self, name: str, fc: float):
         self.name = name
         self.fc = fc
@@ -15,9 +123,179 @@ class ConcreteMaterial(Material):
     def get_Eu(self):
         return self.Eu
 
+    def get_Ec(self):
+        # Módulo de elasticidad (ACI 318-19, 19.2.2.1, en kg/cm²)
+        return 15100 * np.sqrt(self.fc)
+
+    def get_strain_range(self):
+        return 0.0, self.Eu
+
+    def stress(self, strain):
+        """
+        Bloque rectangular equivalente de Whitney expresado como ley
+        esfuerzo-deformación: 0.85 f'c en las fibras con deformación mayor que
+        Eu * (1 - beta1). Con un perfil lineal reproduce el modelo de
+        RectangularColumn.
+        """
+        strain = np.asarray(strain, dtype=float)
+        beta = get_beta(self.fc)
+        return np.where(strain > self.Eu * (1 - beta), 0.85 * self.fc, 0.0)
+
+
+class HognestadConcrete(ConcreteMaterial):
+    continuous = True
+
+    def __init__(
+        self,
+        name: str,
+        fc: float,
+        eps_0: float = 0.002,
+        Eu: float = 0.0038,
+        peak_factor: float = 0.85,
+    ):
+        """
+        Concreto no confinado de Hognestad: parábola hasta eps_0 y descenso
+        lineal del 15 % hasta Eu.
+
+        Args:
+            eps_0 (float): Deformación en el esfuerzo máximo
+            Eu (float): Deformación última
+            peak_factor (float): Esfuerzo máximo como fracción de f'c
+        """
+        super().__init__(name, fc)
+        self.eps_0 = eps_0
+        self.Eu = Eu
+        self.peak_factor = peak_factor
+
+    def stress(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        fc_peak = self.peak_factor * self.fc
+        ratio = strain / self.eps_0
+        ascending = fc_peak * (2 * ratio - ratio**2)
+        descending = fc_peak * (
+            1 - 0.15 * (strain - self.eps_0) / (self.Eu - self.eps_0)
+        )
+        stress = np.where(strain <= self.eps_0, ascending, descending)
+        return np.where(strain > 0, stress, 0.0)
+
+
+class ManderConcrete(ConcreteMaterial):
+    continuous = True
+
+    def __init__(
+        self,
+        name: str,
+        fc: float,
+        fcc: float = None,
+        eps_co: float = 0.002,
+        Eu: float = 0.005,
+    ):
+        """
+        Concreto de Mander et al. (1988), confinado si fcc > f'c.
+
+        Args:
+            fcc (float): Resistencia confinada (kg/cm²); por defecto f'c
+                (ver get_mander_fcc)
+            eps_co (float): Deformación en el máximo del concreto no confinado
+            Eu (float): Deformación última (rotura del primer estribo)
+        """
+        super().__init__(name, fc)
+        self.fcc = fc if fcc is None else fcc
+        self.eps_co = eps_co
+        self.Eu = Eu
+
+    def get_eps_cc(self):
+        return self.eps_co * (1 + 5 * (self.fcc / self.fc - 1))
+
+    def stress(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        eps_cc = self.get_eps_cc()
+        Ec = self.get_Ec()
+        E_sec = self.fcc / eps_cc
+        r = Ec / (Ec - E_sec)
+        x = np.maximum(strain, 0.0) / eps_cc
+        return self.fcc * x * r / (r - 1 + x**r)
+
+
+def get_mander_fcc(fc: float, fl: float):
+    """
+    Resistencia confinada de Mander para una presión lateral efectiva fl
+    (igual en ambas direcciones), en kg/cm².
+    """
+    return fc * (-1.254 + 2.254 * np.sqrt(1 + 7.94 * fl / fc) - 2 * fl / fc)
+
 
 class SteelMaterial(Material):
-    def __init__(self, name: str, fy: float):
+    def __init__(self, name: str, fy: float, eps_su: float = None):
+        """
+        Args:
+            eps_su (float): Deformación de rotura; None si no se limita (la
+                curva momento-curvatura termina solo por el concreto)
+        """
         self.name = name
         self.fy = fy
         self.Es = 2100000  # kg/cm2
+        self.eps_su = eps_su
+
+    def get_strain_range(self):
+        limit = max(STEEL_TABLE_STRAIN, self.eps_su or 0.0)
+        return -limit, limit
+
+    def stress(self, strain):
+        """Elastoplástico perfecto, igual que RectangularColumn."""
+        strain = np.asarray(strain, dtype=float)
+        return np.clip(strain * self.Es, -self.fy, self.fy)
+
+
+class BilinearSteel(SteelMaterial):
+    def __init__(self, name: str, fy: float, hardening_ratio: float = 0.01):
+        """
+        Acero bilineal: pendiente hardening_ratio * Es después de la fluencia.
+        """
+        super().__init__(name, fy)
+        self.hardening_ratio = hardening_ratio
+
+    def stress(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        ey = self.fy / self.Es
+        plastic = self.fy + self.hardening_ratio * self.Es * (np.abs(strain) - ey)
+        return np.where(
+            np.abs(strain) <= ey, strain * self.Es, np.sign(strain) * plastic
+        )
+
+
+class StrainHardeningSteel(SteelMaterial):
+    def __init__(
+        self,
+        name: str,
+        fy: float,
+        fu: float = None,
+        eps_sh: float = 0.008,
+        Eu: float = 0.09,
+    ):
+        """
+        Acero con meseta de fluencia hasta eps_sh y endurecimiento parabólico
+        hasta fu en Eu. La deformación de rotura es Eu.
+
+        Args:
+            fu (float): Resistencia última (kg/cm²); por defecto 1.5 fy
+            eps_sh (float): Deformación al inicio del endurecimiento
+            Eu (float): Deformación en fu
+        """
+        super().__init__(name, fy, eps_su=Eu)
+        self.fu = 1.5 * fy if fu is None else fu
+        self.eps_sh = eps_sh
+        self.Eu = Eu
+
+    def stress(self, strain):
+        strain = np.asarray(strain, dtype=float)
+        abs_strain = np.minimum(np.abs(strain), self.Eu)
+        ey = self.fy / self.Es
+        hardening = (
+            self.fu
+            - (self.fu - self.fy)
+            * ((self.Eu - abs_strain) / (self.Eu - self.eps_sh)) ** 2
+        )
+        stress = np.where(abs_strain <= self.eps_sh, self.fy, hardening)
+        stress = np.where(abs_strain <= ey, abs_strain * self.Es, stress)
+        return np.sign(strain) * stress
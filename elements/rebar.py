@@ -1,3 +1,5 @@
+import numpy as np
+
 from .material import SteelMaterial
 
 REBAR_INFO = [
@@ -10,6 +12,9 @@ REBAR_INFO = [
     {"number": "#9", "diameter": 3.226, "area": 6.45},
 ]
 
+# Distancia máxima (cm) entre barras de una misma capa
+LAYER_TOLERANCE = 0.01
+
 
 class Rebar:
     def __init__(
@@ -36,3 +41,35 @@ class Rebar:
 
     def get_area(self):
         return [x["area"] for x in REBAR_INFO if self.number == x["number"]][0]
+
+
+def aggregate_layers(positions, areas, tolerance: float = LAYER_TOLERANCE):
+    """
+    Agrupa barras en capas según su coordenada (y, o su proyección en flexión
+    biaxial), para que la integración recorra capas distintas y no barras.
+
+    Args:
+        positions (array): Coordenada de cada barra (cm)
+        areas (array): Área de cada barra (cm²)
+        tolerance (float): Diferencia máxima de coordenada dentro de una capa
+
+    Returns:
+        (levels, level_area, index): posición y área de cada capa, ordenadas de
+        menor a mayor coordenada, e índice de la capa de cada barra.
+    """
+    positions = np.asarray(positions, dtype=float)
+    areas = np.asarray(areas, dtype=float)
+
+    order = np.argsort(positions, kind="stable")
+    sorted_positions = positions[order]
+    new_level = np.empty(len(positions), dtype=bool)
+    new_level[:1] = True
+    new_level[1:] = np.diff(sorted_positions) > tolerance
+
+    index = np.empty(len(positions), dtype=int)
+    index[order] = np.cumsum(new_level) - 1
+
+    # Cada capa toma la coordenada de su primera barra
+    levels = sorted_positions[new_level]
+    level_area = np.bincount(index, weights=areas, minlength=len(levels))
+    return levels, level_area, index
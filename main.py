@@ -1,4 +1,6 @@
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -20,9 +22,32 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QFileDialog,
     QListWidget,
+    QTableView,
+    QAbstractItemView,
+    QHeaderView,
+    QLabel,
+    QSlider,
+)
+from PyQt5.QtGui import (
+    QPainter,
+    QPainterPath,
+    QPen,
+    QBrush,
+    QColor,
+    QPicture,
+    QPixmap,
+    QPolygonF,
+    QTransform,
+)
+from PyQt5.QtCore import (
+    Qt,
+    QRectF,
+    QPointF,
+    QAbstractTableModel,
+    QModelIndex,
+    QThread,
+    pyqtSignal,
 )
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QPolygonF
-from PyQt5.QtCore import Qt, QRectF, QPointF
 
 # --- Imports de Matplotlib para PyQt5 ---
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -31,10 +56,15 @@ from matplotlib.figure import Figure
 
 # --- Imports de tu proyecto ---
 from elements.column import RectangularColumn
-from elements.material import ConcreteMaterial, SteelMaterial
 from elements.load import PuntoDeCarga
 from elements.rebar import REBAR_INFO
 from elements.stirrup import Stirrup
+from analysis.shared_curves import create_shared_jobs, evaluate_into_shared
+from analysis.schedule import ColumnSchedule, ScheduleEntry, build_column
+from analysis.explorer import calculate_curve_family, get_display_curves
+from analysis.capacity import calculate_load_points_dcr
+from analysis.project import PROJECT_EXTENSION, load_project, save_project
+from utils.units import DEFAULT_UNITS, UNIT_SYSTEMS, convert_units, get_unit_system
 
 
 # -----------------------------------------------------------------
@@ -44,101 +74,152 @@ class ColumnSchematicWidget(QWidget):
     """
     Un widget personalizado que dibuja la sección transversal de la columna
     usando QPainter.
+
+    El dibujo se graba una sola vez por columna (QPicture para concreto y
+    estribo, un único QPainterPath para todas las barras) y se rasteriza en un
+    QPixmap del tamaño del widget. Los repintados solo copian el QPixmap; el
+    cambio de tamaño vuelve a reproducir la grabación sin recalcular nada.
     """
 
+    # Por debajo de este radio (en píxeles) las barras se dibujan como puntos
+    LOD_MIN_BAR_RADIUS = 1.5
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.column = None
         self.setMinimumHeight(300)
 
+        # Caché de dibujo (se invalida solo al cambiar la columna)
+        self.section_picture = None
+        self.bars_path = None
+        self.bar_centers = None
+        self.min_bar_radius = 0.0
+        self.pixmap = None
+
     def update_data(self, column: RectangularColumn):
         """
         Recibe el objeto RectangularColumn y actualiza el widget
         para volver a dibujarlo.
         """
         self.column = column
+        self.build_cache()
         self.update()  # Llama a paintEvent()
 
-    def paintEvent(self, event):
+    def build_cache(self):
         """
-        Se ejecuta cada vez que el widget necesita ser redibujado.
+        Graba el dibujo de la sección en coordenadas de la columna (cm).
         """
-        super().paintEvent(event)
+        self.pixmap = None
+        self.section_picture = None
+        self.bars_path = None
+        self.bar_centers = None
 
-        if not self.column:
+        if not self.column or self.column.b == 0 or self.column.h == 0:
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        b = self.column.b
+        h = self.column.h
+        cover = self.column.cover
+
+        # 1. Concreto y 2. Estribo
+        self.section_picture = QPicture()
+        painter = QPainter(self.section_picture)
+
+        pen = QPen(QColor("#a0a0a0"), 2)
+        pen.setCosmetic(True)  # Grosor en píxeles, independiente de la escala
+        painter.setPen(pen)
+        painter.setBrush(QBrush(QColor("#d0d0d0")))
+        painter.drawRect(QRectF(0, 0, b, h))
+
+        painter.setPen(QPen(QColor("#505050"), 2))  # Grosor del estribo (cm)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(QRectF(cover, cover, b - 2 * cover, h - 2 * cover))
+        painter.end()
+
+        # 3. Barras de refuerzo: un solo trazo para todas
+        self.bars_path = QPainterPath()
+        self.bar_centers = QPolygonF()
+        for rebar in self.column.rebars:
+            center = QPointF(rebar.pos_x, rebar.pos_y)
+            radius = rebar.diameter / 2
+            self.bars_path.addEllipse(center, radius, radius)
+            self.bar_centers.append(center)
+
+        self.min_bar_radius = min(
+            (rebar.diameter / 2 for rebar in self.column.rebars), default=0.0
+        )
+
+    def render_pixmap(self):
+        """
+        Rasteriza el dibujo grabado al tamaño actual del widget.
+        """
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
 
         w = self.width()
         h = self.height()
-        margin = 30  # Margen en píxeles
+        margin = min(30, 0.1 * min(w, h))  # Margen en píxeles
 
         # Calcular factor de escala para ajustar la columna al widget
         drawable_w = w - 2 * margin
         drawable_h = h - 2 * margin
-
-        # Manejar división por cero si b o h son 0
-        if self.column.b == 0 or self.column.h == 0:
-            return
-
-        scale_x = drawable_w / self.column.b
-        scale_y = drawable_h / self.column.h
-        scale = min(scale_x, scale_y)
+        scale = min(drawable_w / self.column.b, drawable_h / self.column.h)
 
         if scale <= 0:
-            return
+            return pixmap
 
         # Calcular offsets para centrar el dibujo
-        scaled_b = self.column.b * scale
-        scaled_h = self.column.h * scale
-        offset_x = (w - scaled_b) / 2
-        offset_y = (h - scaled_h) / 2
-
-        # --- Función auxiliar para transformar coordenadas ---
-        def transform(col_x, col_y):
-            # La columna (0,0) está abajo a la izquierda
-            # QPainter (0,0) está arriba a la izquierda
-            tx = offset_x + col_x * scale
-            ty = offset_y + (self.column.h - col_y) * scale  # Invertir eje Y
-            return QPointF(tx, ty)
-
-        # 1. Dibujar el Concreto (Rectángulo exterior)
-        painter.setPen(QPen(QColor("#a0a0a0"), 2))
-        painter.setBrush(QBrush(QColor("#d0d0d0")))
-        col_rect = QRectF(offset_x, offset_y, scaled_b, scaled_h)
-        painter.drawRect(col_rect)
-
-        # 2. Dibujar el Estribo (Rectángulo interior)
-        painter.setPen(QPen(QColor("#505050"), 2 * scale))  # Grosor del estribo
-        painter.setBrush(Qt.NoBrush)
-
-        stirrup_b = self.column.b - 2 * self.column.cover
-        stirrup_h = self.column.h - 2 * self.column.cover
-
-        # Coordenadas del estribo
-        p1 = transform(self.column.cover, self.column.cover)
-        p2 = transform(self.column.b - self.column.cover, self.column.cover)
-        p3 = transform(
-            self.column.b - self.column.cover, self.column.h - self.column.cover
-        )
-        p4 = transform(self.column.cover, self.column.h - self.column.cover)
-
-        polygon = QPolygonF([p1, p2, p3, p4])
-        painter.drawPolygon(polygon)
+        offset_x = (w - self.column.b * scale) / 2
+        offset_y = (h - self.column.h * scale) / 2
+
+        painter = QPainter(pixmap)
+
+        # La columna (0,0) está abajo a la izquierda
+        # QPainter (0,0) está arriba a la izquierda
+        transform = QTransform()
+        transform.translate(offset_x, offset_y + self.column.h * scale)
+        transform.scale(scale, -scale)  # Invertir eje Y
+        painter.setTransform(transform)
+
+        # Nivel de detalle: barras muy pequeñas se dibujan como puntos
+        detailed = self.min_bar_radius * scale >= self.LOD_MIN_BAR_RADIUS
+        painter.setRenderHint(QPainter.Antialiasing, detailed)
+
+        painter.drawPicture(0, 0, self.section_picture)
+
+        if detailed:
+            pen = QPen(QColor("#101010"), 1)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.setBrush(QBrush(QColor("#303030")))
+            painter.drawPath(self.bars_path)
+        else:
+            pen = QPen(QColor("#303030"), 2)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawPoints(self.bar_centers)
+
+        painter.end()
+        return pixmap
+
+    def resizeEvent(self, event):
+        self.pixmap = None
+        super().resizeEvent(event)
 
-        # 3. Dibujar las Barras de Refuerzo
-        painter.setPen(QPen(QColor("#101010"), 1))
-        painter.setBrush(QBrush(QColor("#303030")))
+    def paintEvent(self, event):
+        """
+        Se ejecuta cada vez que el widget necesita ser redibujado.
+        """
+        super().paintEvent(event)
 
-        if not self.column.rebars:
+        if self.section_picture is None:
             return
 
-        for rebar in self.column.rebars:
-            center = transform(rebar.pos_x, rebar.pos_y)
-            radius = (rebar.diameter / 2) * scale
-            painter.drawEllipse(center, radius, radius)
+        if self.pixmap is None:
+            self.pixmap = self.render_pixmap()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.pixmap)
 
 
 # -----------------------------------------------------------------
@@ -161,17 +242,80 @@ class MplCanvas(QWidget):
         layout.addWidget(self.canvas)
         self.setLayout(layout)
 
-    def plot(self, column_obj, load_points_list):
+        # Líneas del explorador (se actualizan sin redibujar la figura)
+        self.explorer_lines = None
+        self.explorer_labels = []
+
+    def plot_curves(self, nominal, design, load_points_list, title, units=None):
+        """
+        Dibuja curvas ya calculadas (ver get_display_curves) en el sistema de
+        unidades 'units'. Si ya hay curvas del explorador en la figura solo se
+        actualizan los datos de las curvas y de los puntos de carga, para que
+        la respuesta a los controles deslizantes sea inmediata.
+        """
+        units = get_unit_system(units)
+        if self.explorer_lines is None:
+            self.figure.clear()
+            ax = self.figure.add_subplot(111)
+            (nominal_line,) = ax.plot([], [], "-", label="Resistencia Nominal (Pn-Mn)")
+            (design_line,) = ax.plot(
+                [],
+                [],
+                "-",
+                color="red",
+                label="Resistencia de Diseño ($\\phi$Pn-$\\phi$Mn)",
+            )
+            (load_line,) = ax.plot(
+                [], [], "kx", markersize=10, markeredgewidth=3, linestyle=""
+            )
+            ax.grid(True, linestyle="--", alpha=0.7)
+            ax.axhline(0, color="black", linewidth=0.5)
+            ax.axvline(0, color="black", linewidth=0.5)
+            ax.legend(handles=[nominal_line, design_line], loc="lower right")
+            self.explorer_lines = (ax, nominal_line, design_line, load_line)
+            self.explorer_labels = []
+
+        ax, nominal_line, design_line, load_line = self.explorer_lines
+        nominal_line.set_data(*nominal)
+        design_line.set_data(*design)
+
+        # Puntos de carga actuales (pueden cambiar con el explorador abierto)
+        load_line.set_data(
+            [point.Mu for point in load_points_list],
+            [point.Pu for point in load_points_list],
+        )
+        for label in self.explorer_labels:
+            label.remove()
+        self.explorer_labels = [
+            ax.annotate(
+                point.name.split(" ")[0],
+                (point.Mu, point.Pu),
+                textcoords="offset points",
+                xytext=(5, 5),
+            )
+            for point in load_points_list
+        ]
+
+        ax.set_title(title)
+        ax.set_xlabel(f"Momento, M ({units.get_label('moment')})")
+        ax.set_ylabel(f"Carga Axial, P ({units.get_label('force')})")
+        ax.relim()
+        ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    def plot(self, column_obj, load_points_list, units=None):
         """
         Limpia la figura y le pide al objeto columna que dibuje
-        el diagrama en su 'Axes'.
+        el diagrama en su 'Axes', en el sistema de unidades 'units' (las
+        cargas deben estar en ese mismo sistema).
         """
         try:
             self.figure.clear()
             ax = self.figure.add_subplot(111)
+            self.explorer_lines = None
 
             # Llamamos a la función MODIFICADA de column.py
-            column_obj.plot_diagram(ax=ax, load_points=load_points_list)
+            column_obj.plot_diagram(ax=ax, load_points=load_points_list, units=units)
 
             # --- MODIFICACIÓN: ELIMINAR ESTA LÍNEA ---
             # self.figure.tight_layout() # <-- ¡Elimina o comenta esta línea!
@@ -190,6 +334,166 @@ class MplCanvas(QWidget):
         msg.exec_()
 
 
+# -----------------------------------------------------------------
+# MODELO DE TABLA DEL CUADRO DE COLUMNAS
+# -----------------------------------------------------------------
+class ScheduleTableModel(QAbstractTableModel):
+    """
+    Presenta un ColumnSchedule como tabla: una fila por marca, con su
+    sección, sus cargas y el resultado de la verificación.
+    """
+
+    HEADERS = [
+        "Marca",
+        "Sección (cm)",
+        "Refuerzo",
+        "f'c / fy",
+        "Cargas",
+        "DCR",
+        "Carga Crítica",
+        "Estado",
+    ]
+
+    STATUS_COLORS = {
+        "Cumple": QColor("#c8e6c9"),
+        "No cumple": QColor("#ffcdd2"),
+    }
+
+    def __init__(self, schedule: ColumnSchedule, parent=None):
+        super().__init__(parent)
+        self.schedule = schedule
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.schedule)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        entry = self.schedule.entries[index.row()]
+        column = index.column()
+
+        if role == Qt.BackgroundRole and column == 7:
+            return self.STATUS_COLORS.get(entry.get_status())
+
+        if role != Qt.DisplayRole:
+            return None
+
+        section = entry.section
+        if column == 0:
+            return entry.mark
+        if column == 1:
+            return f"{section['b']} x {section['h']}"
+        if column == 2:
+            cant_rebar = 2 * section["r3_bars"] + 2 * (section["r2_bars"] - 2)
+            return f"{cant_rebar}{section['rebar_number']}"
+        if column == 3:
+            return f"{section['fc']} / {section['fy']}"
+        if column == 4:
+            return str(len(entry.loads))
+        if column == 5:
+            max_dcr = entry.get_max_dcr()
+            return "" if max_dcr is None else f"{max_dcr:.3f}"
+        if column == 6:
+            return entry.get_governing_load() or ""
+        return entry.get_status()
+
+    def add_entry(self, entry: ScheduleEntry):
+        row = len(self.schedule)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.schedule.add_entry(entry)
+        self.endInsertRows()
+
+    def remove_entry(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.schedule.remove_entry(row)
+        self.endRemoveRows()
+
+    def refresh_rows(self, rows=None):
+        """Notifica a la vista que cambiaron los resultados de las filas."""
+        if rows is None:
+            rows = range(len(self.schedule))
+        for row in rows:
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+
+
+# -----------------------------------------------------------------
+# EVALUACIÓN DEL CUADRO EN SEGUNDO PLANO
+# -----------------------------------------------------------------
+class ScheduleEvaluationThread(QThread):
+    """
+    Envía los bloques de secciones pendientes a un grupo de procesos y
+    emite cada resultado a medida que termina, sin bloquear la interfaz.
+    """
+
+    chunk_evaluated = pyqtSignal(object, object)
+    evaluation_failed = pyqtSignal(str)
+
+    def __init__(self, pool: ProcessPoolExecutor, jobs, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.jobs = jobs
+
+    def run(self):
+        # Los procesos escriben las curvas en memoria compartida y solo
+        # devuelven el rango de filas; se emiten vistas del bloque, sin copias
+        block, tasks = create_shared_jobs(self.jobs)
+        descriptor = block.get_descriptor()
+        try:
+            futures = {
+                self.pool.submit(evaluate_into_shared, descriptor, start, rows): keys
+                for keys, start, rows in tasks
+            }
+            for future in as_completed(futures):
+                if self.isInterruptionRequested():
+                    # Cierre de la ventana: no se envían más bloques
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                start, stop = future.result()
+                self.chunk_evaluated.emit(
+                    futures[future],
+                    (block.points[start:stop], block.phi_pn_max[start:stop]),
+                )
+        except Exception as e:
+            self.evaluation_failed.emit(str(e))
+        finally:
+            block.unlink()
+
+
+class CurveFamilyThread(QThread):
+    """
+    Precalcula en segundo plano la familia de curvas del explorador
+    alrededor de una sección. El cálculo se hace en el grupo de procesos,
+    igual que el cuadro de columnas, y el hilo solo espera el resultado.
+    """
+
+    family_ready = pyqtSignal(object)
+    evaluation_failed = pyqtSignal(str)
+
+    def __init__(self, pool: ProcessPoolExecutor, section: dict, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.section = section
+
+    def run(self):
+        try:
+            future = self.pool.submit(calculate_curve_family, self.section)
+            self.family_ready.emit(future.result())
+        except Exception as e:
+            self.evaluation_failed.emit(str(e))
+
+
 # -----------------------------------------------------------------
 # VENTANA PRINCIPAL DE LA APLICACIÓN
 # -----------------------------------------------------------------
@@ -205,6 +509,24 @@ class AppWindow(QMainWindow):
         # --- NUEVO: Lista para almacenar los Puntos de Carga ---
         self.load_points_list = []
 
+        # Cuadro de columnas y grupo de procesos (se crea al evaluar)
+        self.schedule = ColumnSchedule()
+        self.pool = None
+        self.schedule_thread = None
+        self.schedule_error = None
+
+        # Unidades para ingresar y mostrar cargas y para los gráficos; las
+        # cargas se guardan en 'load_units' (proyectos y cuadro de columnas)
+        self.units = get_unit_system()
+        self.load_units = get_unit_system(DEFAULT_UNITS)
+
+        # Cargas del diagrama en pantalla (para redibujarlo al cambiar unidades)
+        self.plotted_loads = []
+
+        # Familia de curvas del explorador (se precalcula al generar)
+        self.curve_family = None
+        self.family_thread = None
+
         # --- Layout principal ---
         main_widget = QWidget()
         main_layout = QHBoxLayout(main_widget)
@@ -218,8 +540,17 @@ class AppWindow(QMainWindow):
         main_layout.addWidget(output_panel, 3)  # Proporción 3
 
         self.setCentralWidget(main_widget)
+        self.create_menu()
         self.show()
 
+    def create_menu(self):
+        """
+        Crea el menú Archivo para abrir y guardar proyectos.
+        """
+        file_menu = self.menuBar().addMenu("Archivo")
+        file_menu.addAction("Abrir Proyecto...", self.open_project_file)
+        file_menu.addAction("Guardar Proyecto...", self.save_project_file)
+
     def create_input_panel(self):
         """
         Crea el panel lateral izquierdo con todos los campos
@@ -294,16 +625,18 @@ class AppWindow(QMainWindow):
         loads_layout = QVBoxLayout()
 
         form_loads = QFormLayout()
+        self.units_input = QComboBox()
+        self.units_input.addItems(list(UNIT_SYSTEMS))
+        self.units_input.setCurrentText(self.units.name)
+        self.units_input.currentTextChanged.connect(self.set_units)
         self.load_name_input = QLineEdit("CM-1")
         self.load_pu_input = QDoubleSpinBox()
-        self.load_pu_input.setRange(-10000, 10000)
-        self.load_pu_input.setValue(220.5)
-        self.load_pu_input.setSuffix(" Ton")
         self.load_mu_input = QDoubleSpinBox()
-        self.load_mu_input.setRange(-10000, 10000)
+        self.set_load_input_units()
+        self.load_pu_input.setValue(220.5)
         self.load_mu_input.setValue(15.2)
-        self.load_mu_input.setSuffix(" Ton-m")
 
+        form_loads.addRow("Unidades:", self.units_input)
         form_loads.addRow("Nombre:", self.load_name_input)
         form_loads.addRow("Pu:", self.load_pu_input)
         form_loads.addRow("Mu:", self.load_mu_input)
@@ -347,21 +680,484 @@ class AppWindow(QMainWindow):
         self.tabs.addTab(self.plot_canvas, "Diagrama de Interacción")
         self.schematic_canvas = ColumnSchematicWidget(self)
         self.tabs.addTab(self.schematic_canvas, "Esquema de Sección Transversal")
+        self.tabs.addTab(self.create_schedule_panel(), "Cuadro de Columnas")
+        self.explorer_group = self.create_explorer_panel()
         self.export_button = QPushButton("Exportar Diagrama como Imagen")
         self.export_button.clicked.connect(self.export_diagram)
         self.export_button.setEnabled(False)
         layout.addWidget(self.tabs)
+        layout.addWidget(self.explorer_group)
         layout.addWidget(self.export_button)
         return panel
 
+    def create_explorer_panel(self):
+        """
+        Crea los controles del explorador: f'c, número de barra y barras por
+        cara. Cada cambio dibuja una curva de la familia precalculada, sin
+        volver a generar la columna.
+        """
+        group = QGroupBox("Explorador (f'c, barra y cantidad de barras)")
+        layout = QFormLayout(group)
+
+        self.explorer_fc_slider = QSlider(Qt.Horizontal)
+        self.explorer_bar_slider = QSlider(Qt.Horizontal)
+        self.explorer_r3_slider = QSlider(Qt.Horizontal)
+        self.explorer_fc_label = QLabel("-")
+        self.explorer_bar_label = QLabel("-")
+        self.explorer_r3_label = QLabel("-")
+        for slider, label, name in (
+            (self.explorer_fc_slider, self.explorer_fc_label, "f'c:"),
+            (self.explorer_bar_slider, self.explorer_bar_label, "Barra:"),
+            (self.explorer_r3_slider, self.explorer_r3_label, "Barras por cara (h):"),
+        ):
+            slider.valueChanged.connect(self.update_explorer)
+            row = QHBoxLayout()
+            row.addWidget(slider, 1)
+            label.setMinimumWidth(160)
+            row.addWidget(label)
+            layout.addRow(name, row)
+
+        controls = QHBoxLayout()
+        self.explorer_status = QLabel("Genere una columna para precalcular la familia.")
+        self.explorer_apply_button = QPushButton("Aplicar a la Sección")
+        self.explorer_apply_button.clicked.connect(self.apply_explorer_section)
+        controls.addWidget(self.explorer_status, 1)
+        controls.addWidget(self.explorer_apply_button)
+        layout.addRow(controls)
+
+        self.set_explorer_enabled(False)
+        return group
+
+    def set_explorer_enabled(self, enabled: bool):
+        for widget in (
+            self.explorer_fc_slider,
+            self.explorer_bar_slider,
+            self.explorer_r3_slider,
+            self.explorer_apply_button,
+        ):
+            widget.setEnabled(enabled)
+
+    def start_curve_family(self, section: dict):
+        """
+        Precalcula en segundo plano la familia de curvas alrededor de la
+        sección. Si ya hay un cálculo en curso, su resultado se descarta.
+        """
+        self.set_explorer_enabled(False)
+        self.explorer_status.setText("Precalculando familia de curvas...")
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor()
+
+        thread = CurveFamilyThread(self.pool, section, self)
+        thread.family_ready.connect(lambda family: self.on_curve_family(thread, family))
+        thread.evaluation_failed.connect(self.explorer_status.setText)
+        self.family_thread = thread
+        thread.start()
+
+    def on_curve_family(self, thread, family):
+        if thread is not self.family_thread:
+            return
+        self.curve_family = family
+        section = family.section
+        fc_min, fc_max = family.get_fc_range()
+
+        # Se fijan los rangos sin dibujar; se dibuja una vez al final
+        sliders = (
+            self.explorer_fc_slider,
+            self.explorer_bar_slider,
+            self.explorer_r3_slider,
+        )
+        for slider in sliders:
+            slider.blockSignals(True)
+        self.explorer_fc_slider.setRange(int(fc_min), int(fc_max))
+        self.explorer_fc_slider.setValue(int(round(section["fc"])))
+        self.explorer_bar_slider.setRange(0, len(family.rebar_numbers) - 1)
+        self.explorer_bar_slider.setValue(
+            family.rebar_numbers.index(section["rebar_number"])
+        )
+        self.explorer_r3_slider.setRange(
+            int(family.r3_values[0]), int(family.r3_values[-1])
+        )
+        self.explorer_r3_slider.setValue(int(section["r3_bars"]))
+        for slider in sliders:
+            slider.blockSignals(False)
+
+        self.set_explorer_enabled(True)
+        self.update_explorer()
+
+    def get_explorer_values(self):
+        family = self.curve_family
+        fc = self.explorer_fc_slider.value()
+        rebar_number = family.rebar_numbers[self.explorer_bar_slider.value()]
+        r3_bars = self.explorer_r3_slider.value()
+        return fc, rebar_number, r3_bars
+
+    def update_explorer(self):
+        """
+        Dibuja la curva de la familia que corresponde a los controles (f'c se
+        interpola entre los valores precalculados) y muestra el DCR máximo.
+        """
+        if self.curve_family is None:
+            return
+        fc, rebar_number, r3_bars = self.get_explorer_values()
+        section = self.curve_family.get_section(fc, rebar_number, r3_bars)
+        n_bars = 2 * r3_bars + 2 * (section["r2_bars"] - 2)
+        self.explorer_fc_label.setText(f"{fc} kg/cm²")
+        self.explorer_bar_label.setText(rebar_number)
+        self.explorer_r3_label.setText(f"{r3_bars} ({n_bars} barras en total)")
+
+        points, phi_pn_max = self.curve_family.get_curve(fc, rebar_number, r3_bars)
+        nominal, design = get_display_curves(points, phi_pn_max, self.units)
+        title = (
+            f"Explorador: Columna {section['b']} x {section['h']} cm - "
+            f"{n_bars} barras {rebar_number}, f'c = {fc} kg/cm²"
+        )
+        self.plot_canvas.plot_curves(
+            nominal,
+            design,
+            self.get_display_loads(self.load_points_list),
+            title,
+            self.units,
+        )
+
+        status = f"Familia de {len(self.curve_family)} secciones."
+        if self.load_points_list:
+            dcr = calculate_load_points_dcr(
+                points, phi_pn_max, self.load_points_list, self.load_units
+            )
+            status += f" DCR máximo: {dcr.max():.3f}"
+        self.explorer_status.setText(status)
+
+    def refresh_explorer_loads(self):
+        """Redibuja el explorador si está en pantalla (p. ej. al cambiar cargas)."""
+        if self.plot_canvas.explorer_lines is not None:
+            self.update_explorer()
+
+    def apply_explorer_section(self):
+        """
+        Copia la sección elegida en el explorador al panel de entradas y
+        genera la columna con el cálculo completo.
+        """
+        if self.curve_family is None:
+            return
+        section = self.curve_family.get_section(*self.get_explorer_values())
+        self.set_section_inputs(section)
+        self.run_generation()
+
+    def create_schedule_panel(self):
+        """
+        Crea la pestaña del cuadro de columnas: una tabla con muchas marcas,
+        cada una con su sección y sus cargas.
+        """
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+
+        controls = QHBoxLayout()
+        self.mark_input = QLineEdit("C-1")
+        self.add_mark_button = QPushButton("Añadir Columna Actual")
+        self.add_mark_button.clicked.connect(self.add_schedule_entry)
+        self.remove_mark_button = QPushButton("Eliminar Marca")
+        self.remove_mark_button.clicked.connect(self.remove_schedule_entry)
+        self.evaluate_schedule_button = QPushButton("Evaluar Cuadro")
+        self.evaluate_schedule_button.setStyleSheet("font-weight: bold;")
+        self.evaluate_schedule_button.clicked.connect(self.evaluate_schedule)
+
+        controls.addWidget(QLabel("Marca:"))
+        controls.addWidget(self.mark_input)
+        controls.addWidget(self.add_mark_button)
+        controls.addWidget(self.remove_mark_button)
+        controls.addStretch(1)
+        controls.addWidget(self.evaluate_schedule_button)
+
+        self.schedule_model = ScheduleTableModel(self.schedule, self)
+        self.schedule_view = QTableView()
+        self.schedule_view.setModel(self.schedule_model)
+        self.schedule_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.schedule_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.schedule_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.schedule_view.selectionModel().currentRowChanged.connect(
+            self.show_schedule_entry
+        )
+        self.schedule_view.doubleClicked.connect(
+            lambda index: self.tabs.setCurrentWidget(self.plot_canvas)
+        )
+
+        self.schedule_status = QLabel("")
+
+        layout.addLayout(controls)
+        layout.addWidget(self.schedule_view)
+        layout.addWidget(self.schedule_status)
+        return panel
+
+    def get_section_inputs(self):
+        """
+        Lee la sección definida en el panel de entradas como diccionario.
+        """
+        return {
+            "b": self.b_input.value(),
+            "h": self.h_input.value(),
+            "cover": self.cover_input.value(),
+            "fc": self.fc_input.value(),
+            "fy": self.fy_input.value(),
+            "fy_tie": self.fy_tie_input.value(),
+            "rebar_number": self.rebar_main_input.currentText(),
+            "tie_rebar": self.rebar_tie_input.currentText(),
+            "r2_bars": self.r2_bars_input.value(),
+            "r3_bars": self.r3_bars_input.value(),
+        }
+
+    def set_section_inputs(self, section: dict):
+        """
+        Escribe una sección (ver get_section_inputs) en el panel de entradas.
+        """
+        self.b_input.setValue(section["b"])
+        self.h_input.setValue(section["h"])
+        self.cover_input.setValue(section["cover"])
+        self.fc_input.setValue(section["fc"])
+        self.fy_input.setValue(section["fy"])
+        self.fy_tie_input.setValue(section.get("fy_tie", self.fy_tie_input.value()))
+        self.rebar_main_input.setCurrentText(section["rebar_number"])
+        self.rebar_tie_input.setCurrentText(section["tie_rebar"])
+        self.r2_bars_input.setValue(section["r2_bars"])
+        self.r3_bars_input.setValue(section["r3_bars"])
+
+    def set_load_points(self, load_points: list[PuntoDeCarga]):
+        self.load_points_list = list(load_points)
+        self.load_list_widget.clear()
+        for point in self.get_display_loads(self.load_points_list):
+            self.load_list_widget.addItem(self.get_load_label(point))
+        self.refresh_explorer_loads()
+
+    def set_load_input_units(self, previous=None):
+        """
+        Ajusta rangos y sufijos de Pu y Mu al sistema de unidades actual. Si
+        se indica el sistema anterior, convierte los valores ya ingresados.
+        """
+        for spin_box, quantity in (
+            (self.load_pu_input, "force"),
+            (self.load_mu_input, "moment"),
+        ):
+            value = spin_box.value()
+            limit = convert_units(10000, quantity, self.load_units, self.units)
+            spin_box.setRange(-limit, limit)
+            spin_box.setSuffix(f" {self.units.get_label(quantity)}")
+            if previous is not None:
+                spin_box.setValue(convert_units(value, quantity, previous, self.units))
+
+    def set_units(self, name: str):
+        """Cambia el sistema de unidades de las cargas y de los gráficos."""
+        previous = self.units
+        self.units = get_unit_system(name)
+        self.set_load_input_units(previous)
+        self.set_load_points(self.load_points_list)
+
+        if self.plot_canvas.explorer_lines is None and self.column_object is not None:
+            self.plot_column(self.column_object, self.plotted_loads)
+
+    def get_display_loads(self, load_points: list[PuntoDeCarga]):
+        """Cargas guardadas convertidas al sistema de unidades en pantalla."""
+        pu = convert_units(
+            [p.Pu for p in load_points], "force", self.load_units, self.units
+        )
+        mu = convert_units(
+            [p.Mu for p in load_points], "moment", self.load_units, self.units
+        )
+        return [
+            PuntoDeCarga(p.name, float(pu[i]), float(mu[i]), p.station)
+            for i, p in enumerate(load_points)
+        ]
+
+    def get_load_label(self, point: PuntoDeCarga):
+        force = self.units.get_label("force")
+        moment = self.units.get_label("moment")
+        return f"{point.name} (Pu={point.Pu:g} {force}, Mu={point.Mu:g} {moment})"
+
+    def plot_column(self, column: RectangularColumn, load_points: list[PuntoDeCarga]):
+        """Dibuja el diagrama de 'column' con sus cargas en las unidades actuales."""
+        self.plotted_loads = list(load_points)
+        self.plot_canvas.plot(column, self.get_display_loads(load_points), self.units)
+
+    def save_project_file(self):
+        """
+        Guarda entradas, cargas, cuadro de columnas y curvas calculadas.
+        """
+        filePath, _ = QFileDialog.getSaveFileName(
+            self,
+            "Guardar Proyecto",
+            f"proyecto{PROJECT_EXTENSION}",
+            f"Proyectos (*{PROJECT_EXTENSION});;Todos los archivos (*)",
+        )
+        if filePath:
+            try:
+                save_project(
+                    filePath,
+                    self.schedule,
+                    self.get_section_inputs(),
+                    self.load_points_list,
+                )
+            except Exception as e:
+                QMessageBox.critical(
+                    self, "Error al Guardar", f"No se pudo guardar el proyecto:\n{e}"
+                )
+
+    def open_project_file(self):
+        """
+        Abre un proyecto; las curvas guardadas se usan sin recalcular.
+        """
+        if self.schedule_thread is not None and self.schedule_thread.isRunning():
+            QMessageBox.warning(self, "Error", "Espere a que termine la evaluación.")
+            return
+
+        filePath, _ = QFileDialog.getOpenFileName(
+            self,
+            "Abrir Proyecto",
+            "",
+            f"Proyectos (*{PROJECT_EXTENSION});;Todos los archivos (*)",
+        )
+        if not filePath:
+            return
+
+        try:
+            schedule, inputs, load_points = load_project(
+                filePath, ColumnSchedule(cache=self.schedule.cache)
+            )
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Error al Abrir", f"No se pudo abrir el proyecto:\n{e}"
+            )
+            return
+
+        self.schedule_model.beginResetModel()
+        self.schedule = schedule
+        self.schedule_model.schedule = schedule
+        self.schedule_model.endResetModel()
+
+        if inputs:
+            self.set_section_inputs(inputs)
+        self.set_load_points(load_points)
+        self.mark_input.setText(f"C-{len(self.schedule) + 1}")
+
+    def add_schedule_entry(self):
+        """
+        Añade la sección y las cargas actuales al cuadro como una nueva marca.
+        """
+        mark = self.mark_input.text()
+        if not mark:
+            QMessageBox.warning(self, "Error", "La marca no puede estar vacía.")
+            return
+
+        entry = ScheduleEntry(mark, self.get_section_inputs(), self.load_points_list)
+        self.schedule_model.add_entry(entry)
+        self.mark_input.setText(f"C-{len(self.schedule) + 1}")
+
+    def remove_schedule_entry(self):
+        current_row = self.schedule_view.currentIndex().row()
+        if current_row >= 0:
+            self.schedule_model.remove_entry(current_row)
+
+    def evaluate_schedule(self):
+        """
+        Evalúa en segundo plano todas las marcas pendientes. Las secciones ya
+        calculadas se toman de la caché.
+        """
+        jobs = self.schedule.get_jobs()
+        self.schedule_model.refresh_rows()
+        if not jobs:
+            self.schedule_status.setText("Cuadro evaluado.")
+            return
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor()
+
+        self.set_schedule_editing(False)
+        self.schedule_error = None
+        self.schedule_status.setText(
+            f"Evaluando {sum(len(keys) for keys, _ in jobs)} secciones..."
+        )
+        self.schedule_thread = ScheduleEvaluationThread(self.pool, jobs, self)
+        self.schedule_thread.chunk_evaluated.connect(self.on_schedule_chunk)
+        self.schedule_thread.evaluation_failed.connect(self.on_schedule_failed)
+        self.schedule_thread.finished.connect(self.on_schedule_finished)
+        self.schedule_thread.start()
+
+    def on_schedule_chunk(self, keys, results):
+        updated = self.schedule.apply_results(keys, results)
+        self.schedule_model.refresh_rows(updated)
+
+        # Redibujar si la marca seleccionada acaba de evaluarse
+        current_row = self.schedule_view.currentIndex().row()
+        if current_row in updated:
+            self.show_schedule_entry(self.schedule_view.currentIndex())
+
+    def on_schedule_failed(self, message):
+        self.schedule_error = message
+        QMessageBox.critical(self, "Error de Cálculo", message)
+
+    def on_schedule_finished(self):
+        self.set_schedule_editing(True)
+        if self.schedule_error is not None:
+            self.schedule_status.setText(
+                f"Error al evaluar el cuadro: {self.schedule_error}"
+            )
+        else:
+            self.schedule_status.setText("Cuadro evaluado.")
+
+    def set_schedule_editing(self, enabled: bool):
+        self.add_mark_button.setEnabled(enabled)
+        self.remove_mark_button.setEnabled(enabled)
+        self.evaluate_schedule_button.setEnabled(enabled)
+
+    def show_schedule_entry(self, current, previous=None):
+        """
+        Dibuja el diagrama y el esquema de la marca seleccionada. Si la marca
+        ya se evaluó se usan sus curvas guardadas, sin recalcularlas.
+        """
+        row = current.row()
+        if row < 0 or row >= len(self.schedule):
+            return
+
+        entry = self.schedule.entries[row]
+        curve = None
+        if entry.points is not None:
+            curve = (entry.points, entry.phi_pn_max)
+        try:
+            self.column_object = build_column(entry.section, curve)
+        except Exception as e:
+            self.schedule_status.setText(f"Error en la marca {entry.mark}: {e}")
+            return
+
+        self.plot_column(self.column_object, entry.loads)
+        self.schematic_canvas.update_data(self.column_object)
+        self.export_button.setEnabled(True)
+
+    def closeEvent(self, event):
+        # Los hilos (cuadro de columnas y familias del explorador, incluidas
+        # las descartadas) se detienen antes de cerrar el grupo de procesos
+        threads = self.findChildren(QThread)
+        for thread in threads:
+            thread.requestInterruption()
+        for thread in threads:
+            thread.wait()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        super().closeEvent(event)
+
     # --- NUEVA FUNCIÓN ---
     def add_load_point(self):
         """
         Añade el punto de carga de los campos de entrada a la lista.
         """
         name = self.load_name_input.text()
-        pu = self.load_pu_input.value()
-        mu = self.load_mu_input.value()
+        # Conversión única al sistema en que se guardan las cargas
+        pu = float(
+            convert_units(
+                self.load_pu_input.value(), "force", self.units, self.load_units
+            )
+        )
+        mu = float(
+            convert_units(
+                self.load_mu_input.value(), "moment", self.units, self.load_units
+            )
+        )
 
         if not name:
             QMessageBox.warning(
@@ -376,13 +1172,14 @@ class AppWindow(QMainWindow):
         self.load_points_list.append(load_point)
 
         # 3. Añadirlo a la lista visual (QListWidget)
-        display_text = f"{name} (Pu={pu} T, Mu={mu} T-m)"
-        self.load_list_widget.addItem(display_text)
+        (display_point,) = self.get_display_loads([load_point])
+        self.load_list_widget.addItem(self.get_load_label(display_point))
 
         # 4. Limpiar campos
         self.load_name_input.setText(f"CM-{len(self.load_points_list) + 1}")
         self.load_pu_input.setValue(0)
         self.load_mu_input.setValue(0)
+        self.refresh_explorer_loads()
 
     # --- NUEVA FUNCIÓN ---
     def remove_load_point(self):
@@ -396,52 +1193,31 @@ class AppWindow(QMainWindow):
             self.load_list_widget.takeItem(current_row)
             # 2. Eliminar de la lista de objetos
             self.load_points_list.pop(current_row)
+            self.refresh_explorer_loads()
 
     def run_generation(self):
         """
         Función principal que se ejecuta al presionar el botón "Generar".
         """
         try:
-            # 1. Leer todos los valores de la GUI (igual que antes)
-            b = self.b_input.value()
-            h = self.h_input.value()
-            cover = self.cover_input.value()
-            fc = self.fc_input.value()
-            fy = self.fy_input.value()
-            fy_tie = self.fy_tie_input.value()
-            rebar_main = self.rebar_main_input.currentText()
-            rebar_tie = self.rebar_tie_input.currentText()
-            r3_bars = self.r3_bars_input.value()
-            r2_bars = self.r2_bars_input.value()
-
-            # 2. Crear objetos de material (igual que antes)
-            conc_mat = ConcreteMaterial(f"Concreto f'c={fc}", fc)
-            steel_mat = SteelMaterial(f"Acero fy={fy}", fy)
-            tie_mat = SteelMaterial(f"Acero fy={fy_tie}", fy_tie)
-
-            # 3. Crear el objeto RectangularColumn (igual que antes)
-            self.column_object = RectangularColumn(
-                b=b,
-                h=h,
-                cover=cover,
-                concrete_material=conc_mat,
-                rebar_number=rebar_main,
-                r2_bars=r2_bars,
-                r3_bars=r3_bars,
-                rebar_material=steel_mat,
-                tie_rebar=rebar_tie,
-                tie_material=tie_mat,
-            )
+            # 1. Leer todos los valores de la GUI
+            section = self.get_section_inputs()
+
+            # 2. Crear el objeto RectangularColumn (con sus materiales)
+            self.column_object = build_column(section)
 
-            # 4. MODIFICADO: Actualizar los gráficos
+            # 3. MODIFICADO: Actualizar los gráficos
             # Ya no creamos una lista aquí, usamos la lista de la clase
             # que se llenó con la GUI.
-            self.plot_canvas.plot(self.column_object, self.load_points_list)
+            self.plot_column(self.column_object, self.load_points_list)
             self.schematic_canvas.update_data(self.column_object)
 
-            # 5. Activar el botón de exportar (igual que antes)
+            # 4. Activar el botón de exportar (igual que antes)
             self.export_button.setEnabled(True)
 
+            # 5. Precalcular la familia de curvas del explorador
+            self.start_curve_family(section)
+
         except Exception as e:
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Critical)
@@ -0,0 +1,36 @@
+import numpy as np
+
+from analysis.cache import CurveCache
+from analysis.charts import calculate_chart_family
+
+
+def test_chart_family_uses_cache(tmp_path):
+    cache = CurveCache()
+    family = calculate_chart_family([0.7, 0.8], [4200.0], 280.0, cache=cache)
+    assert len(cache) == 2
+    assert cache.misses == 2
+
+    # Segunda llamada: todas las curvas salen de la caché, sin recalcular
+    again = calculate_chart_family([0.7, 0.8], [4200.0], 280.0, cache=cache)
+    assert cache.hits == 2
+    for key in family:
+        assert again[key]["points"] is family[key]["points"]
+
+    # Solo se calcula la combinación que falta, igual que en un lote completo
+    partial = calculate_chart_family([0.7, 0.9], [4200.0], 280.0, cache=cache)
+    assert len(cache) == 3
+    assert partial[(0.7, 4200.0)]["points"] is family[(0.7, 4200.0)]["points"]
+    fresh = calculate_chart_family([0.9], [4200.0], 280.0, cache=CurveCache())
+    np.testing.assert_allclose(
+        partial[(0.9, 4200.0)]["points"], fresh[(0.9, 4200.0)]["points"]
+    )
+
+    # Caché en disco: una caché nueva en el mismo directorio reutiliza las curvas
+    disk = CurveCache(directory=str(tmp_path))
+    calculate_chart_family([0.7], [4200.0], 280.0, cache=disk)
+    reloaded = CurveCache(directory=str(tmp_path))
+    arrays = calculate_chart_family([0.7], [4200.0], 280.0, cache=reloaded)
+    assert reloaded.hits == 1 and reloaded.misses == 0
+    np.testing.assert_allclose(
+        arrays[(0.7, 4200.0)]["points"], family[(0.7, 4200.0)]["points"]
+    )
@@ -0,0 +1,37 @@
+from analysis.detailing import check_detailing, get_failed_rules
+
+
+def test_smf_minimum_dimension_only_when_requested():
+    section = dict(
+        b=25.0, h=40.0, cover=4.0, rebar_number="#5", tie_rebar="#3", r2_bars=2
+    )
+
+    ordinary = check_detailing(**section, r3_bars=3)
+    assert ordinary["all"][0]
+    assert "smf_min_dimension" not in ordinary
+
+    special = check_detailing(**section, r3_bars=3, special_moment_frame=True)
+    assert not special["all"][0]
+    assert get_failed_rules(special, 0) == ["smf_min_dimension"]
+
+
+def test_corner_bars_need_no_tie_support():
+    # Caras solo con barras de esquina: no hay barras sin soporte lateral
+    corner_only = check_detailing(
+        b=50.0,
+        h=50.0,
+        cover=4.0,
+        rebar_number="#9",
+        tie_rebar="#3",
+        r2_bars=2,
+        r3_bars=2,
+    )
+    assert corner_only["all"][0]
+
+    # Caras cortas sin barras intermedias; las caras largas sí se verifican
+    long_faces = dict(
+        b=40.0, h=60.0, cover=4.0, rebar_number="#8", tie_rebar="#3", r2_bars=2
+    )
+    assert check_detailing(**long_faces, r3_bars=4)["all"][0]
+    sparse = check_detailing(**long_faces, r3_bars=3)
+    assert get_failed_rules(sparse, 0) == ["tie_support"]
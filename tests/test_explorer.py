@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from analysis.explorer import calculate_curve_family, get_family_axes
+
+SECTION = {
+    "b": 30.0,
+    "h": 50.0,
+    "cover": 4.0,
+    "fc": 280.0,
+    "fy": 4200.0,
+    "rebar_number": "#6",
+    "tie_rebar": "#3",
+    "r2_bars": 3,
+    "r3_bars": 4,
+}
+
+
+def test_family_axes_around_section():
+    fc_values, rebar_numbers, r3_values = get_family_axes(SECTION)
+    assert SECTION["fc"] in fc_values
+    assert SECTION["rebar_number"] in rebar_numbers
+    assert r3_values[0] == 2 and SECTION["r3_bars"] in r3_values
+
+
+def test_curve_interpolation():
+    family = calculate_curve_family(
+        SECTION, fc_values=[245.0, 280.0, 315.0], rebar_numbers=["#5", "#6"]
+    )
+    assert len(family) == 3 * 2 * len(family.r3_values)
+
+    # En los valores de la malla se devuelve la curva calculada
+    points, phi_pn_max = family.get_curve(280.0, "#6", 4)
+    np.testing.assert_array_equal(points, family.points[1, 1, 2])
+    assert phi_pn_max == family.phi_pn_max[1, 1, 2]
+
+    # Entre dos valores de f'c, interpolación lineal punto a punto
+    points, phi_pn_max = family.get_curve(297.5, "#5", 3)
+    np.testing.assert_allclose(
+        points, (family.points[1, 0, 1] + family.points[2, 0, 1]) / 2
+    )
+    assert phi_pn_max == pytest.approx(family.phi_pn_max[1:, 0, 1].mean())
+
+    # Fuera del rango se usa el extremo
+    np.testing.assert_array_equal(
+        family.get_curve(400.0, "#5", 3)[0], family.points[-1, 0, 1]
+    )
+
+    with pytest.raises(ValueError):
+        family.get_curve(280.0, "#6", 20)
+    assert family.get_section(297.5, "#5", 3)["r3_bars"] == 3
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from analysis.fiber import FiberSectionBatch, calculate_fiber_interaction
+from analysis.schedule import build_column
+from analysis.validation import generate_parameter_rows
+from elements.material import Material
+
+
+def test_pure_compression_deducts_displaced_concrete():
+    columns = [build_column(row) for row in generate_parameter_rows(20, seed=2)]
+    result = calculate_fiber_interaction(FiberSectionBatch.from_columns(columns))
+
+    # ACI 318-19, 22.4.2.2: 0.85 f'c (Ag - Ast) + fy Ast
+    expected = np.array([column.pn_1 for column in columns])
+    np.testing.assert_allclose(result.pn_0, expected, rtol=1e-12)
+
+
+def test_material_is_abstract():
+    with pytest.raises(TypeError):
+        Material("Sin ley")
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from analysis.interaction import (
+    BACKENDS,
+    KEY_POINTS,
+    NUMBA_AVAILABLE,
+    SENSITIVITY_PARAMETERS,
+    SectionBatch,
+    calculate_interaction,
+    calculate_points_at_c,
+    check_backend_equivalence,
+    get_c_values,
+)
+from analysis.validation import generate_parameter_rows
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_equivalence(backend):
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        pytest.skip("Numba no está instalado")
+
+    batch = SectionBatch.from_parameter_rows(generate_parameter_rows(300, seed=1))
+    errors = check_backend_equivalence(batch, backend)
+
+    assert set(errors) == {"pn", "mn", "phi"}
+    assert all(np.isfinite(value) for value in errors.values())
+    assert max(errors.values()) < 1e-12
+
+
+def perturb(batch, name, delta):
+    """Copia del lote con el parámetro 'name' desplazado en 'delta'."""
+    values = {
+        "b": batch.b,
+        "h": batch.h,
+        "fc": batch.fc,
+        "fy": batch.fy,
+        "layer_y": batch.layer_y,
+        "layer_area": batch.layer_area,
+    }
+    if name == "h":
+        values["h"] = batch.h + delta
+        values["layer_y"] = batch.layer_y + delta * batch.layer_dy_dh
+    elif name == "As":
+        total_area = batch.get_total_area()[:, None]
+        values["layer_area"] = batch.layer_area * (1 + delta / total_area)
+    else:
+        values[name] = values[name] + delta
+    return SectionBatch(Es=batch.Es, layer_dy_dh=batch.layer_dy_dh, **values)
+
+
+@pytest.mark.parametrize("name", SENSITIVITY_PARAMETERS)
+def test_sensitivities_match_finite_differences(name):
+    # f'c entre 280 y 560 kg/cm² para quedar en el tramo lineal de beta1
+    rows = [dict(row, fc=350.0) for row in generate_parameter_rows(40, seed=5)]
+    batch = SectionBatch.from_parameter_rows(rows)
+    c = get_c_values(batch.h, 40)[:, 1:-1]
+    result = calculate_points_at_c(batch, c, derivatives=True)
+    step = {"b": 1e-3, "h": 1e-3, "fc": 1e-2, "fy": 1e-1, "As": 1e-4, "c": 1e-5}[name]
+
+    def evaluate(delta):
+        if name == "c":
+            return calculate_points_at_c(batch, c + delta)[:3]
+        return calculate_points_at_c(perturb(batch, name, delta), c)[:3]
+
+    plus, center, minus = evaluate(step), evaluate(0.0), evaluate(-step)
+    for k, derivative in enumerate(result[3:]):
+        forward = (plus[k] - center[k]) / step
+        backward = (center[k] - minus[k]) / step
+        central = (plus[k] - minus[k]) / (2 * step)
+
+        # Solo puntos alejados de los quiebres (fluencia, transición de phi,
+        # bloque completo), donde ambas diferencias laterales coinciden
+        scale = np.abs(central).max() + 1.0
+        smooth = np.abs(forward - backward) < 1e-6 * scale
+        assert smooth.mean() > 0.5
+        np.testing.assert_allclose(
+            derivative[name][smooth], central[smooth], rtol=1e-5, atol=1e-6 * scale
+        )
+
+
+def test_key_points_match_sweep():
+    batch = SectionBatch.from_parameter_rows(generate_parameter_rows(20, seed=3))
+    result = calculate_interaction(batch)
+
+    # Barrido fino de c: phi = 0.65 para c >= c_b y phi = 0.90 para c <= c_t
+    c = np.linspace(0.01, 1.0, 20001)[None, :] * batch.h[:, None]
+    pn, mn, phi, _, _, _ = calculate_points_at_c(batch, c)
+    step = c[:, 1] - c[:, 0]
+
+    balanced = c[np.arange(len(c)), np.argmax(phi <= 0.65, axis=1)]
+    tension_controlled = c[np.arange(len(c)), np.argmin(phi >= 0.90, axis=1) - 1]
+    np.testing.assert_array_less(np.abs(result.key_c[:, 1] - balanced), step)
+    np.testing.assert_array_less(np.abs(result.key_c[:, 2] - tension_controlled), step)
+
+    # Descompresión: deformación nula en la capa de acero más traccionada
+    # (las capas de relleno tienen área nula)
+    layer_y = np.where(batch.layer_area > 0, batch.layer_y, np.inf)
+    d_t = batch.h - layer_y.min(axis=1)
+    np.testing.assert_allclose(result.key_c[:, 0], d_t)
+
+    # Los puntos característicos están sobre la curva del barrido (salvo el
+    # error de interpolación lineal entre puntos del barrido)
+    for i, tag in enumerate(KEY_POINTS):
+        key = result.get_key_point(tag)
+        for j in range(len(c)):
+            np.testing.assert_allclose(
+                key[j, :2],
+                [
+                    np.interp(result.key_c[j, i], c[j], mn[j]),
+                    np.interp(result.key_c[j, i], c[j], pn[j]),
+                ],
+                rtol=1e-4,
+                atol=1e-6 * batch.fc[j] * batch.b[j] * batch.h[j] ** 2,
+            )
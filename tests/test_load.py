@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from elements.load import (
+    Load,
+    LoadCombination,
+    combine_loads,
+    combine_service_loads,
+    get_aci_combinations,
+)
+
+
+def test_combine_loads_matches_loop_over_combinations():
+    rng = np.random.default_rng(0)
+    case_types = ["D", "L", "W", "E"]
+    effects = rng.normal(size=(5, 3, len(case_types), 2))
+    combinations = get_aci_combinations()
+
+    factored = combine_loads(effects, case_types, combinations)
+
+    assert factored.shape == (5, 3, len(combinations), 2)
+    for k, combo in enumerate(combinations):
+        expected = sum(
+            combo.get_factor(t) * effects[..., c, :] for c, t in enumerate(case_types)
+        )
+        np.testing.assert_allclose(factored[..., k, :], expected)
+
+
+def test_combine_service_loads_sums_cases_of_the_same_type():
+    loads = [
+        Load("Muerta", "D", 10.0, "+", moment=1.0),
+        Load("Acabados", "D", 2.0, "+"),
+        Load("Sismo", "E", 4.0, "-", moment=3.0),
+    ]
+    combos = [LoadCombination("1.2D+1.0E", {"D": 1.2, "E": 1.0})]
+
+    (point,) = combine_service_loads(loads, combos)
+
+    assert point.Pu == pytest.approx(1.2 * 12.0 - 4.0)
+    assert point.Mu == pytest.approx(1.2 * 1.0 - 3.0)
+
+
+def test_absent_load_types_do_not_add_combinations():
+    names = [c.name for c in get_aci_combinations(load_types={"D", "L"})]
+    assert names == ["1.4D", "1.2D+1.6L", "1.2D+1.0L"]
+    with pytest.raises(ValueError):
+        combine_service_loads([])
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from analysis.fiber import FiberSectionBatch
+from analysis.moment_curvature import calculate_moment_curvature
+from analysis.schedule import build_column
+from analysis.service import WARMUP_SECTION
+from elements.material import StrainHardeningSteel
+
+
+def test_whitney_block_is_rejected():
+    batch = FiberSectionBatch.from_columns([build_column(WARMUP_SECTION)])
+    with pytest.raises(ValueError):
+        calculate_moment_curvature(batch, [0.0])
+
+
+def test_default_column_uses_continuous_concrete():
+    result = build_column(WARMUP_SECTION).get_moment_curvature([0.0, 50000.0])
+
+    assert (np.isfinite(result.moment).sum(axis=-1) > 10).all()
+    assert (result.termination == "crushing").all()
+    assert not result.get_unconverged().any()
+
+
+def test_steel_rupture_ends_the_curve():
+    column = build_column(WARMUP_SECTION)
+    column.rebar_material = StrainHardeningSteel(
+        "Acero", 4200.0, eps_sh=0.004, Eu=0.006
+    )
+    result = column.get_moment_curvature([0.0])
+    assert (result.termination == "rupture").all()
+
+
+def test_non_convergence_is_reported():
+    column = build_column(WARMUP_SECTION)
+    curvatures = np.r_[0.0, np.full(9, 0.01)]
+    with pytest.warns(RuntimeWarning):
+        result = column.get_moment_curvature([0.0], curvatures=curvatures)
+    assert result.get_unconverged().all()
@@ -0,0 +1,23 @@
+import numpy as np
+
+from analysis.project import load_project, save_project
+from analysis.schedule import ColumnSchedule, ScheduleEntry
+from analysis.service import WARMUP_SECTION
+from elements.load import PuntoDeCarga
+
+
+def test_marks_differing_only_in_tie_steel_keep_their_inputs(tmp_path):
+    schedule = ColumnSchedule()
+    loads = [PuntoDeCarga("A", 100.0, 10.0)]
+    schedule.add_entry(ScheduleEntry("C-1", dict(WARMUP_SECTION, fy_tie=2800.0), loads))
+    schedule.add_entry(ScheduleEntry("C-2", dict(WARMUP_SECTION, fy_tie=4200.0), loads))
+    schedule.add_entry(ScheduleEntry("C-3", dict(WARMUP_SECTION, h=70.0), []))
+    schedule.evaluate()
+
+    file_path = save_project(str(tmp_path / "cuadro.dip"), schedule)
+    loaded, _, _ = load_project(file_path)
+
+    assert [e.section for e in loaded.entries] == [e.section for e in schedule.entries]
+    for original, entry in zip(schedule.entries, loaded.entries):
+        np.testing.assert_array_equal(entry.points, original.points)
+        np.testing.assert_array_equal(entry.dcr, original.dcr)
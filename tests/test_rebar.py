@@ -0,0 +1,54 @@
+import numpy as np
+
+from analysis.schedule import build_column
+from elements.column import RectangularColumn
+from elements.rebar import aggregate_layers
+
+SECTION = {
+    "b": 40.0,
+    "h": 60.0,
+    "cover": 4.0,
+    "fc": 280.0,
+    "fy": 4200.0,
+    "rebar_number": "#8",
+    "tie_rebar": "#3",
+    "r2_bars": 3,
+    "r3_bars": 5,
+}
+
+
+def test_aggregate_layers():
+    # Dos barras en paquete y una dentro de la tolerancia forman una sola capa
+    positions = [50.0, 10.0, 10.0, 30.0, 10.005]
+    areas = [5.0, 2.0, 2.0, 3.0, 1.0]
+    levels, level_area, index = aggregate_layers(positions, areas)
+
+    np.testing.assert_allclose(levels, [10.0, 30.0, 50.0])
+    np.testing.assert_allclose(level_area, [5.0, 3.0, 5.0])
+    np.testing.assert_array_equal(index, [2, 0, 0, 1, 0])
+
+
+def test_layout_matches_symmetric_column():
+    column = build_column(SECTION)
+    layout = [(rebar.pos_x, rebar.pos_y, rebar.number) for rebar in column.rebars]
+    explicit = RectangularColumn(
+        b=column.b,
+        h=column.h,
+        cover=column.cover,
+        concrete_material=column.concrete_material,
+        rebar_number=column.rebar_number,
+        r2_bars=column.r2_bars,
+        r3_bars=column.r3_bars,
+        rebar_material=column.rebar_material,
+        tie_rebar=column.tie_rebar,
+        tie_material=column.stirrrup_material,
+        bar_layout=layout,
+    )
+
+    # Capa 1 abajo; cada capa agrupa las barras de un mismo nivel
+    assert explicit.n_layers == column.n_layers == SECTION["r3_bars"]
+    np.testing.assert_allclose(explicit.layer_y, column.layer_y)
+    np.testing.assert_allclose(explicit.layer_area, column.layer_area)
+    assert [len(explicit.get_layer_rebars(k)) for k in (1, 2, 5)] == [3, 2, 3]
+    np.testing.assert_allclose(explicit.points, column.points)
+    assert explicit.phi_pn_max == column.phi_pn_max
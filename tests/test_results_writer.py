@@ -0,0 +1,42 @@
+import os
+
+import numpy as np
+import pytest
+
+from analysis.results_writer import (
+    iter_result_blocks,
+    read_results,
+    write_schedule_results,
+)
+from analysis.schedule import ColumnSchedule, ScheduleEntry
+from analysis.validation import generate_parameter_rows
+from elements.load import PuntoDeCarga
+
+
+@pytest.mark.parametrize("file_format", ["npz", "csv"])
+def test_rows_per_station_in_index_order(tmp_path, file_format):
+    schedule = ColumnSchedule()
+    for i, section in enumerate(generate_parameter_rows(10, seed=4)):
+        loads = [
+            PuntoDeCarga("A", 50.0, 5.0, station="base"),
+            PuntoDeCarga("B", 80.0, 2.0, station="tope"),
+            PuntoDeCarga("C", 20.0, 9.0, station="base"),
+        ]
+        schedule.add_entry(ScheduleEntry(f"C-{i}", section, loads))
+
+    directory = str(tmp_path)
+    rows = write_schedule_results(
+        schedule, directory, chunk_size=3, block_size=4, file_format=file_format
+    )
+    assert rows == 20
+
+    # Las tareas se redondean a bloques completos: 5 archivos de 4 filas
+    assert len(os.listdir(directory)) == 5
+    first = [block["index"][0] for block in iter_result_blocks(directory)]
+    assert first == sorted(first)
+
+    results = read_results(directory)
+    assert list(results["station"][:2]) == ["base", "tope"]
+    assert list(results["governing"][:2]) in (["A", "B"], ["C", "B"])
+    assert len(results["dcr"][0]) == 2 and len(results["dcr"][1]) == 1
+    np.testing.assert_array_equal(results["index"], np.repeat(np.arange(10), 2))
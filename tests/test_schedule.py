@@ -0,0 +1,21 @@
+import numpy as np
+
+from analysis.interaction import evaluate_parameter_rows
+from analysis.schedule import build_column
+from analysis.service import WARMUP_SECTION
+from elements.column import RectangularColumn
+
+
+def test_build_column_reuses_stored_curve(monkeypatch):
+    reference = build_column(WARMUP_SECTION)
+    points, phi_pn_max = evaluate_parameter_rows([WARMUP_SECTION])
+
+    def fail(self):
+        raise AssertionError("El diagrama no debe recalcularse")
+
+    monkeypatch.setattr(RectangularColumn, "calculate_variable_points", fail)
+    column = build_column(WARMUP_SECTION, curve=(points[0], phi_pn_max[0]))
+
+    np.testing.assert_allclose(column.points, reference.points, rtol=1e-9)
+    assert column.phi_pn_max == reference.phi_pn_max
+    assert column.key_points == reference.key_points
@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+import pytest
+
+from analysis.service import (
+    WARMUP_SECTION,
+    EvaluationService,
+    SectionEvaluator,
+    validate_section,
+)
+
+
+def test_validate_section_rejects_invalid_values():
+    validate_section(WARMUP_SECTION)
+    for name, value in (
+        ("rebar_number", "#11"),
+        ("r3_bars", 1),
+        ("r2_bars", 2.5),
+        ("b", 0.0),
+        ("fc", float("nan")),
+    ):
+        with pytest.raises(ValueError):
+            validate_section(dict(WARMUP_SECTION, **{name: value}))
+
+
+def test_invalid_row_only_fails_its_own_request():
+    evaluator = SectionEvaluator()
+
+    async def run():
+        # Se omite la validación para forzar el fallo dentro del lote
+        invalid = dict(WARMUP_SECTION, rebar_number="#11")
+        return await asyncio.gather(
+            evaluator.evaluate([invalid]),
+            evaluator.evaluate([WARMUP_SECTION]),
+            return_exceptions=True,
+        )
+
+    failed, (arrays,) = asyncio.run(run())
+    assert isinstance(failed, Exception)
+    assert arrays["points"].shape[-1] == 3
+    assert evaluator.batches == 1
+
+
+def test_check_rejects_non_finite_loads():
+    service = EvaluationService(SectionEvaluator())
+    section = dict(WARMUP_SECTION, loads=[{"name": "A", "Pu": "NaN", "Mu": 1.0}])
+    body = json.dumps({"sections": [section]}).encode()
+    with pytest.raises(ValueError):
+        asyncio.run(service.route("POST", "/check", body))
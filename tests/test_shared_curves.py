@@ -0,0 +1,41 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from analysis.interaction import evaluate_parameter_rows
+from analysis.shared_curves import (
+    SharedCurveBlock,
+    create_shared_jobs,
+    evaluate_into_shared,
+)
+from analysis.validation import generate_parameter_rows
+
+
+def test_shared_block_round_trip():
+    rows = generate_parameter_rows(6, seed=4)
+    jobs = [(["a", "b"], rows[:2]), (["c", "d", "e", "f"], rows[2:])]
+    block, tasks = create_shared_jobs(jobs)
+    assert [start for _, start, _ in tasks] == [0, 2]
+
+    try:
+        # Un proceso de trabajo abre el bloque, escribe sus filas y lo cierra
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            ranges = [
+                pool.submit(
+                    evaluate_into_shared, block.get_descriptor(), start, task_rows
+                ).result()
+                for _, start, task_rows in tasks
+            ]
+        assert ranges == [(0, 2), (2, 6)]
+
+        # Otra vista abierta en este proceso ve los mismos datos
+        attached = SharedCurveBlock.attach(block.get_descriptor())
+        np.testing.assert_array_equal(attached.points, block.points)
+        attached.close()
+    finally:
+        block.unlink()
+
+    # Los arreglos siguen siendo válidos después de unlink()
+    points, phi_pn_max = evaluate_parameter_rows(rows)
+    np.testing.assert_allclose(block.points, points)
+    np.testing.assert_allclose(block.phi_pn_max, phi_pn_max)
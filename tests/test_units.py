@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from utils.units import UNIT_SYSTEMS, convert_units, get_unit_system
+
+
+def test_si_factors():
+    si = get_unit_system("SI")
+    # 28 MPa = 285.52 kgf/cm², 100 kN = 10197.2 kgf, 10 kN-m = 101972 kgf-cm
+    assert si.to_internal(28.0, "stress") == pytest.approx(285.52, rel=1e-4)
+    assert si.to_internal(100.0, "force") == pytest.approx(10197.16, rel=1e-6)
+    assert si.to_internal(10.0, "moment") == pytest.approx(101971.6, rel=1e-6)
+    assert si.to_internal(500.0, "length") == pytest.approx(50.0)
+
+
+def test_kip_in_factors():
+    kip_in = get_unit_system("kip-in")
+    # 4 ksi = 281.23 kgf/cm², 1 kip = 453.59 kgf, 1 kip-in = 1152.12 kgf-cm
+    assert kip_in.to_internal(4.0, "stress") == pytest.approx(281.23, rel=1e-4)
+    assert kip_in.to_internal(1.0, "force") == pytest.approx(453.592, rel=1e-6)
+    assert kip_in.to_internal(1.0, "moment") == pytest.approx(1152.124, rel=1e-6)
+
+
+@pytest.mark.parametrize("name", UNIT_SYSTEMS)
+def test_round_trip(name):
+    units = get_unit_system(name)
+    values = np.array([0.5, 28.0, 4200.0])
+    for quantity in units.factors:
+        internal = units.to_internal(values, quantity)
+        np.testing.assert_allclose(units.from_internal(internal, quantity), values)
+
+
+def test_convert_units():
+    # 10 Ton = 98.0665 kN; 1 Ton-m = 9.80665 kN-m
+    assert convert_units(10.0, "force", "tonf-m", "SI") == pytest.approx(98.0665)
+    assert convert_units(1.0, "moment", "tonf-m", "SI") == pytest.approx(9.80665)
+    np.testing.assert_allclose(
+        convert_units(
+            convert_units([1.0, 2.5], "force", "kip-in", "SI"), "force", "SI", "kip-in"
+        ),
+        [1.0, 2.5],
+    )
@@ -0,0 +1,37 @@
+from analysis.validation import (
+    TOLERANCE,
+    evaluate_reference,
+    generate_parameter_rows,
+    get_engines,
+    load_golden,
+    main,
+    run_validation,
+    save_golden,
+)
+
+
+def test_golden_round_trip(tmp_path):
+    rows = generate_parameter_rows(30, seed=2)
+    assert rows == generate_parameter_rows(30, seed=2)
+
+    file_path = str(tmp_path / "golden.npz")
+    save_golden(file_path, rows, *evaluate_reference(rows))
+    loaded_rows, points, phi_pn_max = load_golden(file_path)
+    assert loaded_rows == rows
+
+    reports = run_validation(rows, (points, phi_pn_max))
+    assert [report["engine"] for report in reports] == list(get_engines())
+    assert all(report["passed"] for report in reports)
+
+    # Una referencia alterada debe hacer fallar a todos los motores
+    points = points.copy()
+    points[0, 10, 1] *= 1.01
+    reports = run_validation(rows, (points, phi_pn_max))
+    assert not any(report["passed"] for report in reports)
+    assert all(report["errors"]["pn"] > TOLERANCE for report in reports)
+
+
+def test_main_exit_code(tmp_path):
+    file_path = str(tmp_path / "golden.npz")
+    assert main(["--sections", "20", "--golden", file_path, "--update"]) == 0
+    assert main(["--golden", file_path]) == 0
@@ -0,0 +1,122 @@
+import numpy as np
+
+# Unidades internas de cálculo: kgf y cm (esfuerzos en kgf/cm², momentos en
+# kgf-cm). Los factores indican cuántas unidades internas hay en una unidad
+# del sistema.
+#
+# Los sistemas se aplican en el servicio (analysis.service) y al graficar
+# (plot_diagram, calculate_load_points_dcr). En la interfaz gráfica el
+# sistema elegido se usa para ingresar y mostrar cargas y para los gráficos;
+# las cargas se guardan en el sistema por defecto (Ton y Ton-m) y las
+# secciones siempre se ingresan en cm y kg/cm².
+KGF_PER_KN = 1000.0 / 9.80665
+KGF_PER_KIP = 453.59237
+CM_PER_IN = 2.54
+
+QUANTITIES = ("force", "moment", "length", "stress")
+
+
+class UnitSystem:
+    def __init__(self, name: str, factors: dict, labels: dict):
+        """
+        Sistema de unidades de entrada y salida. Las conversiones se hacen
+        una sola vez, escalando arreglos completos, al recibir datos y al
+        presentar resultados; el cálculo trabaja siempre en kgf y cm.
+
+        Args:
+            name (str): Nombre del sistema (ver UNIT_SYSTEMS)
+            factors (dict): Unidades internas por unidad del sistema, para
+                cada magnitud de QUANTITIES
+            labels (dict): Símbolo de cada magnitud
+        """
+        self.name = name
+        self.factors = factors
+        self.labels = labels
+
+        # Escala de los puntos (Mn, Pn, phi) de una curva
+        self.points_scale = np.array([factors["moment"], factors["force"], 1.0])
+
+    def get_label(self, quantity: str):
+        return self.labels[quantity]
+
+    def to_internal(self, values, quantity: str):
+        return np.asarray(values, dtype=float) * self.factors[quantity]
+
+    def from_internal(self, values, quantity: str):
+        return np.asarray(values, dtype=float) / self.factors[quantity]
+
+    def points_from_internal(self, points):
+        """Convierte curvas (..., n_puntos, 3) de kgf-cm a este sistema."""
+        return np.asarray(points, dtype=float) / self.points_scale
+
+    def values_to_internal(self, values: dict, quantities: dict):
+        """
+        Convierte los valores de un diccionario según la magnitud indicada
+        en 'quantities' (p. ej. {"b": "length", "fc": "stress"}). Las claves
+        sin magnitud se copian sin cambios.
+        """
+        converted = dict(values)
+        for name, quantity in quantities.items():
+            if name in converted:
+                converted[name] = float(converted[name]) * self.factors[quantity]
+        return converted
+
+
+UNIT_SYSTEMS = {
+    # Unidades internas
+    "kgf-cm": UnitSystem(
+        "kgf-cm",
+        {"force": 1.0, "moment": 1.0, "length": 1.0, "stress": 1.0},
+        {"force": "kgf", "moment": "kgf-cm", "length": "cm", "stress": "kgf/cm²"},
+    ),
+    # Convención de la aplicación: secciones en cm y kg/cm², cargas en Ton y Ton-m
+    "tonf-m": UnitSystem(
+        "tonf-m",
+        {"force": 1000.0, "moment": 100000.0, "length": 1.0, "stress": 1.0},
+        {"force": "Ton", "moment": "Ton-m", "length": "cm", "stress": "kg/cm²"},
+    ),
+    # Sistema internacional: secciones en mm y MPa, cargas en kN y kN-m
+    "SI": UnitSystem(
+        "SI",
+        {
+            "force": KGF_PER_KN,
+            "moment": KGF_PER_KN * 100.0,
+            "length": 0.1,
+            # 1 MPa = 1000 kN/m² = 1000 / 10⁴ kN/cm²
+            "stress": KGF_PER_KN / 10.0,
+        },
+        {"force": "kN", "moment": "kN-m", "length": "mm", "stress": "MPa"},
+    ),
+    # Sistema inglés: secciones en in y ksi, cargas en kip y kip-in
+    "kip-in": UnitSystem(
+        "kip-in",
+        {
+            "force": KGF_PER_KIP,
+            "moment": KGF_PER_KIP * CM_PER_IN,
+            "length": CM_PER_IN,
+            "stress": KGF_PER_KIP / CM_PER_IN**2,
+        },
+        {"force": "kip", "moment": "kip-in", "length": "in", "stress": "ksi"},
+    ),
+}
+
+DEFAULT_UNITS = "tonf-m"
+
+
+def get_unit_system(units=None):
+    """Devuelve el UnitSystem indicado por nombre (o el mismo objeto)."""
+    if isinstance(units, UnitSystem):
+        return units
+    name = DEFAULT_UNITS if units is None else units
+    if name not in UNIT_SYSTEMS:
+        raise ValueError(
+            f"Sistema de unidades desconocido: {name}. "
+            f"Opciones: {', '.join(UNIT_SYSTEMS)}"
+        )
+    return UNIT_SYSTEMS[name]
+
+
+def convert_units(values, quantity: str, source, target):
+    """Convierte valores de 'quantity' del sistema 'source' al sistema 'target'."""
+    internal = get_unit_system(source).to_internal(values, quantity)
+    return get_unit_system(target).from_internal(internal, quantity)
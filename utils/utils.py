@@ -1,3 +1,4 @@
+import numpy as np
 
 
 def get_beta(fc):
@@ -9,3 +10,16 @@ def get_beta(fc):
         beta = 0.65
     return beta
 
+
+
+def get_beta_array(fc):
+    """
+    Versión vectorizada de get_beta. Devuelve (beta, dbeta/dfc) para un
+    arreglo de valores de f'c.
+    """
+    fc = np.asarray(fc, dtype=float)
+    transition = (fc > 280) & (fc < 550)
+    beta = np.where(fc <= 280, 0.85, 0.65)
+    beta = np.where(transition, 0.85 - 0.005 * (fc - 280) / 70, beta)
+    dbeta = np.where(transition, -0.005 / 70, 0.0)
+    return beta, dbeta